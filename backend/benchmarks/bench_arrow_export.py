@@ -0,0 +1,82 @@
+"""Time Parquet and Arrow IPC exports of the tickets table.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_arrow_export --rows 1000000
+"""
+
+import argparse
+import asyncio
+import tempfile
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from benchmarks.common import print_table
+from benchmarks.common import sample_ticket
+from benchmarks.common import stopwatch
+from benchmarks.common import use_temp_database
+
+
+async def run(rows: int, batch_size: int) -> None:
+    use_temp_database("arrow-export")
+
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import init_db
+    from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+    from ticket_assistant.services.arrow_export import stream_arrow_ipc
+    from ticket_assistant.services.arrow_export import write_parquet
+
+    await init_db()
+    start = datetime(2025, 1, 1)
+    with stopwatch() as seeding:
+        async with AsyncSessionLocal() as session:
+            repo = TicketRepository(session)
+            for offset in range(0, rows, 50_000):
+                await repo.bulk_create_tickets(
+                    [
+                        {
+                            **sample_ticket(i),
+                            "id": str(uuid4()),
+                            "status": "open",
+                            "created_at": start + timedelta(seconds=i),
+                            "updated_at": start + timedelta(seconds=i),
+                        }
+                        for i in range(offset, min(offset + 50_000, rows))
+                    ],
+                    chunk_size=5_000,
+                )
+
+    output = Path(tempfile.mkdtemp(prefix="ticket-arrow-")) / "tickets.parquet"
+    with stopwatch() as parquet:
+        written, _ = await write_parquet(AsyncSessionLocal, "tickets", output, batch_size=batch_size)
+
+    with stopwatch() as arrow:
+        streamed = 0
+        async for chunk in stream_arrow_ipc(AsyncSessionLocal, "tickets", batch_size=batch_size):
+            streamed += len(chunk)
+
+    await close_db()
+
+    print_table(
+        f"Tickets export, {rows} rows (seeded in {seeding['elapsed']:.1f}s, batch size {batch_size})",
+        ["format", "seconds", "rows/s", "size"],
+        [
+            ["parquet", f"{parquet['elapsed']:.2f}", f"{written / parquet['elapsed']:.0f}", output.stat().st_size],
+            ["arrow ipc", f"{arrow['elapsed']:.2f}", f"{rows / arrow['elapsed']:.0f}", streamed],
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Compare bulk ticket ingestion against one POST per ticket.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_bulk_ingest --count 2000 --chunk-size 500
+"""
+
+import argparse
+import asyncio
+
+from benchmarks.common import asgi_client
+from benchmarks.common import print_table
+from benchmarks.common import sample_ticket
+from benchmarks.common import stopwatch
+from benchmarks.common import use_temp_database
+
+
+async def run(count: int, chunk_size: int) -> None:
+    use_temp_database("bulk-ingest")
+
+    from ticket_assistant.api import tickets
+    from ticket_assistant.api.main import app
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import init_db
+
+    tickets.BULK_CHUNK_SIZE = chunk_size
+    await init_db()
+    payloads = [sample_ticket(i) for i in range(count)]
+
+    async with asgi_client(app) as client:
+        with stopwatch() as single:
+            for payload in payloads:
+                response = await client.post("/api/tickets", json=payload)
+                response.raise_for_status()
+
+        with stopwatch() as bulk:
+            response = await client.post("/api/tickets/bulk", json=payloads)
+            response.raise_for_status()
+            assert response.json()["created"] == count
+
+    await close_db()
+
+    print_table(
+        f"Ticket ingestion, {count} tickets (chunk size {chunk_size})",
+        ["mode", "seconds", "rows/s"],
+        [
+            ["single POST", f"{single['elapsed']:.2f}", f"{count / single['elapsed']:.0f}"],
+            ["bulk POST", f"{bulk['elapsed']:.2f}", f"{count / bulk['elapsed']:.0f}"],
+        ],
+    )
+    print(f"speedup: {single['elapsed'] / bulk['elapsed']:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(run(args.count, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
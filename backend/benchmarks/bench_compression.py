@@ -0,0 +1,114 @@
+"""Measure bandwidth vs CPU of response compression on list and export responses.
+
+Requests ``GET /api/tickets?per_page=100`` and a streamed NDJSON export with
+``Accept-Encoding`` set to each available encoding (and identity), and reports
+bytes on the wire, CPU per request and the estimated response time over a link
+of ``--mbps`` megabits per second (CPU + transfer).
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_compression --export-rows 10000 --repeat 50 --mbps 20
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from datetime import timedelta
+from uuid import uuid4
+
+from benchmarks.common import asgi_client
+from benchmarks.common import print_table
+from benchmarks.common import sample_ticket
+from benchmarks.common import use_temp_database
+
+PER_PAGE = 100
+
+
+async def _measure(client, url: str, encoding: str, repeat: int) -> tuple[int, float]:
+    """Wire bytes of one response and mean CPU ms per request."""
+    headers = {"Accept-Encoding": encoding}
+    await client.get(url, headers=headers)  # warm up
+    size = 0
+    cpu_start = time.process_time()
+    for _ in range(repeat):
+        async with client.stream("GET", url, headers=headers) as response:
+            size = sum([len(chunk) async for chunk in response.aiter_raw()])
+            served = response.headers.get("content-encoding", "identity")
+    cpu_ms = (time.process_time() - cpu_start) / repeat * 1000
+    assert served == encoding, f"{url} was served as {served}, not {encoding}"
+    return size, cpu_ms
+
+
+async def run(export_rows: int, repeat: int, mbps: float) -> None:
+    use_temp_database("compression")
+
+    from ticket_assistant.api.compression import ENCODERS
+    from ticket_assistant.api.main import app
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import init_db
+    from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+
+    await init_db()
+    start = datetime(2025, 1, 1)
+    async with AsyncSessionLocal() as session:
+        rows = [
+            {
+                **sample_ticket(i),
+                "id": str(uuid4()),
+                "status": "open",
+                "created_at": start + timedelta(seconds=i),
+                "updated_at": start + timedelta(seconds=i),
+            }
+            for i in range(export_rows)
+        ]
+        await TicketRepository(session).bulk_create_tickets(
+            rows, keywords={row["id"]: ["checkout", "timeout"] for row in rows}
+        )
+
+    encodings = ["identity", *sorted(ENCODERS, key=["gzip", "br", "zstd"].index)]
+    targets = [
+        (f"GET /api/tickets?per_page={PER_PAGE}", f"/api/tickets?per_page={PER_PAGE}", repeat),
+        (f"export, {export_rows} rows NDJSON", "/api/tickets/export", max(1, repeat // 10)),
+    ]
+
+    table = []
+    async with asgi_client(app) as client:
+        for label, url, times in targets:
+            identity_size = None
+            for encoding in encodings:
+                size, cpu_ms = await _measure(client, url, encoding, times)
+                identity_size = identity_size or size
+                transfer_ms = size * 8 / (mbps * 1_000_000) * 1000
+                table.append(
+                    [
+                        label,
+                        encoding,
+                        f"{size:,}",
+                        f"{identity_size / size:.1f}x",
+                        f"{cpu_ms:.2f}",
+                        f"{cpu_ms + transfer_ms:.1f}",
+                    ]
+                )
+
+    await close_db()
+
+    print_table(
+        f"Response compression (CPU ms per request, transfer at {mbps:g} Mbit/s)",
+        ["response", "encoding", "wire bytes", "ratio", "cpu ms", f"cpu + transfer ms @ {mbps:g} Mbit/s"],
+        table,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--export-rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--mbps", type=float, default=20.0, help="Link speed used to estimate transfer time")
+    args = parser.parse_args()
+    asyncio.run(run(args.export_rows, args.repeat, args.mbps))
+
+
+if __name__ == "__main__":
+    main()
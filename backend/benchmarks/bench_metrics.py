@@ -0,0 +1,146 @@
+"""Measure the overhead of Prometheus instrumentation on request handling.
+
+Runs the same request mix (ticket list, single ticket, dashboard stats, ticket
+create) in child processes with ``METRICS_ENABLED`` on and off, alternating the
+two for ``--rounds`` rounds so drift affects both alike, and compares median
+CPU per request. It also times the instrumentation work of one request on its
+own: the request histogram and counter plus one histogram sample per SQL
+statement. The target is under 2% overhead.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_metrics --requests 2000 --rounds 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+from benchmarks.common import asgi_client
+from benchmarks.common import print_table
+from benchmarks.common import sample_ticket
+from benchmarks.common import use_temp_database
+
+
+async def _child(requests: int) -> None:
+    """Serve the request mix in this process and print CPU ms per request and statements per request."""
+    use_temp_database("metrics")
+    import logging
+
+    logging.disable(logging.INFO)
+
+    from sqlalchemy import event
+
+    from ticket_assistant.api.main import app
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import engine
+    from ticket_assistant.database.connection import init_db
+
+    await init_db()
+    statements = 0
+
+    def count_statement(*args):  # noqa: ARG001
+        nonlocal statements
+        statements += 1
+
+    async with asgi_client(app) as client:
+        ids = [(await client.post("/api/tickets", json=sample_ticket(i))).json()["id"] for i in range(200)]
+        event.listen(engine.sync_engine, "after_cursor_execute", count_statement)
+
+        cpu_start = time.process_time()
+        for i in range(requests):
+            step = i % 4
+            if step == 0:
+                response = await client.get("/api/tickets", params={"per_page": 20})
+            elif step == 1:
+                response = await client.get(f"/api/tickets/{ids[i % len(ids)]}")
+            elif step == 2:
+                response = await client.get("/api/dashboard/stats")
+            else:
+                response = await client.post("/api/tickets", json=sample_ticket(i))
+            assert response.status_code == 200
+        cpu_ms = (time.process_time() - cpu_start) / requests * 1000
+
+    await close_db()
+    print(json.dumps({"cpu_ms": cpu_ms, "statements": statements / requests}))
+
+
+def _run_child(requests: int, enabled: bool) -> dict:
+    env = {**os.environ, "METRICS_ENABLED": "true" if enabled else "false"}
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_metrics", "--child", "--requests", str(requests)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def _instrumentation_us(statements: float) -> float:
+    """CPU microseconds of the metric updates one request makes."""
+    from ticket_assistant.core.metrics import DB_QUERY_DURATION
+    from ticket_assistant.core.metrics import HTTP_REQUEST_DURATION
+    from ticket_assistant.core.metrics import HTTP_REQUESTS
+    from ticket_assistant.core.metrics import statement_type
+
+    def one_request():
+        HTTP_REQUEST_DURATION.labels("GET", "/api/tickets").observe(0.003)
+        HTTP_REQUESTS.labels("GET", "/api/tickets", "200").inc()
+        DB_QUERY_DURATION.labels(statement_type("SELECT tickets.id FROM tickets")).observe(0.0002)
+
+    number = 20000
+    per_request = timeit.timeit(one_request, number=number) / number
+    per_statement = (
+        timeit.timeit(lambda: DB_QUERY_DURATION.labels(statement_type("SELECT 1")).observe(0.0002), number=number)
+        / number
+    )
+    return (per_request + per_statement * (statements - 1)) * 1_000_000
+
+
+def run(requests: int, rounds: int) -> None:
+    results: dict[bool, list[dict]] = {True: [], False: []}
+    for _ in range(rounds):
+        for enabled in (False, True):
+            results[enabled].append(_run_child(requests, enabled))
+
+    off = statistics.median(result["cpu_ms"] for result in results[False])
+    on = statistics.median(result["cpu_ms"] for result in results[True])
+    statements = results[True][0]["statements"]
+    instrumentation_ms = _instrumentation_us(statements) / 1000
+
+    print_table(
+        f"Request mix, {requests} requests x {rounds} rounds (median CPU ms per request)",
+        ["metrics", "cpu ms / request", "overhead"],
+        [
+            ["disabled", f"{off:.3f}", ""],
+            ["enabled", f"{on:.3f}", f"{(on - off) / off:+.1%}"],
+            [
+                f"metric updates alone ({statements:.1f} SQL statements / request)",
+                f"{instrumentation_ms:.4f}",
+                f"{instrumentation_ms / off:.2%}",
+            ],
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(_child(args.requests))
+    else:
+        run(args.requests, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Count downstream requests for an incident flood of reports, with and without batching.
+
+Reports are sent ``--concurrency`` at a time through ``ReportService.send_report`` to a
+local stand-in ticket API that counts the requests it receives.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_report_batching --count 5000 --concurrency 200 --max-items 50 --max-wait-ms 20
+"""
+
+import argparse
+import asyncio
+
+from benchmarks.common import print_table
+from benchmarks.common import stopwatch
+from benchmarks.fake_ticket_api import FakeTicketAPI
+from benchmarks.fake_ticket_api import serve
+
+
+async def flood(service, report, count: int, concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send_one():
+        async with semaphore:
+            return await service.send_report(report)
+
+    results = await asyncio.gather(*(send_one() for _ in range(count)))
+    return sum(result.success for result in results)
+
+
+async def run(count: int, concurrency: int, max_items: int, max_wait: float, latency: float) -> None:
+    from ticket_assistant.core.models import ReportRequest
+    from ticket_assistant.services.http_client import create_http_client
+    from ticket_assistant.services.report_service import ReportService
+
+    report = ReportRequest(
+        name="Checkout timeout",
+        keywords=["checkout", "timeout"],
+        description="Checkout requests intermittently fail with a gateway timeout under load",
+    )
+    modes = [
+        ("single posts", False, True),
+        ("batched", True, True),
+        ("batched, no batch endpoint", True, False),
+    ]
+    rows = []
+    for label, batching, supports_batch in modes:
+        fake_api = FakeTicketAPI(latency=latency, supports_batch=supports_batch)
+        with serve(fake_api) as base_url:
+            client = create_http_client()
+            service = ReportService(
+                api_endpoint=f"{base_url}/tickets",
+                client=client,
+                batch_endpoint=f"{base_url}/tickets/batch" if batching else None,
+                batch_max_items=max_items,
+                batch_max_wait=max_wait,
+            )
+            try:
+                with stopwatch() as timing:
+                    ok = await flood(service, report, count, concurrency)
+            finally:
+                await service.aclose()
+                await client.aclose()
+        rows.append(
+            [
+                label,
+                ok,
+                fake_api.requests,
+                f"{fake_api.items / max(fake_api.requests, 1):.1f}",
+                f"{count / timing['elapsed']:.0f}",
+            ]
+        )
+
+    print_table(
+        f"{count} reports, {concurrency} in flight, batches of up to {max_items} or {max_wait * 1000:.0f} ms",
+        ["mode", "ok", "downstream requests", "reports/request", "reports/s"],
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--max-items", type=int, default=50)
+    parser.add_argument("--max-wait-ms", type=float, default=20.0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the stand-in API waits per request")
+    args = parser.parse_args()
+    asyncio.run(run(args.count, args.concurrency, args.max_items, args.max_wait_ms / 1000, args.latency))
+
+
+if __name__ == "__main__":
+    main()
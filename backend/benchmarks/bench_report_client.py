@@ -0,0 +1,76 @@
+"""Compare ReportService throughput with a client per report vs the shared pooled client.
+
+Reports are sent to a local stand-in ticket API, so the numbers isolate
+connection setup; against a real HTTPS endpoint the TLS handshake widens the gap.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_report_client --count 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+
+from benchmarks.common import print_table
+from benchmarks.common import stopwatch
+from benchmarks.fake_ticket_api import FakeTicketAPI
+from benchmarks.fake_ticket_api import serve
+
+
+async def send_all(service, report, count: int, concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def send_one():
+        async with semaphore:
+            return await service.send_report(report)
+
+    results = await asyncio.gather(*(send_one() for _ in range(count)))
+    return sum(result.success for result in results)
+
+
+async def run(count: int, concurrency: int, latency: float) -> None:
+    from ticket_assistant.core.models import ReportRequest
+    from ticket_assistant.services.http_client import create_http_client
+    from ticket_assistant.services.report_service import ReportService
+
+    report = ReportRequest(
+        name="Checkout timeout",
+        keywords=["checkout", "timeout"],
+        description="Checkout requests intermittently fail with a gateway timeout under load",
+        error_message="504 Gateway Timeout",
+    )
+    fake_api = FakeTicketAPI(latency=latency)
+    rows = []
+    with serve(fake_api) as base_url:
+        endpoint = f"{base_url}/tickets"
+
+        with stopwatch() as unpooled:
+            ok = await send_all(ReportService(api_endpoint=endpoint), report, count, concurrency)
+        rows.append(["client per report", ok, f"{unpooled['elapsed']:.2f}", f"{count / unpooled['elapsed']:.0f}"])
+
+        client = create_http_client()
+        try:
+            with stopwatch() as pooled:
+                ok = await send_all(ReportService(api_endpoint=endpoint, client=client), report, count, concurrency)
+        finally:
+            await client.aclose()
+        rows.append(["pooled client", ok, f"{pooled['elapsed']:.2f}", f"{count / pooled['elapsed']:.0f}"])
+
+    print_table(
+        f"ReportService.send_report, {count} reports, concurrency {concurrency}, api latency {latency * 1000:.0f} ms",
+        ["mode", "ok", "seconds", "reports/s"],
+        rows,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the stand-in API waits per request")
+    args = parser.parse_args()
+    asyncio.run(run(args.count, args.concurrency, args.latency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+"""Time every repository and API read query against a database seeded at production scale.
+
+Bulk-loads ``--tickets`` tickets with ``ticket_assistant.database.scale_seed``
+into a throwaway SQLite database (or into ``--database-url``), then runs each
+query ``--repeat`` times. The report lists the first (cold) and median time,
+the statements each query issued and their plans, flagging full table scans.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_scale --tickets 1000000
+    python -m benchmarks.bench_scale --database-url sqlite+aiosqlite:///./scale.db --tickets 5000000
+    python -m benchmarks.bench_scale --database-url sqlite+aiosqlite:///./scale.db --tickets 0  # reuse
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import statistics
+import sys
+from collections.abc import Awaitable
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import asgi_client
+from benchmarks.common import print_table
+from benchmarks.common import stopwatch
+from benchmarks.common import use_temp_database
+
+# Lines of an EXPLAIN (QUERY PLAN) that read a whole table: SQLite and PostgreSQL
+FULL_SCAN = re.compile(r"^\s*SCAN (\w+)\s*$|Seq Scan on (\w+)", re.MULTILINE)
+# ... and that sort rows without an index to read them in order
+SORT = re.compile(r"USE TEMP B-TREE FOR ORDER BY|^\s*(?:->\s*)?Sort\b", re.MULTILINE)
+EXPLAINABLE = ("SELECT", "WITH")
+
+
+class StatementCapture:
+    """Record the statements run on an engine, with their plans, while ``active``."""
+
+    def __init__(self):
+        self.active = False
+        self.statements: list[dict[str, Any]] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):  # noqa: ARG002
+        from ticket_assistant.database.query_diagnostics import _explain
+
+        if not self.active:
+            return
+        plan = None
+        if not executemany and statement.lstrip().upper().startswith(EXPLAINABLE):
+            plan = _explain(conn, statement, parameters)
+        self.statements.append({"statement": " ".join(statement.split()), "plan": plan})
+
+
+def full_scans(statements: list[dict[str, Any]]) -> list[str]:
+    """Tables read in full by any of ``statements``."""
+    tables = set()
+    for entry in statements:
+        for sqlite_table, postgres_table in FULL_SCAN.findall(entry["plan"] or ""):
+            tables.add(sqlite_table or postgres_table)
+    return sorted(tables)
+
+
+async def _sample_ids(session) -> dict[str, Any]:
+    """A ticket and classification from the middle of the data, 100 ticket ids and the rarest keyword."""
+    from sqlalchemy import func
+    from sqlalchemy import select
+
+    from ticket_assistant.database.models import Classification
+    from ticket_assistant.database.models import KeywordCount
+    from ticket_assistant.database.models import Ticket
+
+    total = (await session.execute(select(func.count()).select_from(Classification))).scalar()
+    classification = (
+        await session.execute(
+            select(Classification.id, Classification.ticket_id).order_by(Classification.id).offset(total // 2).limit(1)
+        )
+    ).first()
+    ticket_ids = (await session.execute(select(Ticket.id).order_by(Ticket.id).limit(100))).scalars().all()
+    rare_keyword = (
+        await session.execute(select(KeywordCount.keyword).order_by(KeywordCount.ticket_count).limit(1))
+    ).scalar()
+    assignee = (await session.execute(select(Ticket.assignee).where(Ticket.assignee.is_not(None)).limit(1))).scalar()
+    return {
+        "ticket_id": classification.ticket_id,
+        "classification_id": classification.id,
+        "ticket_ids": list(ticket_ids),
+        "rare_keyword": rare_keyword,
+        "assignee": assignee,
+    }
+
+
+def repository_cases(ids: dict[str, Any]) -> dict[str, Callable[[Any], Awaitable[Any]]]:
+    """Read queries of the repositories and services, each taking a session."""
+    from ticket_assistant.database.database_service import DatabaseDashboardService
+    from ticket_assistant.database.repositories.classification_job_repository import ClassificationJobRepository
+    from ticket_assistant.database.repositories.outbox_repository import OutboxRepository
+    from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+    from ticket_assistant.database.search import search_tickets
+    from ticket_assistant.database.versions import VERSIONED_TABLES
+    from ticket_assistant.database.versions import get_table_versions
+
+    now = datetime.utcnow()
+
+    async def first_stream_batch(session):
+        async for rows in TicketRepository(session).stream_ticket_rows(batch_size=1000):
+            return rows
+
+    return {
+        "get_total_count": lambda s: TicketRepository(s).get_total_count(),
+        "get_count_by_status(open)": lambda s: TicketRepository(s).get_count_by_status("open"),
+        "get_open_tickets_count": lambda s: TicketRepository(s).get_open_tickets_count(),
+        "get_resolved_tickets_count": lambda s: TicketRepository(s).get_resolved_tickets_count(),
+        "get_department_distribution": lambda s: TicketRepository(s).get_department_distribution(),
+        "get_severity_distribution": lambda s: TicketRepository(s).get_severity_distribution(),
+        "get_average_resolution_time": lambda s: TicketRepository(s).get_average_resolution_time(),
+        "get_tickets_by_date_range(1 day)": lambda s: TicketRepository(s).get_tickets_by_date_range(
+            now - timedelta(days=1), now
+        ),
+        "get_ticket_by_id": lambda s: TicketRepository(s).get_ticket_by_id(ids["ticket_id"]),
+        "get_ticket_keywords": lambda s: TicketRepository(s).get_ticket_keywords(ids["ticket_id"]),
+        "get_keywords_for_tickets(100)": lambda s: TicketRepository(s).get_keywords_for_tickets(ids["ticket_ids"]),
+        "get_top_keywords": lambda s: TicketRepository(s).get_top_keywords(),
+        "stream_ticket_rows(first 1000)": first_stream_batch,
+        "search_tickets(common term)": lambda s: search_tickets(s, "payment gateway"),
+        "search_tickets(rare term)": lambda s: search_tickets(s, ids["rare_keyword"]),
+        "get_job_for_ticket": lambda s: ClassificationJobRepository(s).get_job_for_ticket(ids["ticket_id"]),
+        "classification job get_status_counts": lambda s: ClassificationJobRepository(s).get_status_counts(),
+        "outbox get_status_counts": lambda s: OutboxRepository(s).get_status_counts(),
+        "get_table_versions": lambda s: get_table_versions(s, VERSIONED_TABLES),
+        "get_dashboard_stats": lambda s: DatabaseDashboardService(TicketRepository(s)).get_dashboard_stats(),
+    }
+
+
+def api_cases(ids: dict[str, Any]) -> list[str]:
+    """GET requests covering every read endpoint, with filters and paging that hit different query shapes."""
+    ticket_id = ids["ticket_id"]
+    since = (datetime.utcnow() - timedelta(days=1)).isoformat()
+    return [
+        "/api/tickets?per_page=20",
+        "/api/tickets?per_page=20&page=5000",
+        "/api/tickets?department=database&severity=critical",
+        f"/api/tickets?status=open&assignee={ids['assignee']}",
+        "/api/tickets?keyword=timeout",
+        f"/api/tickets?keyword=timeout,{ids['rare_keyword']}&keyword_mode=any",
+        "/api/tickets?per_page=100&fields=id,name,status",
+        f"/api/tickets/{ticket_id}",
+        f"/api/tickets/{ticket_id}/classifications",
+        "/api/tickets/search?q=payment",
+        f"/api/tickets/export?department=security&severity=critical&keyword={ids['rare_keyword']}",
+        "/api/classifications",
+        f"/api/classifications?ticket_id={ticket_id}",
+        f"/api/classifications/{ids['classification_id']}",
+        f"/api/classifications/by-ticket/{ticket_id}",
+        "/api/dashboard/stats",
+        "/api/dashboard/keywords",
+        "/api/dashboard/stats/real-time",
+        "/api/dashboard/stats/trends?days=30",
+        f"/api/exports/arrow?table=tickets&since={since}",
+    ]
+
+
+async def _measure(run: Callable[[], Awaitable[Any]], capture: StatementCapture, repeat: int) -> dict[str, Any]:
+    timings = []
+    for _ in range(repeat):
+        with stopwatch() as timing:
+            await run()
+        timings.append(timing["elapsed"] * 1000)
+    # One more pass collecting statements and plans; EXPLAIN adds time, so it is not timed
+    capture.statements = []
+    capture.active = True
+    try:
+        await run()
+    finally:
+        capture.active = False
+    statements = capture.statements
+    return {
+        "first_ms": round(timings[0], 2),
+        "median_ms": round(statistics.median(timings), 2),
+        "max_ms": round(max(timings), 2),
+        "statements": len(statements),
+        "full_scans": full_scans(statements),
+        "sorts": sum(bool(SORT.search(entry["plan"] or "")) for entry in statements),
+        "plans": statements,
+    }
+
+
+def _markdown(meta: dict[str, Any], results: list[dict[str, Any]]) -> str:
+    lines = [
+        f"# Scale benchmark: {meta['tickets']:,} tickets ({meta['dialect']})",
+        "",
+        f"{meta['classifications']:,} classifications, {meta['ticket_keywords']:,} ticket keywords; "
+        f"median of {meta['repeat']} runs after a cold first run.",
+        "",
+        "| kind | query | statements | first ms | median ms | max ms | full scans | sorts |",
+        "| --- | --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for r in results:
+        lines.append(
+            f"| {r['kind']} | `{r['query']}` | {r['statements']} | {r['first_ms']} | {r['median_ms']} "
+            f"| {r['max_ms']} | {', '.join(r['full_scans'])} | {r['sorts']} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.database_url:
+        os.environ["DATABASE_URL"] = args.database_url
+    else:
+        use_temp_database("scale")
+    # Plans are collected by the benchmark; keep the slow-query log quiet
+    os.environ.setdefault("QUERY_DIAGNOSTICS", "off")
+
+    from sqlalchemy import event
+    from sqlalchemy import func
+    from sqlalchemy import select
+
+    from ticket_assistant.api.main import app
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import engine
+    from ticket_assistant.database.connection import init_db
+    from ticket_assistant.database.models import Classification
+    from ticket_assistant.database.models import Ticket
+    from ticket_assistant.database.models import TicketKeyword
+    from ticket_assistant.database.scale_seed import seed_scale_data
+
+    seeding = None
+    if args.tickets:
+        print(f"Seeding {args.tickets:,} tickets...")
+        seeding = await seed_scale_data(args.tickets, batch_size=args.batch_size, seed=args.seed, workers=args.workers)
+        print(json.dumps(seeding, indent=2))
+    else:
+        await init_db()
+
+    # Per-request info logs would be timed too
+    for name in ("ticket_assistant", "httpx"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    capture = StatementCapture()
+    event.listen(engine.sync_engine, "after_cursor_execute", capture)
+
+    async with AsyncSessionLocal() as session:
+        counts = {}
+        for model in (Ticket, Classification, TicketKeyword):
+            counts[model.__tablename__] = (await session.execute(select(func.count()).select_from(model))).scalar()
+        if not counts["tickets"]:
+            sys.exit("The database has no tickets; seed it with --tickets")
+        ids = await _sample_ids(session)
+
+    results = []
+    for name, query in repository_cases(ids).items():
+
+        async def run_query(query=query):
+            async with AsyncSessionLocal() as session:
+                return await query(session)
+
+        print(f"  {name}")
+        results.append({"kind": "repository", "query": name, **await _measure(run_query, capture, args.repeat)})
+
+    async with asgi_client(app) as client:
+        for url in api_cases(ids):
+
+            async def get(url=url):
+                response = await client.get(url)
+                if response.status_code != 200:
+                    raise RuntimeError(f"GET {url} returned {response.status_code}: {response.text[:200]}")
+                return response
+
+            print(f"  GET {url}")
+            results.append({"kind": "api", "query": f"GET {url}", **await _measure(get, capture, args.repeat)})
+
+    await close_db()
+
+    meta = {
+        "tickets": counts["tickets"],
+        "classifications": counts["classifications"],
+        "ticket_keywords": counts["ticket_keywords"],
+        "dialect": engine.dialect.name,
+        "repeat": args.repeat,
+        "seeding": seeding,
+        "at": datetime.utcnow().isoformat(),
+    }
+    Path(args.output).write_text(json.dumps({"meta": meta, "results": results}, indent=2))
+    Path(args.markdown).write_text(_markdown(meta, results))
+
+    print_table(
+        f"Queries on {counts['tickets']:,} tickets (median of {args.repeat}, ms)",
+        ["kind", "query", "stmts", "first", "median", "max", "full scans", "sorts"],
+        [
+            [
+                r["kind"],
+                r["query"],
+                r["statements"],
+                r["first_ms"],
+                r["median_ms"],
+                r["max_ms"],
+                ",".join(r["full_scans"]),
+                r["sorts"],
+            ]
+            for r in sorted(results, key=lambda r: r["median_ms"], reverse=True)
+        ],
+    )
+    print(f"\nReport written to {args.output} and {args.markdown}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tickets", type=int, default=1_000_000, help="Tickets to add before measuring (0: reuse)")
+    parser.add_argument("--database-url", help="Database to seed and measure instead of a throwaway SQLite file")
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, help="Generator processes for seeding")
+    parser.add_argument("--seed", type=int, default=42, help="Use another seed to add rows to a seeded database")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="scale-report.json")
+    parser.add_argument("--markdown", default="scale-report.md")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
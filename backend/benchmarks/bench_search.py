@@ -0,0 +1,151 @@
+"""Compare full-text search against a ``LIKE '%term%'`` scan of the tickets table.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_search --rows 1000000
+"""
+
+import argparse
+import asyncio
+import random
+from datetime import datetime
+from datetime import timedelta
+from uuid import uuid4
+
+from benchmarks.common import print_table
+from benchmarks.common import sample_ticket
+from benchmarks.common import stopwatch
+from benchmarks.common import use_temp_database
+
+VOCABULARY = [
+    "timeout",
+    "gateway",
+    "checkout",
+    "payment",
+    "login",
+    "session",
+    "token",
+    "cache",
+    "redis",
+    "postgres",
+    "deadlock",
+    "index",
+    "memory",
+    "leak",
+    "crash",
+    "render",
+    "layout",
+    "mobile",
+    "upload",
+    "image",
+    "queue",
+    "worker",
+    "retry",
+    "certificate",
+    "expired",
+    "dns",
+    "proxy",
+    "latency",
+    "throughput",
+    "migration",
+    "schema",
+    "rollback",
+    "deploy",
+    "container",
+    "kubernetes",
+    "pod",
+]
+
+# One rare error code, one mid-frequency service name, a common word pair, and a prefix
+QUERIES = ["E4242", "svc123 timeout", "checkout payment", "kube"]
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choices(VOCABULARY, k=words))
+
+
+def _error_message(rng: random.Random, rows: int) -> str:
+    return f"E{rng.randrange(max(rows // 10, 1))} in svc{rng.randrange(1000)}: {_text(rng, 6)}"
+
+
+async def run(rows: int, repeat: int) -> None:
+    use_temp_database("search")
+
+    from sqlalchemy import or_
+    from sqlalchemy import select
+
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import init_db
+    from ticket_assistant.database.models import Ticket
+    from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+    from ticket_assistant.database.search import search_tickets
+
+    await init_db()
+    rng = random.Random(42)  # noqa: S311
+    start = datetime(2025, 1, 1)
+    with stopwatch() as seeding:
+        async with AsyncSessionLocal() as session:
+            repo = TicketRepository(session)
+            for offset in range(0, rows, 50_000):
+                await repo.bulk_create_tickets(
+                    [
+                        {
+                            **sample_ticket(i),
+                            "id": str(uuid4()),
+                            "name": _text(rng, 4),
+                            "description": _text(rng, 30),
+                            "error_message": _error_message(rng, rows),
+                            "status": "open",
+                            "created_at": start + timedelta(seconds=i),
+                            "updated_at": start + timedelta(seconds=i),
+                        }
+                        for i in range(offset, min(offset + 50_000, rows))
+                    ],
+                    chunk_size=5_000,
+                )
+
+    results = []
+    async with AsyncSessionLocal() as session:
+        for query in QUERIES:
+            with stopwatch() as fts:
+                for _ in range(repeat):
+                    hits, _ = await search_tickets(session, query, limit=20)
+
+            terms = query.split()
+            like = select(Ticket.id).limit(20)
+            for term in terms:
+                pattern = f"%{term}%"
+                like = like.where(
+                    or_(Ticket.name.like(pattern), Ticket.description.like(pattern), Ticket.error_message.like(pattern))
+                )
+            with stopwatch() as scan:
+                for _ in range(repeat):
+                    like_hits = (await session.execute(like)).all()
+
+            fts_ms = fts["elapsed"] / repeat * 1000
+            scan_ms = scan["elapsed"] / repeat * 1000
+            results.append(
+                [query, len(hits), f"{fts_ms:.2f}", len(like_hits), f"{scan_ms:.2f}", f"{scan_ms / fts_ms:.1f}x"]
+            )
+
+    await close_db()
+
+    print_table(
+        f"Search, {rows} tickets (seeded in {seeding['elapsed']:.1f}s, first page of 20, mean of {repeat})",
+        ["query", "fts hits", "fts ms", "like hits", "like ms", "speedup"],
+        results,
+    )
+    print("\nLIKE stops at the first 20 unranked rows; FTS ranks the SEARCH_CANDIDATES newest matches by bm25.")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
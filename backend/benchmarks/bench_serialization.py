@@ -0,0 +1,132 @@
+"""Measure the CPU spent serializing a ``GET /api/tickets?per_page=100`` page.
+
+Compares, on the same 100 tickets, the old path (ORM objects -> ``TicketResponse``
+models -> ``response_model`` re-validation -> ``json.dumps``) with rows serialized
+straight to orjson, then times the whole endpoint end to end, with every field
+and with a ``fields=name,status,severity`` projection.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.bench_serialization --repeat 500
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from datetime import timedelta
+from uuid import uuid4
+
+from benchmarks.common import asgi_client
+from benchmarks.common import print_table
+from benchmarks.common import sample_ticket
+from benchmarks.common import use_temp_database
+
+PER_PAGE = 100
+
+
+def _cpu_ms(function, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        function()
+    return (time.process_time() - start) / repeat * 1000
+
+
+async def run(repeat: int) -> None:
+    use_temp_database("serialization")
+
+    import orjson
+    from fastapi.encoders import jsonable_encoder
+    from sqlalchemy import select
+
+    from ticket_assistant.api.main import app
+    from ticket_assistant.api.tickets import TicketListResponse
+    from ticket_assistant.api.tickets import TicketResponse
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import init_db
+    from ticket_assistant.database.models import Ticket
+    from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+
+    await init_db()
+    start = datetime(2025, 1, 1)
+    async with AsyncSessionLocal() as session:
+        repo = TicketRepository(session)
+        rows = [
+            {
+                **sample_ticket(i),
+                "id": str(uuid4()),
+                "status": "open",
+                "created_at": start + timedelta(seconds=i),
+                "updated_at": start + timedelta(seconds=i),
+            }
+            for i in range(PER_PAGE)
+        ]
+        await repo.bulk_create_tickets(rows, keywords={row["id"]: ["checkout", "timeout"] for row in rows})
+
+        tickets = (await session.execute(select(Ticket).limit(PER_PAGE))).scalars().all()
+        mappings = (await session.execute(select(*Ticket.__table__.c).limit(PER_PAGE))).mappings().all()
+        keywords = await repo.get_keywords_for_tickets([row["id"] for row in mappings])
+
+    def models_and_revalidation() -> bytes:
+        responses = [TicketResponse.from_orm(ticket) for ticket in tickets]
+        for response in responses:
+            response.keywords = keywords[response.id]
+        page = TicketListResponse(
+            tickets=responses, total=PER_PAGE, page=1, per_page=PER_PAGE, has_next=False, has_prev=False
+        )
+        # What response_model does with the returned model: dump, validate again, encode
+        validated = TicketListResponse.model_validate(page.model_dump())
+        return json.dumps(jsonable_encoder(validated)).encode()
+
+    def rows_to_orjson() -> bytes:
+        page = {
+            "tickets": [{**row, "keywords": keywords[row["id"]]} for row in mappings],
+            "total": PER_PAGE,
+            "page": 1,
+            "per_page": PER_PAGE,
+            "has_next": False,
+            "has_prev": False,
+        }
+        return orjson.dumps(page, option=orjson.OPT_NON_STR_KEYS)
+
+    assert json.loads(models_and_revalidation()) == json.loads(rows_to_orjson())
+    before = _cpu_ms(models_and_revalidation, repeat)
+    after = _cpu_ms(rows_to_orjson, repeat)
+
+    endpoint_rows = []
+    async with asgi_client(app) as client:
+        for fields in (None, "name,status,severity"):
+            params = {"per_page": PER_PAGE, **({"fields": fields} if fields else {})}
+            await client.get("/api/tickets", params=params)
+            cpu_start = time.process_time()
+            for _ in range(repeat):
+                response = await client.get("/api/tickets", params=params)
+            endpoint = (time.process_time() - cpu_start) / repeat * 1000
+            assert len(response.json()["tickets"]) == PER_PAGE
+            label = f"GET /api/tickets?per_page={PER_PAGE}" + (f"&fields={fields}" if fields else "")
+            endpoint_rows.append([label, f"{endpoint:.3f}", f"{len(response.content)} bytes"])
+
+    await close_db()
+
+    print_table(
+        f"Serializing a page of {PER_PAGE} tickets (CPU ms, mean of {repeat})",
+        ["path", "cpu ms", "speedup / payload"],
+        [
+            ["ORM -> models -> response_model -> json", f"{before:.3f}", "1.0x"],
+            ["Core rows -> orjson", f"{after:.3f}", f"{before / after:.1f}x"],
+            *endpoint_rows,
+        ],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(run(args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Shared helpers for the benchmark scripts."""
+
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from random import choice
+
+import httpx
+
+DEPARTMENTS = ["backend", "frontend", "database", "devops", "security", "api"]
+SEVERITIES = ["low", "medium", "high", "critical"]
+
+
+def use_temp_database(name: str = "bench") -> Path:
+    """Point DATABASE_URL at a fresh SQLite file.
+
+    Must be called before anything from ``ticket_assistant`` is imported, since
+    the engine is created at import time.
+    """
+    path = Path(tempfile.mkdtemp(prefix=f"ticket-{name}-")) / "bench.db"
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{path}"
+    return path
+
+
+def asgi_client(app) -> httpx.AsyncClient:
+    """HTTP client that calls the ASGI app in-process (no lifespan, no sockets)."""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+
+def sample_ticket(index: int) -> dict:
+    """Build a realistic ticket create payload."""
+    return {
+        "name": f"Benchmark ticket #{index}",
+        "description": "Checkout requests intermittently fail with a gateway timeout under load",
+        "error_message": "504 Gateway Timeout: upstream request timeout",
+        "department": choice(DEPARTMENTS),  # noqa: S311
+        "severity": choice(SEVERITIES),  # noqa: S311
+    }
+
+
+@contextmanager
+def stopwatch():
+    """Measure wall-clock time of a block; read ``elapsed`` from the yielded dict."""
+    timing = {"elapsed": 0.0}
+    start = time.perf_counter()
+    try:
+        yield timing
+    finally:
+        timing["elapsed"] = time.perf_counter() - start
+
+
+def print_table(title: str, headers: list[str], rows: list[list]) -> None:
+    """Print a small aligned results table."""
+    widths = [max(len(str(cell)) for cell in column) for column in zip(headers, *rows, strict=False)]
+    print(f"\n{title}")
+    print("  ".join(str(h).ljust(w) for h, w in zip(headers, widths, strict=False)))
+    for row in rows:
+        print("  ".join(str(cell).ljust(w) for cell, w in zip(row, widths, strict=False)))
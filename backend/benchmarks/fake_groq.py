@@ -0,0 +1,102 @@
+"""Local stand-in for the Groq API (``GROQ_BASE_URL``), speaking the OpenAI chat completions format.
+
+A bare ASGI app like ``fake_ticket_api.FakeTicketAPI``; serve it with
+``fake_ticket_api.serve``. Every ``POST .../chat/completions`` waits for a
+log-normally distributed latency (median ``latency``, spread ``latency_sigma``;
+0 means a fixed latency) and then answers with a classification JSON document,
+a ``429`` (``rate_limit_rate``) or a ``500`` (``error_rate``).
+"""
+
+import asyncio
+import json
+import math
+import random
+import time
+
+DEPARTMENTS = ["backend", "frontend", "database", "devops", "security", "api", "integration", "general"]
+SEVERITIES = ["low", "medium", "high", "critical"]
+
+
+class FakeGroq:
+    """ASGI app answering chat completion requests with a random classification."""
+
+    def __init__(
+        self,
+        latency: float = 0.3,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        seed: int | None = None,
+    ):
+        self.latency = latency
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.random = random.Random(seed)  # noqa: S311
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+    def sample_latency(self) -> float:
+        """Seconds to wait before answering one request."""
+        if self.latency <= 0:
+            return 0.0
+        return self.random.lognormvariate(math.log(self.latency), self.latency_sigma)
+
+    def completion(self, model: str) -> dict:
+        content = {
+            "department": self.random.choice(DEPARTMENTS),
+            "severity": self.random.choice(SEVERITIES),
+            "confidence": round(self.random.uniform(0.6, 0.99), 2),
+            "reasoning": "Load-test classification",
+            "suggested_actions": ["Check recent deployments", "Review service logs"],
+        }
+        return {
+            "id": f"chatcmpl-fake-{self.requests}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": json.dumps(content)},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {"prompt_tokens": 420, "completion_tokens": 60, "total_tokens": 480},
+        }
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+
+        if scope["method"] != "POST" or not scope["path"].endswith("/chat/completions"):
+            status, result = 404, {"error": {"message": "Unknown endpoint", "type": "invalid_request_error"}}
+        else:
+            self.requests += 1
+            await asyncio.sleep(self.sample_latency())
+            roll = self.random.random()
+            if roll < self.rate_limit_rate:
+                self.rate_limited += 1
+                status, result = 429, {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}}
+            elif roll < self.rate_limit_rate + self.error_rate:
+                self.errors += 1
+                status, result = 500, {"error": {"message": "Internal server error", "type": "server_error"}}
+            else:
+                status, result = 200, self.completion(json.loads(body or b"{}").get("model", "fake"))
+
+        response = json.dumps(result).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(response)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": response})
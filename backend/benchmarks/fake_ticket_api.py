@@ -0,0 +1,85 @@
+"""Local stand-in for the external ticket API (``TICKET_API_ENDPOINT``).
+
+A bare ASGI app served by uvicorn in a background thread, so benchmarks can
+measure real sockets without leaving the machine. It accepts ``POST`` with a
+JSON body, answers ``201`` after an optional fixed latency and counts requests
+and items. ``POST .../batch`` takes a JSON array and answers one
+``{"status": 201}`` per item, or ``404`` when batch support is turned off.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import uvicorn
+
+
+class FakeTicketAPI:
+    """ASGI app that records every request it receives."""
+
+    def __init__(self, latency: float = 0.0, supports_batch: bool = True):
+        self.latency = latency
+        self.supports_batch = supports_batch
+        self.requests = 0
+        self.items = 0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+
+        payload = json.loads(body or b"null")
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        status = 201
+        if scope["path"].endswith("/batch"):
+            if self.supports_batch:
+                self.items += len(payload)
+                result = [{"status": 201} for _ in payload]
+            else:
+                status, result = 404, {"detail": "Not Found"}
+        else:
+            self.items += 1
+            result = {"received": True}
+
+        response = json.dumps(result).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(response)).encode())],
+            }
+        )
+        await send({"type": "http.response.body", "body": response})
+
+
+@contextmanager
+def serve(app, host: str = "127.0.0.1") -> Iterator[str]:
+    """Serve an ASGI app on a free local port in a background thread; yields its base URL."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, 0))
+    port = sock.getsockname()[1]
+
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", access_log=False, lifespan="off"))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://{host}:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+        sock.close()
@@ -0,0 +1,372 @@
+"""Load-test the running application against local stand-ins for Groq and the ticket API.
+
+Boots the app under uvicorn in a subprocess with a throwaway SQLite database,
+``GROQ_BASE_URL`` pointing at ``fake_groq.FakeGroq`` and the ticket API (fed
+through the outbox) pointing at ``fake_ticket_api.FakeTicketAPI``. It seeds
+some tickets, then drives a weighted mix of operations at a target request
+rate for ``--duration`` seconds.
+
+Arrivals are open-loop (Poisson at ``--rps``): a slow response does not delay
+the next request, and latency is measured from the moment a request was due,
+so queueing in the load generator counts against the app instead of hiding
+it. Throughput, status codes and p50/p95/p99 latency per operation are
+printed and written as JSON to ``--output``.
+
+Usage (from the backend directory)::
+
+    python -m benchmarks.loadtest --rps 50 --duration 30 --output loadtest-results.json
+    python -m benchmarks.loadtest --mix create=1,classify=1 --groq-latency-ms 800 --groq-error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter
+from collections import defaultdict
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import IO
+
+import httpx
+
+from benchmarks.common import print_table
+from benchmarks.common import sample_ticket
+from benchmarks.common import use_temp_database
+from benchmarks.fake_groq import FakeGroq
+from benchmarks.fake_ticket_api import FakeTicketAPI
+from benchmarks.fake_ticket_api import serve
+
+DEFAULT_MIX = "create=3,list=4,get=2,dashboard=2,classify=1,report=1"
+
+
+def _classify_payload(index: int) -> dict:
+    ticket = sample_ticket(index)
+    return {"error_description": ticket["description"], "error_message": ticket["error_message"]}
+
+
+def _report_payload(index: int) -> dict:
+    ticket = sample_ticket(index)
+    return {
+        "name": ticket["name"],
+        "keywords": ["checkout", "timeout"],
+        "description": ticket["description"],
+        "error_message": ticket["error_message"],
+    }
+
+
+def _operations(ticket_ids: list[str]) -> dict[str, tuple[str, str, Callable]]:
+    """Operation name -> (method, path template for the report, request builder taking the request index)."""
+    return {
+        "create": ("POST", "/api/tickets", lambda i: ("POST", "/api/tickets", {"json": sample_ticket(i)})),
+        "list": ("GET", "/api/tickets", lambda i: ("GET", "/api/tickets", {"params": {"page": 1 + i % 5}})),
+        "get": (
+            "GET",
+            "/api/tickets/{ticket_id}",
+            lambda i: ("GET", f"/api/tickets/{ticket_ids[i % len(ticket_ids)]}", {}),
+        ),
+        "dashboard": ("GET", "/api/dashboard/stats", lambda _: ("GET", "/api/dashboard/stats", {})),
+        "classify": (
+            "POST",
+            "/api/classification",
+            lambda i: ("POST", "/api/classification", {"json": _classify_payload(i)}),
+        ),
+        # Classify, create and forward to the ticket API through the outbox
+        "report": (
+            "POST",
+            "/api/combined/classify-and-create-ticket",
+            lambda i: ("POST", "/api/combined/classify-and-create-ticket", {"json": _report_payload(i)}),
+        ),
+    }
+
+
+def parse_mix(mix: str) -> dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_app(port: int, workers: int, groq_url: str, ticket_api_url: str, log: IO) -> subprocess.Popen:
+    """Run the app under uvicorn in a subprocess wired to the stand-in upstreams, logging to ``log``."""
+    use_temp_database("loadtest")
+    env = {
+        **os.environ,
+        "GROQ_API_KEY": "loadtest",
+        "GROQ_BASE_URL": groq_url,
+        "TICKET_API_ENDPOINT": f"{ticket_api_url}/tickets",
+        "TICKET_API_BATCH_ENDPOINT": f"{ticket_api_url}/tickets/batch",
+        "TICKET_OUTBOX_ENABLED": "true",
+    }
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "ticket_assistant.api.main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=log,
+    )
+
+
+async def wait_until_ready(client: httpx.AsyncClient, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited during startup with code {process.returncode}")
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.1)
+    raise RuntimeError(f"App not ready after {timeout}s")
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def summarize(latencies: list[float], statuses: Counter, errors: int, duration: float) -> dict:
+    """Request count, throughput, status codes and latency percentiles (ms) of one operation."""
+    latencies = sorted(latencies)
+    summary = {
+        "requests": len(latencies),
+        "errors": errors,
+        "status_codes": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+        "throughput_rps": round(len(latencies) / duration, 2),
+    }
+    if latencies:
+        summary.update(
+            {
+                "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2),
+                "p95_ms": round(_percentile(latencies, 0.95) * 1000, 2),
+                "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2),
+                "max_ms": round(latencies[-1] * 1000, 2),
+            }
+        )
+    return summary
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    operations: dict,
+    weights: dict[str, float],
+    rps: float,
+    duration: float,
+    max_in_flight: int,
+    seed: int,
+) -> dict:
+    """Send Poisson arrivals at ``rps`` for ``duration`` seconds and collect per-operation results."""
+    rng = random.Random(seed)  # noqa: S311
+    names = list(weights)
+    latencies: dict[str, list[float]] = defaultdict(list)
+    statuses: dict[str, Counter] = defaultdict(Counter)
+    errors: Counter = Counter()
+    dropped = 0
+    in_flight: set[asyncio.Task] = set()
+
+    async def one(name: str, index: int, due: float) -> None:
+        method, path, kwargs = operations[name][2](index)
+        try:
+            response = await client.request(method, path, **kwargs)
+            statuses[name][response.status_code] += 1
+            if response.status_code >= 400:
+                errors[name] += 1
+        except httpx.HTTPError as e:
+            statuses[name][type(e).__name__] += 1
+            errors[name] += 1
+        latencies[name].append(time.perf_counter() - due)
+
+    started = time.perf_counter()
+    due = started
+    index = 0
+    while True:
+        due += rng.expovariate(rps)
+        if due - started >= duration:
+            break
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            dropped += 1
+            continue
+        name = rng.choices(names, weights=[weights[n] for n in names])[0]
+        task = asyncio.create_task(one(name, index, due))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+        index += 1
+    if in_flight:
+        await asyncio.wait(in_flight)
+    elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for name in names:
+        method, template, _ = operations[name]
+        endpoints[name] = {
+            "method": method,
+            "path": template,
+            **summarize(latencies[name], statuses[name], errors[name], elapsed),
+        }
+    all_statuses = sum(statuses.values(), Counter())
+    overall = summarize(
+        [value for values in latencies.values() for value in values], all_statuses, sum(errors.values()), elapsed
+    )
+    return {"elapsed_s": round(elapsed, 2), "dropped": dropped, "endpoints": endpoints, "overall": overall}
+
+
+async def run(args: argparse.Namespace) -> dict:
+    weights = parse_mix(args.mix)
+    fake_groq = FakeGroq(
+        latency=args.groq_latency_ms / 1000,
+        latency_sigma=args.groq_latency_sigma,
+        error_rate=args.groq_error_rate,
+        rate_limit_rate=args.groq_rate_limit_rate,
+        seed=args.seed,
+    )
+    ticket_api = FakeTicketAPI(latency=args.ticket_api_latency_ms / 1000)
+
+    started_at = datetime.now().isoformat()
+    with (
+        serve(fake_groq) as groq_url,
+        serve(ticket_api) as ticket_api_url,
+        open(args.app_log, "w") as app_log,
+    ):
+        port = _free_port()
+        process = start_app(port, args.workers, groq_url, ticket_api_url, app_log)
+        try:
+            limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+            async with httpx.AsyncClient(
+                base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=args.timeout
+            ) as client:
+                await wait_until_ready(client, process)
+                ticket_ids = [
+                    (await client.post("/api/tickets", json=sample_ticket(i))).json()["id"]
+                    for i in range(args.seed_tickets)
+                ]
+                operations = _operations(ticket_ids)
+                unknown = set(weights) - set(operations)
+                if unknown:
+                    raise SystemExit(f"Unknown operations in --mix: {', '.join(sorted(unknown))}")
+
+                if args.warmup > 0:
+                    await drive(client, operations, weights, args.rps, args.warmup, args.max_in_flight, args.seed + 1)
+                fake_groq.requests = fake_groq.errors = fake_groq.rate_limited = 0
+                ticket_api.requests = ticket_api.items = 0
+
+                results = await drive(
+                    client, operations, weights, args.rps, args.duration, args.max_in_flight, args.seed
+                )
+                # Let the outbox dispatcher forward what the run created
+                await asyncio.sleep(2)
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+
+    return {
+        "started_at": started_at,
+        "config": {
+            "target_rps": args.rps,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "workers": args.workers,
+            "mix": weights,
+            "seed_tickets": args.seed_tickets,
+            "groq": {
+                "latency_median_ms": args.groq_latency_ms,
+                "latency_sigma": args.groq_latency_sigma,
+                "error_rate": args.groq_error_rate,
+                "rate_limit_rate": args.groq_rate_limit_rate,
+            },
+            "ticket_api_latency_ms": args.ticket_api_latency_ms,
+        },
+        **results,
+        "upstreams": {
+            "groq": {
+                "requests": fake_groq.requests,
+                "errors": fake_groq.errors,
+                "rate_limited": fake_groq.rate_limited,
+            },
+            "ticket_api": {"requests": ticket_api.requests, "items": ticket_api.items},
+        },
+    }
+
+
+def report(results: dict) -> None:
+    rows = [
+        [
+            name,
+            f"{row['method']} {row['path']}",
+            row["requests"],
+            row["errors"],
+            f"{row['throughput_rps']:.1f}",
+            *(f"{row.get(key, 0):.1f}" for key in ("p50_ms", "p95_ms", "p99_ms", "max_ms")),
+        ]
+        for name, row in [*results["endpoints"].items(), ("overall", {"method": "", "path": "", **results["overall"]})]
+    ]
+    print_table(
+        f"{results['config']['target_rps']} rps target for {results['elapsed_s']}s "
+        f"({results['overall']['throughput_rps']} rps achieved, {results['dropped']} dropped)",
+        ["operation", "endpoint", "requests", "errors", "rps", "p50 ms", "p95 ms", "p99 ms", "max ms"],
+        rows,
+    )
+    upstreams = results["upstreams"]
+    print(
+        f"\nFake Groq: {upstreams['groq']['requests']} calls, {upstreams['groq']['errors']} errors, "
+        f"{upstreams['groq']['rate_limited']} rate limited; "
+        f"fake ticket API: {upstreams['ticket_api']['requests']} requests, {upstreams['ticket_api']['items']} tickets"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rps", type=float, default=50.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured seconds before the run")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="Operation weights, e.g. create=3,list=4,classify=1")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--seed-tickets", type=int, default=200)
+    parser.add_argument("--max-in-flight", type=int, default=500, help="Requests beyond this many open are dropped")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--groq-latency-ms", type=float, default=300.0, help="Median fake Groq latency")
+    parser.add_argument("--groq-latency-sigma", type=float, default=0.5, help="Log-normal spread (0 = fixed)")
+    parser.add_argument("--groq-error-rate", type=float, default=0.01, help="Share of Groq calls answering 500")
+    parser.add_argument("--groq-rate-limit-rate", type=float, default=0.01, help="Share of Groq calls answering 429")
+    parser.add_argument("--ticket-api-latency-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="loadtest-results.json", help="JSON results file")
+    parser.add_argument("--app-log", default="loadtest-app.log", help="Where the app's log output goes")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    report(results)
+    Path(args.output).write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
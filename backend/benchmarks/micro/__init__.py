@@ -0,0 +1 @@
+"""pytest-benchmark microbenchmarks for hot paths, gated against saved baselines."""
@@ -0,0 +1,81 @@
+"""Fixtures for the microbenchmarks: an event loop runner and seeded databases of several sizes."""
+
+import asyncio
+import random
+from datetime import datetime
+from datetime import timedelta
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.common import DEPARTMENTS
+from benchmarks.common import SEVERITIES
+from benchmarks.common import sample_ticket
+
+# Table sizes the repository and dashboard benchmarks run at
+TABLE_SIZES = (1_000, 10_000, 100_000)
+
+KEYWORDS = ["timeout", "gateway", "checkout", "payment", "login", "cache", "deadlock", "deploy", "dns", "memory"]
+STATUSES = ["open", "open", "in_progress", "resolved", "closed"]
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """One event loop for all async benchmarks; ``runner.run(coro)`` runs a coroutine to completion."""
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+def _rows(count: int) -> tuple[list[dict], dict[str, list[str]]]:
+    """The same tickets on every run, so baseline and comparison query identical tables."""
+    rng = random.Random(count)  # noqa: S311
+    start = datetime(2025, 1, 1)
+    rows = []
+    keywords = {}
+    for i in range(count):
+        created = start + timedelta(minutes=i)
+        status = rng.choice(STATUSES)
+        row = {
+            **sample_ticket(i),
+            "id": str(UUID(int=rng.getrandbits(128), version=4)),
+            "department": rng.choice(DEPARTMENTS),
+            "severity": rng.choice(SEVERITIES),
+            "status": status,
+            "created_at": created,
+            "updated_at": created,
+            "resolved_at": created + timedelta(hours=rng.randrange(1, 72)) if status == "resolved" else None,
+        }
+        rows.append(row)
+        keywords[row["id"]] = rng.sample(KEYWORDS, 3)
+    return rows, keywords
+
+
+@pytest.fixture(scope="session")
+def seeded_sessions(runner, tmp_path_factory):
+    """Open an AsyncSession on a seeded SQLite database per table size: ``{size: (session, ticket_ids)}``."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from ticket_assistant.database import models  # noqa: F401
+    from ticket_assistant.database.connection import Base
+    from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+
+    async def seed(size: int):
+        path = tmp_path_factory.mktemp(f"tickets-{size}") / "bench.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)()
+        rows, keywords = _rows(size)
+        await TicketRepository(session).bulk_create_tickets(rows, chunk_size=5_000, keywords=keywords)
+        return engine, session, [row["id"] for row in rows]
+
+    seeded = {size: runner.run(seed(size)) for size in TABLE_SIZES}
+    yield {size: (session, ticket_ids) for size, (_, session, ticket_ids) in seeded.items()}
+
+    for engine, session, _ in seeded.values():
+        runner.run(session.close())
+        runner.run(engine.dispose())
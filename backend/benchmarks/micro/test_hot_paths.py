@@ -0,0 +1,149 @@
+"""Microbenchmarks for classification prompt/response handling, response serialization and dashboard queries."""
+
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.micro.conftest import TABLE_SIZES
+
+# TicketResponse.from_orm is Pydantic's deprecated v1 spelling, still used by the ticket endpoints
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
+
+GROQ_RESPONSE = """Here is the classification:
+{
+    "department": "database",
+    "severity": "high",
+    "confidence": 0.87,
+    "reasoning": "Connection pool exhaustion during peak hours points at the database layer",
+    "suggested_actions": ["Raise the pool size", "Add a statement timeout", "Check for long transactions"]
+}"""
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    from ticket_assistant.services.groq_classifier import GroqClassifier
+
+    with patch("ticket_assistant.services.groq_classifier.Groq"):
+        return GroqClassifier(api_key="bench")
+
+
+@pytest.fixture(scope="module")
+def orm_tickets():
+    from ticket_assistant.database.models import Ticket
+
+    now = datetime(2025, 1, 1)
+    return [
+        Ticket(
+            id=f"ticket-{i}",
+            name=f"Checkout fails #{i}",
+            description="Checkout requests intermittently fail with a gateway timeout under load",
+            error_message="504 Gateway Timeout: upstream request timeout",
+            department="backend",
+            severity="high",
+            status="open",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(100)
+    ]
+
+
+@pytest.fixture(scope="module")
+def orm_classifications():
+    from ticket_assistant.database.models import Classification
+
+    actions = json.dumps(["Raise the pool size", "Add a statement timeout", "Check for long transactions"])
+    return [
+        Classification(
+            id=f"classification-{i}",
+            ticket_id=f"ticket-{i}",
+            confidence=0.87,
+            reasoning="Connection pool exhaustion during peak hours",
+            suggested_actions=actions,
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, 1),
+        )
+        for i in range(100)
+    ]
+
+
+class TestClassifierBenchmarks:
+    def test_build_classification_prompt(self, benchmark, classifier):
+        """Benchmark building the Groq prompt for one error report"""
+        prompt = benchmark(
+            classifier._build_classification_prompt,
+            "Checkout requests intermittently fail with a gateway timeout under load",
+            "504 Gateway Timeout: upstream request timeout",
+            "Started after the 14:00 deploy",
+        )
+        assert "Checkout requests" in prompt
+
+    def test_parse_classification_response(self, benchmark, classifier):
+        """Benchmark extracting and validating the classification JSON from a Groq reply"""
+        result = benchmark(classifier._parse_classification_response, GROQ_RESPONSE)
+        assert result.department.value == "database"
+
+
+class TestSerializationBenchmarks:
+    def test_ticket_list_serialization(self, benchmark, orm_tickets):
+        """Benchmark a 100-ticket page through TicketResponse.from_orm to JSON"""
+        from ticket_assistant.api.tickets import TicketListResponse
+        from ticket_assistant.api.tickets import TicketResponse
+
+        def serialize():
+            return TicketListResponse(
+                tickets=[TicketResponse.from_orm(ticket) for ticket in orm_tickets],
+                total=len(orm_tickets),
+                page=1,
+                per_page=len(orm_tickets),
+                has_next=False,
+                has_prev=False,
+            ).model_dump_json()
+
+        assert benchmark(serialize).startswith('{"tickets":')
+
+    def test_classification_from_orm(self, benchmark, orm_classifications):
+        """Benchmark ClassificationResponse.from_orm, which decodes suggested_actions from JSON, for 100 rows"""
+        from ticket_assistant.api.classifications import ClassificationResponse
+
+        responses = benchmark(lambda: [ClassificationResponse.from_orm(row) for row in orm_classifications])
+        assert len(responses[0].suggested_actions) == 3
+
+
+REPOSITORY_QUERIES = {
+    "total_count": lambda repo, _: repo.get_total_count(),
+    "open_count": lambda repo, _: repo.get_open_tickets_count(),
+    "department_distribution": lambda repo, _: repo.get_department_distribution(),
+    "severity_distribution": lambda repo, _: repo.get_severity_distribution(),
+    "top_keywords": lambda repo, _: repo.get_top_keywords(),
+    "average_resolution_time": lambda repo, _: repo.get_average_resolution_time(),
+    "ticket_by_id": lambda repo, ids: repo.get_ticket_by_id(ids[len(ids) // 2]),
+    "keywords_for_page": lambda repo, ids: repo.get_keywords_for_tickets(ids[:20]),
+}
+
+
+class TestDatabaseBenchmarks:
+    @pytest.mark.parametrize("size", TABLE_SIZES)
+    @pytest.mark.parametrize("query", list(REPOSITORY_QUERIES))
+    def test_ticket_repository(self, benchmark, runner, seeded_sessions, query, size):
+        """Benchmark one TicketRepository query against a tickets table of ``size`` rows"""
+        from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+
+        session, ticket_ids = seeded_sessions[size]
+        repo = TicketRepository(session)
+        benchmark.group = f"ticket_repository.{query}"
+        benchmark(lambda: runner.run(REPOSITORY_QUERIES[query](repo, ticket_ids)))
+
+    @pytest.mark.parametrize("size", TABLE_SIZES)
+    def test_dashboard_stats(self, benchmark, runner, seeded_sessions, size):
+        """Benchmark DatabaseDashboardService.get_dashboard_stats against a tickets table of ``size`` rows"""
+        from ticket_assistant.database.database_service import DatabaseDashboardService
+        from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+
+        session, _ = seeded_sessions[size]
+        service = DatabaseDashboardService(TicketRepository(session))
+        benchmark.group = "dashboard_stats"
+        stats = benchmark(lambda: runner.run(service.get_dashboard_stats()))
+        assert stats.total_tickets == size
@@ -29,3 +29,73 @@ def setup_test_environment():
     # Any test setup can go here
     yield
     # Any test teardown can go here
+
+
+@pytest.fixture
+async def db_engine(tmp_path):
+    """Async engine bound to a throwaway SQLite database with all tables created."""
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from ticket_assistant.database import models  # noqa: F401
+    from ticket_assistant.database.connection import Base
+    from ticket_assistant.database.connection import enable_sqlite_foreign_keys
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def db_session(db_engine):
+    """Database session on the throwaway test database."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    session_factory = async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def api_client(tmp_path):
+    """TestClient whose ``get_db`` dependency points at a throwaway SQLite database."""
+    from fastapi.testclient import TestClient
+    from sqlalchemy import create_engine
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    from ticket_assistant.api.main import app
+    from ticket_assistant.database import models  # noqa: F401
+    from ticket_assistant.database.connection import Base
+    from ticket_assistant.database.connection import enable_sqlite_foreign_keys
+    from ticket_assistant.database.connection import get_db
+    from ticket_assistant.database.connection import get_session_factory
+    from ticket_assistant.database.query_diagnostics import instrument_engine
+
+    db_path = tmp_path / "api.db"
+    sync_engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+    # NullPool: the TestClient may run requests on different event loops
+    engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}", poolclass=NullPool)
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+    instrument_engine(engine.sync_engine)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_session_factory, None)
@@ -0,0 +1,101 @@
+"""Admin diagnostics: on-demand sampling profiles and event-loop reports of this worker."""
+
+import asyncio
+import logging
+import os
+import secrets
+from typing import Literal
+
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Response
+from fastapi.security import HTTPAuthorizationCredentials
+from fastapi.security import HTTPBearer
+
+from ticket_assistant.api.responses import ORJSONResponse
+from ticket_assistant.core import profiling
+
+logger = logging.getLogger(__name__)
+
+# Admin endpoints answer 404 until a token is configured
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+MAX_PROFILE_SECONDS = float(os.getenv("MAX_PROFILE_SECONDS", "60"))
+
+bearer = HTTPBearer(auto_error=False)
+
+# One profile at a time per worker; overlapping samplers would skew each other
+_profile_lock = asyncio.Lock()
+
+
+def require_admin(credentials: HTTPAuthorizationCredentials | None = Depends(bearer)) -> None:
+    """Dependency accepting only ``Authorization: Bearer <ADMIN_TOKEN>``."""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(credentials.credentials.encode(), ADMIN_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid admin token", headers={"WWW-Authenticate": "Bearer"})
+
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+def _check_idle() -> None:
+    if _profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running in this worker")
+
+
+@router.get("/profile")
+async def profile_worker(
+    seconds: float = Query(10.0, gt=0, description="How long to sample"),
+    interval_ms: float = Query(5.0, ge=1, le=100, description="Sampling interval"),
+    format: Literal["speedscope", "collapsed"] = Query("speedscope", description="Output format"),
+    threads: Literal["loop", "all"] = Query("all", description="Sample the event loop thread only or every thread"),
+) -> Response:
+    """Sample the stacks of the worker serving this request for ``seconds``.
+
+    ``speedscope`` returns JSON to open at https://www.speedscope.app;
+    ``collapsed`` returns folded stacks for ``flamegraph.pl``. ``all`` includes
+    the threads running blocking calls such as the Groq client. With several
+    workers only the one serving this request is profiled.
+    """
+    if seconds > MAX_PROFILE_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {MAX_PROFILE_SECONDS:g}")
+    _check_idle()
+
+    try:
+        async with _profile_lock:
+            logger.info(f"Profiling worker {os.getpid()} for {seconds}s ({threads} threads)")
+            sampler = await profiling.profile(seconds, interval=interval_ms / 1000, all_threads=threads == "all")
+        if format == "collapsed":
+            return Response(sampler.collapsed(), media_type="text/plain")
+        return ORJSONResponse(
+            sampler.speedscope(name=f"ticket-assistant pid {os.getpid()}"),
+            headers={"Content-Disposition": f'attachment; filename="profile-{os.getpid()}.speedscope.json"'},
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error profiling worker: {e!s}")
+        raise HTTPException(status_code=500, detail=f"Failed to profile worker: {e!s}") from e
+
+
+@router.get("/loop")
+async def event_loop_report(
+    seconds: float = Query(5.0, gt=0, description="How long to observe the loop"),
+    top: int = Query(20, ge=1, le=100, description="Number of coroutines to list"),
+):
+    """Event-loop lag percentiles and the coroutines that held the loop longest while observing."""
+    if seconds > MAX_PROFILE_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {MAX_PROFILE_SECONDS:g}")
+    _check_idle()
+
+    try:
+        async with _profile_lock:
+            report = await profiling.loop_report(seconds, top=top)
+        return {"pid": os.getpid(), **report}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error reporting on event loop: {e!s}")
+        raise HTTPException(status_code=500, detail=f"Failed to report on event loop: {e!s}") from e
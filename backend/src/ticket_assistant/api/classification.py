@@ -1,10 +1,16 @@
 """Classification endpoints."""
 
+import asyncio
+import json
 import logging
+import os
+from collections.abc import AsyncIterator
 
 from fastapi import APIRouter
+from fastapi import Body
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
 
 from ticket_assistant.core.models import ClassificationRequest
 from ticket_assistant.core.models import ClassificationResponse
@@ -17,6 +23,10 @@ router = APIRouter(prefix="/api/classification", tags=["Classification"])
 # Global service instance
 groq_classifier = None
 
+# Batch classification limits
+BATCH_MAX_ITEMS = int(os.getenv("CLASSIFICATION_BATCH_MAX_ITEMS", "500"))
+BATCH_CONCURRENCY = int(os.getenv("CLASSIFICATION_BATCH_CONCURRENCY", "8"))
+
 
 def get_groq_classifier() -> GroqClassifier:
     """Dependency to get Groq classifier instance."""
@@ -54,3 +64,71 @@ async def classify_error(
     except Exception as e:
         logger.error(f"Error in classification: {e!s}")
         raise HTTPException(status_code=500, detail=f"Classification error: {e!s}") from e
+
+
+async def _classify_batch(
+    classifier: GroqClassifier,
+    requests: list[ClassificationRequest],
+    concurrency: int,
+) -> AsyncIterator[bytes]:
+    """Classify a batch concurrently and yield NDJSON lines in completion order.
+
+    Identical requests are classified once and the result is emitted for every
+    index that asked for it. A request whose classification fails gets an
+    ``error`` line instead of the default classification.
+    """
+    indices_by_request: dict[tuple[str, str | None, str | None], list[int]] = {}
+    for index, request in enumerate(requests):
+        key = (request.error_description, request.error_message, request.context)
+        indices_by_request.setdefault(key, []).append(index)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def classify(key: tuple[str, str | None, str | None]) -> tuple[list[int], dict]:
+        async with semaphore:
+            try:
+                result = await classifier.classify_error(
+                    error_description=key[0],
+                    error_message=key[1],
+                    context=key[2],
+                    fallback_on_error=False,
+                )
+                return indices_by_request[key], {"result": result.model_dump(mode="json")}
+            except Exception as e:
+                logger.error(f"Error in batch classification: {e!s}")
+                return indices_by_request[key], {"error": f"Classification error: {e!s}"}
+
+    tasks = [asyncio.create_task(classify(key)) for key in indices_by_request]
+    try:
+        for finished in asyncio.as_completed(tasks):
+            indices, outcome = await finished
+            for index in indices:
+                yield (json.dumps({"index": index, **outcome}) + "\n").encode()
+    finally:
+        # Client went away mid-stream: don't leave classifications running
+        for task in tasks:
+            task.cancel()
+
+
+@router.post("/batch")
+async def classify_errors_batch(
+    classification_requests: list[ClassificationRequest] = Body(...),
+    classifier: GroqClassifier = Depends(get_groq_classifier),
+) -> StreamingResponse:
+    """Classify a batch of errors concurrently, streaming NDJSON results.
+
+    At most ``CLASSIFICATION_BATCH_CONCURRENCY`` classifications run at once.
+    Each line is ``{"index": i, "result": {...}}`` (or ``"error"``) and lines
+    arrive in completion order, not request order.
+    """
+    if len(classification_requests) > BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch classification is limited to {BATCH_MAX_ITEMS} requests",
+        )
+
+    logger.info(f"Classifying batch of {len(classification_requests)} errors")
+    return StreamingResponse(
+        _classify_batch(classifier, classification_requests, BATCH_CONCURRENCY),
+        media_type="application/x-ndjson",
+    )
@@ -5,18 +5,31 @@ import logging
 from datetime import datetime
 from typing import Any
 
+import orjson
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Request
+from fastapi import Response
 from pydantic import BaseModel
+from sqlalchemy import RowMapping
+from sqlalchemy import delete
 from sqlalchemy import func
 from sqlalchemy import select
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ticket_assistant.api.conditional import not_modified
+from ticket_assistant.api.conditional import set_cache_headers
+from ticket_assistant.api.conditional import weak_etag
+from ticket_assistant.api.fieldsets import parse_fields
+from ticket_assistant.api.fieldsets import project_columns
+from ticket_assistant.api.responses import ORJSONResponse
 from ticket_assistant.database.connection import get_db
 from ticket_assistant.database.models import Classification
 from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+from ticket_assistant.database.versions import get_table_versions
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +62,7 @@ class ClassificationResponse(BaseModel):
     reasoning: str
     suggested_actions: list[str]
     created_at: datetime
+    updated_at: datetime
 
     class Config:
         from_attributes = True
@@ -69,9 +83,25 @@ class ClassificationResponse(BaseModel):
             reasoning=classification.reasoning,
             suggested_actions=suggested_actions,
             created_at=classification.created_at,
+            updated_at=classification.updated_at,
         )
 
 
+def _classification_dict(row: RowMapping) -> dict[str, Any]:
+    """Serialize a classification row directly, in the shape of ClassificationResponse."""
+    if "suggested_actions" not in row:
+        return dict(row)
+    try:
+        suggested_actions = orjson.loads(row["suggested_actions"])
+    except (orjson.JSONDecodeError, TypeError):
+        suggested_actions = []
+    return {**row, "suggested_actions": suggested_actions}
+
+
+# Fields that can be requested with ``fields=`` on the classification list
+CLASSIFICATION_FIELDS = tuple(ClassificationResponse.model_fields)
+
+
 class ClassificationListResponse(BaseModel):
     """Response model for classification list."""
 
@@ -85,15 +115,29 @@ class ClassificationListResponse(BaseModel):
 
 @router.get("", response_model=ClassificationListResponse)
 async def get_classifications(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
     ticket_id: str | None = Query(None, description="Filter by ticket ID"),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return, e.g. fields=ticket_id,confidence (id is always included)"
+    ),
     db: AsyncSession = Depends(get_db),
-) -> ClassificationListResponse:
-    """Get a paginated list of classifications with optional filters."""
+) -> ORJSONResponse:
+    """Get a paginated list of classifications with optional filters.
+
+    Unchanged pages (same classifications version and query) are a 304.
+    """
+    field_names = parse_fields(fields, CLASSIFICATION_FIELDS)
     try:
-        # Build query with filters
-        query = select(Classification)
+        versions = await get_table_versions(db, ("classifications",))
+        etag = weak_etag("classifications", versions.get("classifications"), sorted(request.query_params.multi_items()))
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        # Build query with filters; Core rows of the requested columns are serialized without building models
+        query = select(*project_columns(Classification.__table__, field_names))
 
         if ticket_id:
             query = query.where(Classification.ticket_id == ticket_id)
@@ -115,20 +159,23 @@ async def get_classifications(
 
         # Execute query
         result = await db.execute(query)
-        classifications = result.scalars().all()
+        rows = result.mappings().all()
 
         # Calculate pagination info
         has_next = offset + per_page < total
         has_prev = page > 1
 
-        return ClassificationListResponse(
-            classifications=[ClassificationResponse.from_orm(c) for c in classifications],
-            total=total,
-            page=page,
-            per_page=per_page,
-            has_next=has_next,
-            has_prev=has_prev,
+        response = ORJSONResponse(
+            {
+                "classifications": [_classification_dict(row) for row in rows],
+                "total": total,
+                "page": page,
+                "per_page": per_page,
+                "has_next": has_next,
+                "has_prev": has_prev,
+            }
         )
+        return set_cache_headers(response, etag)
 
     except Exception as e:
         logger.error(f"Error fetching classifications: {e}")
@@ -136,15 +183,32 @@ async def get_classifications(
 
 
 @router.get("/{classification_id}", response_model=ClassificationResponse)
-async def get_classification(classification_id: str, db: AsyncSession = Depends(get_db)) -> ClassificationResponse:
-    """Get a specific classification by ID."""
+async def get_classification(
+    classification_id: str, request: Request, response: Response, db: AsyncSession = Depends(get_db)
+) -> ClassificationResponse | Response:
+    """Get a specific classification by ID.
+
+    The ETag is derived from the classification's own ``updated_at``.
+    """
     try:
+        updated_at = await db.scalar(select(Classification.updated_at).where(Classification.id == classification_id))
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Classification not found")
+
+        etag = weak_etag("classification", classification_id, updated_at.isoformat())
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
         result = await db.execute(select(Classification).where(Classification.id == classification_id))
         classification = result.scalar_one_or_none()
 
         if not classification:
             raise HTTPException(status_code=404, detail="Classification not found")
 
+        set_cache_headers(
+            response, weak_etag("classification", classification_id, classification.updated_at.isoformat())
+        )
         return ClassificationResponse.from_orm(classification)
 
     except HTTPException:
@@ -197,23 +261,27 @@ async def update_classification(
 ) -> ClassificationResponse:
     """Update an existing classification."""
     try:
-        result = await db.execute(select(Classification).where(Classification.id == classification_id))
-        classification = result.scalar_one_or_none()
+        # Update only provided fields in a single UPDATE ... RETURNING
+        values = classification_data.model_dump(exclude_none=True)
+        if "suggested_actions" in values:
+            values["suggested_actions"] = json.dumps(values["suggested_actions"])
+        if not values:
+            # No-op SET so an empty body still returns the row (or a 404)
+            values = {"confidence": Classification.confidence}
+
+        result = await db.execute(
+            update(Classification)
+            .where(Classification.id == classification_id)
+            .values(**values)
+            .returning(*Classification.__table__.c)
+            .execution_options(synchronize_session=False)
+        )
+        classification = result.one_or_none()
+        await db.commit()
 
         if not classification:
             raise HTTPException(status_code=404, detail="Classification not found")
 
-        # Update only provided fields
-        if classification_data.confidence is not None:
-            classification.confidence = classification_data.confidence
-        if classification_data.reasoning is not None:
-            classification.reasoning = classification_data.reasoning
-        if classification_data.suggested_actions is not None:
-            classification.suggested_actions = json.dumps(classification_data.suggested_actions)
-
-        await db.commit()
-        await db.refresh(classification)
-
         logger.info(f"Updated classification {classification_id}")
         return ClassificationResponse.from_orm(classification)
 
@@ -228,15 +296,16 @@ async def update_classification(
 async def delete_classification(classification_id: str, db: AsyncSession = Depends(get_db)) -> dict[str, Any]:
     """Delete a classification."""
     try:
-        result = await db.execute(select(Classification).where(Classification.id == classification_id))
-        classification = result.scalar_one_or_none()
+        result = await db.execute(
+            delete(Classification)
+            .where(Classification.id == classification_id)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
 
-        if not classification:
+        if not result.rowcount:
             raise HTTPException(status_code=404, detail="Classification not found")
 
-        await db.delete(classification)
-        await db.commit()
-
         logger.info(f"Deleted classification {classification_id}")
         return {"message": "Classification deleted successfully", "classification_id": classification_id}
 
@@ -249,10 +318,17 @@ async def delete_classification(classification_id: str, db: AsyncSession = Depen
 
 @router.get("/by-ticket/{ticket_id}", response_model=list[ClassificationResponse])
 async def get_classifications_by_ticket(
-    ticket_id: str, db: AsyncSession = Depends(get_db)
-) -> list[ClassificationResponse]:
+    ticket_id: str, request: Request, db: AsyncSession = Depends(get_db)
+) -> Response:
     """Get all classifications for a specific ticket."""
     try:
+        # Tickets too: deleting a ticket without classifications must turn the 304 into a 404
+        versions = await get_table_versions(db, ("tickets", "classifications"))
+        etag = weak_etag("by-ticket", ticket_id, versions.get("tickets"), versions.get("classifications"))
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
         # Verify ticket exists
         ticket_repo = TicketRepository(db)
         ticket = await ticket_repo.get_ticket_by_id(ticket_id)
@@ -262,13 +338,13 @@ async def get_classifications_by_ticket(
 
         # Get classifications
         result = await db.execute(
-            select(Classification)
+            select(*Classification.__table__.c)
             .where(Classification.ticket_id == ticket_id)
             .order_by(Classification.created_at.desc())
         )
-        classifications = result.scalars().all()
 
-        return [ClassificationResponse.from_orm(c) for c in classifications]
+        response = ORJSONResponse([_classification_dict(row) for row in result.mappings().all()])
+        return set_cache_headers(response, etag)
 
     except HTTPException:
         raise
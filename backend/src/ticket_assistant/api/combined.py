@@ -1,17 +1,26 @@
 """Combined operations endpoints."""
 
+import asyncio
+import json
 import logging
 from typing import Any
 
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Response
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ticket_assistant.api.classification import get_groq_classifier
 from ticket_assistant.api.reports import get_report_service
 from ticket_assistant.core.models import ReportRequest
 from ticket_assistant.database.connection import get_db
+from ticket_assistant.database.models import Classification
+from ticket_assistant.database.repositories.classification_job_repository import JOB_PENDING
+from ticket_assistant.database.repositories.classification_job_repository import ClassificationJobRepository
+from ticket_assistant.database.repositories.ticket_repository import TicketRepository
 from ticket_assistant.services.database_services import EnhancedReportService
 from ticket_assistant.services.groq_classifier import GroqClassifier
 from ticket_assistant.services.report_service import ReportService
@@ -20,10 +29,15 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/combined", tags=["Combined Operations"])
 
+# Interval between checks while a job-status request waits for the result
+JOB_WAIT_POLL_INTERVAL = 0.25
+
 
 @router.post("/classify-and-create-ticket", response_model=dict[str, Any])
 async def classify_and_create_ticket(
     report: ReportRequest,
+    response: Response,
+    background: bool = Query(False, description="Create the ticket now and classify it in the background"),
     db: AsyncSession = Depends(get_db),
     classifier: GroqClassifier = Depends(get_groq_classifier),
 ) -> dict[str, Any]:
@@ -33,10 +47,37 @@ async def classify_and_create_ticket(
     1. Classifies the error using Groq API
     2. Creates a ticket in the database with the classification
     3. Returns both the ticket and classification data
+
+    With ``background=true`` the ticket is created in ``pending_classification``
+    state and the response (202) comes back without waiting for the classifier;
+    poll ``/api/combined/classification-jobs/{ticket_id}`` for the result.
     """
     try:
         logger.info(f"Processing classify-and-create-ticket request for: {report.name}")
 
+        if background:
+            report_result, ticket = await EnhancedReportService().send_report_with_database(
+                report=report,
+                db_session=db,
+                classify_in_background=True,
+            )
+            response.status_code = 202
+            logger.info(f"Created ticket {ticket.id} pending classification")
+            return {
+                "success": True,
+                "ticket": _ticket_dict(ticket),
+                "classification": None,
+                "classification_job": {
+                    "status": JOB_PENDING,
+                    "poll_url": f"{router.prefix}/classification-jobs/{ticket.id}",
+                },
+                "report_result": {
+                    "success": report_result.success,
+                    "message": report_result.message,
+                    "ticket_id": report_result.ticket_id,
+                },
+            }
+
         # First, classify the error
         classification = await classifier.classify_error(
             error_description=report.description,
@@ -157,6 +198,81 @@ async def classify_and_create_ticket_mock(
         raise HTTPException(status_code=500, detail=f"Failed to classify and create mock ticket: {e!s}") from e
 
 
+@router.get("/classification-jobs/{ticket_id}", response_model=dict[str, Any])
+async def get_classification_job(
+    ticket_id: str,
+    wait: float = Query(0.0, ge=0.0, le=30.0, description="Seconds to wait for a pending job to finish"),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """Status of a background classification, with the classified ticket once it is done.
+
+    With ``wait`` the request is held until the job finishes or the time is up,
+    so clients can long-poll instead of polling in a tight loop.
+    """
+    try:
+        job_repo = ClassificationJobRepository(db)
+        job = await job_repo.get_job_for_ticket(ticket_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Classification job not found")
+
+        deadline = asyncio.get_running_loop().time() + wait
+        while job.status == JOB_PENDING and asyncio.get_running_loop().time() < deadline:
+            # End the read transaction so SQLite lets the worker commit meanwhile
+            await db.rollback()
+            await asyncio.sleep(JOB_WAIT_POLL_INTERVAL)
+            await db.refresh(job)
+
+        result: dict[str, Any] = {
+            "ticket_id": ticket_id,
+            "status": job.status,
+            "attempts": job.attempts,
+            "last_error": job.last_error,
+            "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+            "ticket": None,
+            "classification": None,
+        }
+        if job.status != JOB_PENDING:
+            ticket = await TicketRepository(db).get_ticket_by_id(ticket_id)
+            result["ticket"] = _ticket_dict(ticket) if ticket else None
+            classification = (
+                await db.execute(
+                    select(Classification)
+                    .where(Classification.ticket_id == ticket_id)
+                    .order_by(Classification.created_at.desc())
+                    .limit(1)
+                )
+            ).scalar_one_or_none()
+            if classification is not None:
+                result["classification"] = {
+                    "department": ticket.department if ticket else None,
+                    "severity": ticket.severity if ticket else None,
+                    "confidence": classification.confidence,
+                    "reasoning": classification.reasoning,
+                    "suggested_actions": json.loads(classification.suggested_actions),
+                }
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error fetching classification job for ticket {ticket_id}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to fetch classification job: {e!s}") from e
+
+
+def _ticket_dict(ticket) -> dict[str, Any]:
+    return {
+        "id": ticket.id,
+        "name": ticket.name,
+        "description": ticket.description,
+        "error_message": ticket.error_message,
+        "department": ticket.department,
+        "severity": ticket.severity,
+        "status": ticket.status,
+        "created_at": ticket.created_at.isoformat(),
+        "updated_at": ticket.updated_at.isoformat(),
+    }
+
+
 # Legacy endpoints for backward compatibility
 @router.post("/classify-and-send-legacy", response_model=dict[str, Any])
 async def classify_and_send_report_legacy(
@@ -0,0 +1,239 @@
+"""Negotiated response compression (zstd, brotli, gzip).
+
+The encoding is picked from ``Accept-Encoding`` by q-value, ties going to the
+order of ``COMPRESSION_ENCODINGS``. Complete bodies below ``COMPRESSION_MIN_SIZE``
+are sent as they are; streamed bodies are compressed chunk by chunk, each chunk
+flushed so NDJSON exports and long polls reach the client without waiting for
+the compressor's buffer to fill. brotli and zstd need the optional
+``compression`` extra and are skipped when their package is missing.
+"""
+
+import logging
+import os
+import zlib
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Protocol
+
+from starlette.datastructures import Headers
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_ENCODINGS = [
+    name.strip() for name in os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",") if name.strip()
+]
+
+# Fast settings: responses are compressed once per request, not ahead of time
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+ZSTD_LEVEL = 3
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/xml",
+    "application/javascript",
+    "text/",
+)
+
+
+class Encoder(Protocol):
+    """Incremental compressor for one response body."""
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """Emit everything compressed so far without ending the stream."""
+        ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipEncoder:
+    def __init__(self):
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliEncoder:
+    def __init__(self):
+        import brotli
+
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdEncoder:
+    def __init__(self):
+        import zstandard
+
+        self._flush_block = zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(self._flush_block)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _available_encoders() -> dict[str, Callable[[], Encoder]]:
+    encoders: dict[str, Callable[[], Encoder]] = {"gzip": GzipEncoder}
+    try:
+        import brotli  # noqa: F401
+
+        encoders["br"] = BrotliEncoder
+    except ImportError:
+        pass
+    try:
+        import zstandard  # noqa: F401
+
+        encoders["zstd"] = ZstdEncoder
+    except ImportError:
+        pass
+    return encoders
+
+
+ENCODERS = _available_encoders()
+
+
+def choose_encoding(accept_encoding: str, encodings: Sequence[str]) -> str | None:
+    """Pick the encoding to use from an ``Accept-Encoding`` value, or None for identity.
+
+    The highest q-value wins; ties go to the earliest entry of ``encodings``.
+    ``*`` covers every encoding the header does not name, and ``q=0`` refuses one.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        name = name.strip()
+        if not name:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name] = weight
+
+    best, best_weight = None, 0.0
+    for name in encodings:
+        weight = weights.get(name, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def _compressible(message: Message) -> bool:
+    status = message["status"]
+    if status < 200 or status in (204, 206, 304):
+        return False
+    headers = Headers(raw=message.get("headers", []))
+    if "content-encoding" in headers:
+        return False
+    return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+
+class CompressionMiddleware:
+    """ASGI middleware compressing response bodies in the client's preferred encoding."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        encodings: Sequence[str] = tuple(COMPRESSION_ENCODINGS),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        unknown = [name for name in encodings if name not in ENCODERS]
+        if unknown:
+            logger.warning(f"Compression encodings not available (missing package?): {', '.join(unknown)}")
+        self.encodings = [name for name in encodings if name in ENCODERS]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = choose_encoding(accept_encoding, self.encodings) if accept_encoding else None
+
+        start: Message | None = None
+        encoder: Encoder | None = None
+
+        async def compressing_send(message: Message) -> None:
+            nonlocal start, encoder
+            if message["type"] == "http.response.start":
+                # Caches must key every compressible response on Accept-Encoding,
+                # including the ones sent as they are
+                if _compressible(message):
+                    MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    await send(message)
+                    return
+                # Held back until the first body chunk shows whether the body is worth compressing
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if start is not None:
+                response_start, start = start, None
+                if not _compressible(response_start) or (not more_body and len(body) < self.minimum_size):
+                    await send(response_start)
+                    await send(message)
+                    return
+
+                encoder = ENCODERS[encoding]()
+                headers = MutableHeaders(scope=response_start)
+                headers["Content-Encoding"] = encoding
+                if more_body:
+                    del headers["Content-Length"]
+                    body = encoder.compress(body) + encoder.flush()
+                else:
+                    body = encoder.compress(body) + encoder.finish()
+                    headers["Content-Length"] = str(len(body))
+                await send(response_start)
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            if encoder is None:
+                await send(message)
+                return
+            body = encoder.compress(body) + (encoder.flush() if more_body else encoder.finish())
+            await send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+        await self.app(scope, receive, compressing_send)
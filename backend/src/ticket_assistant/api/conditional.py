@@ -0,0 +1,45 @@
+"""Conditional GETs: weak ETags, ``If-None-Match`` and 304 responses."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request
+from fastapi import Response
+
+# Browsers and the nginx proxy may store responses but must revalidate every use,
+# which costs a 304 without a body while the data is unchanged
+CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak ETag over ``parts`` (a table version or timestamp plus whatever shapes the body).
+
+    Weak, because the body is only semantically equivalent across servers and
+    nginx's gzip keeps weak validators while it drops strong ones.
+    """
+    digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header value."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def set_cache_headers(response: Response, etag: str) -> Response:
+    """Attach the validator and revalidation policy to a 200 response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a bodiless 304 when the request already holds ``etag``, otherwise None."""
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return None
+    return set_cache_headers(Response(status_code=304), etag)
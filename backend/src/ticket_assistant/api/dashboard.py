@@ -6,14 +6,22 @@ from datetime import timedelta
 
 from fastapi import APIRouter
 from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi import Request
+from fastapi import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ticket_assistant.api.conditional import not_modified
+from ticket_assistant.api.conditional import set_cache_headers
+from ticket_assistant.api.conditional import weak_etag
 from ticket_assistant.core.models import DashboardStats
 from ticket_assistant.core.models import Department
 from ticket_assistant.core.models import ErrorSeverity
 from ticket_assistant.database.connection import get_db
 from ticket_assistant.database.database_service import DatabaseDashboardService
 from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+from ticket_assistant.database.versions import get_table_versions
 
 logger = logging.getLogger(__name__)
 
@@ -21,13 +29,23 @@ router = APIRouter(prefix="/api/dashboard", tags=["Dashboard"])
 
 
 @router.get("/stats", response_model=DashboardStats)
-async def get_dashboard_stats(db: AsyncSession = Depends(get_db)) -> DashboardStats:
+async def get_dashboard_stats(
+    request: Request, response: Response, db: AsyncSession = Depends(get_db)
+) -> DashboardStats | Response:
     """Get dashboard statistics including ticket counts, resolution times, and distributions.
 
     This endpoint queries the database for real statistics and falls back to mock data
-    if the database is unavailable or contains no data.
+    if the database is unavailable or contains no data. Real statistics carry an ETag
+    from the tickets and classifications table versions; a match is a 304 that skips
+    every aggregate query.
     """
     try:
+        versions = await get_table_versions(db, ("tickets", "classifications"))
+        etag = weak_etag("dashboard", versions.get("tickets"), versions.get("classifications"))
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
         # Create repository and service instances
         ticket_repo = TicketRepository(db)
         dashboard_service = DatabaseDashboardService(ticket_repo)
@@ -41,6 +59,7 @@ async def get_dashboard_stats(db: AsyncSession = Depends(get_db)) -> DashboardSt
             return get_mock_dashboard_stats()
 
         logger.info(f"Dashboard stats from database: {stats.total_tickets} total tickets")
+        set_cache_headers(response, etag)
         return stats
 
     except Exception as e:
@@ -69,6 +88,9 @@ def get_mock_dashboard_stats() -> DashboardStats:
         ErrorSeverity.CRITICAL.value: 15,
     }
 
+    # Sample keyword usage
+    top_keywords = {"timeout": 28, "database": 21, "login": 17, "payment": 12, "deployment": 9}
+
     # Calculate totals
     total_tickets = sum(department_distribution.values())
     resolved_tickets = int(total_tickets * 0.73)  # 73% resolution rate
@@ -82,9 +104,29 @@ def get_mock_dashboard_stats() -> DashboardStats:
         classification_accuracy=94.5,  # 94.5% accuracy
         department_distribution=department_distribution,
         severity_distribution=severity_distribution,
+        top_keywords=top_keywords,
     )
 
 
+@router.get("/keywords", response_model=dict[str, int])
+async def get_top_keywords(
+    limit: int = Query(10, ge=1, le=100, description="Number of keywords"),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, int]:
+    """Get the most used ticket keywords with their ticket counts, most used first.
+
+    Counts come from an aggregate maintained on every keyword insert and
+    delete, so this is a short index scan rather than a GROUP BY over all tickets.
+    """
+    try:
+        ticket_repo = TicketRepository(db)
+        return await ticket_repo.get_top_keywords(limit)
+
+    except Exception as e:
+        logger.error(f"Error getting top keywords: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get top keywords: {e!s}") from e
+
+
 @router.get("/stats/real-time")
 async def get_real_time_stats():
     """Get real-time dashboard updates.
@@ -0,0 +1,48 @@
+"""Analytics export endpoints."""
+
+import logging
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter
+from fastapi import Depends
+from fastapi import HTTPException
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.database.connection import get_session_factory
+from ticket_assistant.services.arrow_export import ARROW_STREAM_MEDIA_TYPE
+from ticket_assistant.services.arrow_export import export_schema
+from ticket_assistant.services.arrow_export import stream_arrow_ipc
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/exports", tags=["Exports"])
+
+
+@router.get("/arrow")
+async def export_arrow(
+    table: Literal["tickets", "classifications", "joined"] = Query("tickets", description="Table to export"),
+    since: datetime | None = Query(None, description="Only rows changed after this watermark"),
+    batch_size: int = Query(50_000, ge=1_000, le=500_000, description="Rows per record batch"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream tickets and/or classifications as Arrow IPC record batches.
+
+    ``joined`` left-joins classifications onto tickets. With ``since`` only rows
+    whose ``updated_at`` is newer are sent (for ``joined``, the ticket's or the
+    classification's), so BI jobs can pull incrementally.
+    """
+    try:
+        export_schema(table)
+    except RuntimeError as e:
+        raise HTTPException(status_code=501, detail=str(e)) from e
+
+    logger.info(f"Streaming Arrow export of {table} since {since}")
+    return StreamingResponse(
+        stream_arrow_ipc(session_factory, table, since=since, batch_size=batch_size),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{table}.arrows"'},
+    )
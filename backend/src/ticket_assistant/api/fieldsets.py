@@ -0,0 +1,38 @@
+"""Sparse fieldsets: the ``fields=`` query parameter of list endpoints."""
+
+from collections.abc import Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Column
+from sqlalchemy import Table
+
+
+def parse_fields(
+    fields: str | None,
+    allowed: Sequence[str],
+    always: Sequence[str] = ("id",),
+) -> list[str] | None:
+    """Parse a comma-separated ``fields`` value into the requested field names.
+
+    Returns None when no fieldset was asked for (every field), otherwise the
+    requested names in ``allowed`` order with the ``always`` fields included.
+    Unknown names are a 400.
+    """
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Available: {', '.join(allowed)}",
+        )
+    requested.update(always)
+    return [name for name in allowed if name in requested]
+
+
+def project_columns(table: Table, names: Sequence[str] | None) -> list[Column]:
+    """Columns of ``table`` to SELECT for a fieldset; every column when ``names`` is None."""
+    if names is None:
+        return list(table.c)
+    return [table.c[name] for name in names if name in table.c]
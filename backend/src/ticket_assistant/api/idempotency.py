@@ -0,0 +1,142 @@
+"""``Idempotency-Key`` support for the report and ticket creation endpoints.
+
+A POST carrying the header runs once per key: its response is stored, keyed by
+a hash of the endpoint and key, and replayed (with ``Idempotent-Replayed: true``)
+to every retry within ``IDEMPOTENCY_TTL_SECONDS``. A retry that arrives while the
+first request is still running waits for its response. Reusing a key with a
+different body is rejected with 422; server errors are not stored, so they can
+be retried.
+"""
+
+import hashlib
+import logging
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from ticket_assistant.services.idempotency_store import IdempotencyInFlightError
+from ticket_assistant.services.idempotency_store import IdempotencyKeyMismatchError
+from ticket_assistant.services.idempotency_store import IdempotencyStore
+from ticket_assistant.services.idempotency_store import StoredResponse
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_PATH_PREFIXES = ("/api/reports", "/api/tickets", "/api/combined")
+MAX_KEY_LENGTH = 255
+
+# Global store instance, set in the app lifespan; None disables the middleware
+idempotency_store: IdempotencyStore | None = None
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+class IdempotencyMiddleware:
+    """ASGI middleware storing and replaying responses of POSTs with an ``Idempotency-Key``."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        store = idempotency_store
+        if (
+            store is None
+            or scope["type"] != "http"
+            or scope["method"] != "POST"
+            or not scope["path"].startswith(IDEMPOTENT_PATH_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        header = next((value for name, value in scope["headers"] if name == b"idempotency-key"), None)
+        if header is None:
+            await self.app(scope, receive, send)
+            return
+        if not header.strip() or len(header) > MAX_KEY_LENGTH:
+            response = JSONResponse(
+                {"detail": f"Idempotency-Key must be 1 to {MAX_KEY_LENGTH} characters"}, status_code=400
+            )
+            await response(scope, receive, send)
+            return
+
+        body = await _read_body(receive)
+        key = hashlib.sha256(b"POST " + scope["path"].encode() + b"\n" + header).hexdigest()
+        fingerprint = hashlib.sha256(scope["query_string"] + b"\n" + body).hexdigest()
+
+        try:
+            stored = await store.acquire(key, fingerprint)
+        except IdempotencyKeyMismatchError:
+            response = JSONResponse(
+                {"detail": "Idempotency-Key was already used for a different request"}, status_code=422
+            )
+            await response(scope, receive, send)
+            return
+        except IdempotencyInFlightError:
+            response = JSONResponse(
+                {"detail": "A request with this Idempotency-Key is still in progress"},
+                status_code=409,
+                headers={"Retry-After": "1"},
+            )
+            await response(scope, receive, send)
+            return
+
+        if stored is not None:
+            await self._replay(stored, send)
+            return
+
+        body_sent = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await receive()
+
+        status_code = 500
+        headers: list[tuple[bytes, bytes]] = []
+        chunks: list[bytes] = []
+
+        async def capture_send(message: Message) -> None:
+            nonlocal status_code, headers
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, replay_receive, capture_send)
+        except BaseException:
+            await store.release(key)
+            raise
+
+        if status_code >= 500:
+            await store.release(key)
+            return
+        await store.complete(
+            key,
+            StoredResponse(
+                status_code,
+                [(name.decode("latin-1"), value.decode("latin-1")) for name, value in headers],
+                b"".join(chunks),
+            ),
+        )
+
+    @staticmethod
+    async def _replay(stored: StoredResponse, send: Send) -> None:
+        headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in stored.headers]
+        headers.append((b"idempotent-replayed", b"true"))
+        await send({"type": "http.response.start", "status": stored.status_code, "headers": headers})
+        await send({"type": "http.response.body", "body": stored.body})
@@ -6,14 +6,30 @@ from dotenv import load_dotenv
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ticket_assistant.api import admin
 from ticket_assistant.api import classification
 from ticket_assistant.api import classifications
 from ticket_assistant.api import combined
 from ticket_assistant.api import dashboard
+from ticket_assistant.api import exports
 from ticket_assistant.api import health
+from ticket_assistant.api import idempotency
+from ticket_assistant.api import metrics
 from ticket_assistant.api import reports
 from ticket_assistant.api import tickets
+from ticket_assistant.api.compression import CompressionMiddleware
+from ticket_assistant.api.query_diagnostics import QueryDiagnosticsMiddleware
+from ticket_assistant.api.responses import ORJSONResponse
+from ticket_assistant.api.tracing import TracingMiddleware
+from ticket_assistant.core import tracing
+from ticket_assistant.core.loop_monitor import LOOP_MONITOR_ENABLED
+from ticket_assistant.core.loop_monitor import LoopMonitor
+from ticket_assistant.core.metrics import METRICS_ENABLED
+from ticket_assistant.services import classification_worker
+from ticket_assistant.services import outbox_dispatcher
 from ticket_assistant.services.groq_classifier import GroqClassifier
+from ticket_assistant.services.http_client import create_http_client
+from ticket_assistant.services.idempotency_store import create_idempotency_store
 from ticket_assistant.services.report_service import ReportService
 
 # Load environment variables from .env file
@@ -29,6 +45,15 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
     # Startup
     logger.info("Starting up Ticket Assistant API...")
 
+    # Record spans for offline analysis when TRACING_ENABLED is set
+    tracing.setup_tracing()
+
+    # Watch for sync calls stalling the event loop
+    loop_monitor = None
+    if LOOP_MONITOR_ENABLED:
+        loop_monitor = LoopMonitor()
+        loop_monitor.start()
+
     # Initialize database
     from ticket_assistant.database.connection import init_db
 
@@ -37,12 +62,30 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
 
     # Initialize services
     api_endpoint = os.getenv("TICKET_API_ENDPOINT", "https://api.example.com/tickets")
-    report_service = ReportService(api_endpoint=api_endpoint)
+    http_client = create_http_client()
+    report_service = ReportService(
+        api_endpoint=api_endpoint,
+        client=http_client,
+        batch_endpoint=os.getenv("TICKET_API_BATCH_ENDPOINT") or None,
+        batch_max_items=int(os.getenv("TICKET_API_BATCH_MAX_ITEMS", "50")),
+        batch_max_wait=float(os.getenv("TICKET_API_BATCH_MAX_WAIT_MS", "50")) / 1000,
+    )
 
     # Set the global service instances
     reports.report_service = report_service
     combined.report_service = report_service
 
+    from ticket_assistant.database.connection import AsyncSessionLocal
+
+    # Replay responses to retried creation requests carrying an Idempotency-Key
+    idempotency.idempotency_store = create_idempotency_store(AsyncSessionLocal)
+
+    # Deliver queued tickets to the external ticket API in the background
+    dispatcher = None
+    if outbox_dispatcher.OUTBOX_ENABLED:
+        dispatcher = outbox_dispatcher.OutboxDispatcher(AsyncSessionLocal, report_service)
+        dispatcher.start()
+
     # Initialize Groq classifier (will be set up when API key is provided)
     groq_api_key = os.getenv("GROQ_API_KEY")
     if groq_api_key:
@@ -56,10 +99,27 @@ async def lifespan(app: FastAPI):  # noqa: ARG001
     else:
         logger.warning("GROQ_API_KEY not provided, classification will use mock responses")
 
+    # Classify tickets created with background classification
+    worker_pool = None
+    if classification.groq_classifier is not None and classification_worker.CLASSIFICATION_WORKERS > 0:
+        worker_pool = classification_worker.ClassificationWorkerPool(AsyncSessionLocal, classification.groq_classifier)
+        worker_pool.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down Ticket Assistant API...")
+    if worker_pool is not None:
+        await worker_pool.stop()
+    if dispatcher is not None:
+        await dispatcher.stop()
+    await report_service.aclose()
+    await http_client.aclose()
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    tracing.shutdown_tracing()
+    idempotency.idempotency_store = None
+
     from ticket_assistant.database.connection import close_db
 
     await close_db()
@@ -71,8 +131,16 @@ app = FastAPI(
     description="AI-powered ticket reporting and classification system",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Store and replay responses of creation requests with an Idempotency-Key; added
+# before CORS so it runs inside it and replays get fresh CORS headers
+app.add_middleware(idempotency.IdempotencyMiddleware)
+
+# Attribute slow queries, including idempotency store lookups, to their route
+app.add_middleware(QueryDiagnosticsMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -82,14 +150,29 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses last, outside the idempotency store, so stored bodies stay
+# uncompressed and each replay is encoded for the retrying client
+app.add_middleware(CompressionMiddleware)
+
+# Server span per request, a no-op until tracing is set up in the lifespan
+app.add_middleware(TracingMiddleware)
+
+# Added last and so outermost: request latency includes every other middleware
+if METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
 # Include routers
 app.include_router(health.router)
+if METRICS_ENABLED:
+    app.include_router(metrics.router)
 app.include_router(reports.router)
 app.include_router(classification.router)
 app.include_router(classifications.router)
 app.include_router(combined.router)
 app.include_router(dashboard.router)
 app.include_router(tickets.router)
+app.include_router(exports.router)
+app.include_router(admin.router)
 
 
 @app.get("/")
@@ -0,0 +1,59 @@
+"""``GET /metrics`` and the middleware timing every HTTP request."""
+
+import time
+
+from fastapi import APIRouter
+from fastapi import Response
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from ticket_assistant.core.metrics import HTTP_REQUEST_DURATION
+from ticket_assistant.core.metrics import HTTP_REQUESTS
+from ticket_assistant.core.metrics import render_metrics
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus scrape endpoint."""
+    body, content_type = render_metrics()
+    return Response(body, media_type=content_type)
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and status of each request under its route template.
+
+    Labelling by template (``/api/tickets/{ticket_id}``) rather than by path keeps
+    the number of series bounded; requests that match no route count as ``unmatched``.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def status_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, status_send)
+        finally:
+            # The router stores the matched route in the scope on the way in
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.labels(method, template).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, template, str(status_code)).inc()
@@ -0,0 +1,27 @@
+"""Middleware attributing SQL statements to the request that ran them."""
+
+from starlette.types import ASGIApp
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from ticket_assistant.database import query_diagnostics
+
+
+class QueryDiagnosticsMiddleware:
+    """ASGI middleware scoping slow-query entries and N+1 / fan-out checks to each request.
+
+    Slow statements are logged with the route that issued them; in development
+    mode the request's statements are checked once it has been served.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or query_diagnostics.QUERY_DIAGNOSTICS == "off":
+            await self.app(scope, receive, send)
+            return
+
+        with query_diagnostics.track_request(scope["method"], scope):
+            await self.app(scope, receive, send)
@@ -1,6 +1,7 @@
 """Report handling endpoints."""
 
 import logging
+import uuid
 
 from fastapi import APIRouter
 from fastapi import Depends
@@ -10,8 +11,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from ticket_assistant.core.models import ReportRequest
 from ticket_assistant.core.models import ReportResponse
 from ticket_assistant.database.connection import get_db
+from ticket_assistant.database.repositories.outbox_repository import OutboxRepository
+from ticket_assistant.services import outbox_dispatcher
 from ticket_assistant.services.database_services import EnhancedReportService
 from ticket_assistant.services.report_service import ReportService
+from ticket_assistant.services.report_service import build_report_payload
 
 logger = logging.getLogger(__name__)
 
@@ -57,11 +61,25 @@ async def create_ticket_report(report: ReportRequest, db: AsyncSession = Depends
 
 @router.post("/legacy", response_model=ReportResponse)
 async def send_report_legacy(
-    report: ReportRequest, service: ReportService = Depends(get_report_service)
+    report: ReportRequest,
+    service: ReportService = Depends(get_report_service),
+    db: AsyncSession = Depends(get_db),
 ) -> ReportResponse:
-    """Legacy endpoint that sends report to external API (for backward compatibility)."""
+    """Legacy endpoint that sends report to external API (for backward compatibility).
+
+    With ``TICKET_OUTBOX_ENABLED`` the report is queued in the outbox and
+    delivered in the background instead of making the caller wait on the API.
+    """
     try:
         logger.info(f"Received legacy report: {report.name}")
+        if outbox_dispatcher.OUTBOX_ENABLED:
+            ticket_id = str(uuid.uuid4())
+            OutboxRepository(db).add(build_report_payload(report, ticket_id), idempotency_key=ticket_id)
+            await db.commit()
+            outbox_dispatcher.notify_dispatcher()
+            logger.info(f"Legacy report queued for delivery with ticket ID: {ticket_id}")
+            return ReportResponse(success=True, message="Report queued for delivery", ticket_id=ticket_id)
+
         result = await service.send_report(report)
 
         if result.success:
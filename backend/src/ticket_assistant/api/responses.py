@@ -0,0 +1,18 @@
+"""JSON response class rendered with orjson."""
+
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson, the app's default response class.
+
+    orjson serializes datetimes, enums and UUIDs natively, so endpoints on hot
+    paths can return plain dicts built straight from database rows in one of
+    these and skip Pydantic response validation altogether.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
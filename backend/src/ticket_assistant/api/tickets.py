@@ -1,29 +1,56 @@
 """Ticket CRUD API endpoints."""
 
+import json
 import logging
+import os
 from datetime import datetime
 from typing import Any
+from typing import Literal
+from uuid import uuid4
 
 from fastapi import APIRouter
 from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
+from fastapi import Request
+from fastapi import Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from pydantic import ValidationError
 from sqlalchemy import func
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.api.conditional import not_modified
+from ticket_assistant.api.conditional import set_cache_headers
+from ticket_assistant.api.conditional import weak_etag
+from ticket_assistant.api.fieldsets import parse_fields
+from ticket_assistant.api.fieldsets import project_columns
+from ticket_assistant.api.responses import ORJSONResponse
 from ticket_assistant.core.models import Department
 from ticket_assistant.core.models import ErrorSeverity
 from ticket_assistant.database.connection import get_db
+from ticket_assistant.database.connection import get_session_factory
+from ticket_assistant.database.keywords import normalize_keywords
 from ticket_assistant.database.models import Classification
 from ticket_assistant.database.models import Ticket
 from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+from ticket_assistant.database.repositories.ticket_repository import build_ticket_filters
+from ticket_assistant.database.search import search_tickets
+from ticket_assistant.database.versions import get_table_versions
+from ticket_assistant.services.export_service import EXPORT_FORMATS
+from ticket_assistant.services.export_service import TicketExportService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/tickets", tags=["Tickets"])
 
+# Bulk ingestion limits
+BULK_MAX_ITEMS = int(os.getenv("TICKET_BULK_MAX_ITEMS", "5000"))
+BULK_CHUNK_SIZE = int(os.getenv("TICKET_BULK_CHUNK_SIZE", "500"))
+BULK_MAX_BYTES = int(os.getenv("TICKET_BULK_MAX_BYTES", str(10 * 1024 * 1024)))
+
 
 class TicketCreateRequest(BaseModel):
     """Request model for creating a new ticket."""
@@ -35,6 +62,7 @@ class TicketCreateRequest(BaseModel):
     severity: ErrorSeverity
     assignee: str | None = None
     screenshot_url: str | None = None
+    keywords: list[str] = []
 
 
 class TicketUpdateRequest(BaseModel):
@@ -65,13 +93,18 @@ class TicketResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     resolved_at: datetime | None
+    keywords: list[str] | None = None  # only filled where loaded (get, create, list)
 
     class Config:
         from_attributes = True
 
 
+# Fields that can be requested with ``fields=`` on the ticket list
+TICKET_FIELDS = tuple(TicketResponse.model_fields)
+
+
 class TicketListResponse(BaseModel):
-    """Response model for ticket list."""
+    """Response model for ticket list; with ``fields=`` tickets only carry the requested fields."""
 
     tickets: list[TicketResponse]
     total: int
@@ -81,43 +114,157 @@ class TicketListResponse(BaseModel):
     has_prev: bool
 
 
+class BulkTicketItemResult(BaseModel):
+    """Outcome for a single item of a bulk ticket request."""
+
+    index: int
+    status: str  # "created" or "invalid"
+    id: str | None = None
+    errors: list[dict[str, Any]] | None = None
+
+
+class BulkTicketResponse(BaseModel):
+    """Response model for bulk ticket creation."""
+
+    created: int
+    failed: int
+    results: list[BulkTicketItemResult]
+
+
+class TicketSearchSnippets(BaseModel):
+    """Matched fragments with search terms wrapped in ``<mark>`` tags."""
+
+    name: str
+    description: str
+    error_message: str | None = None
+
+
+class TicketSearchHit(BaseModel):
+    """A single full-text search result."""
+
+    id: str
+    name: str
+    status: str
+    department: str
+    severity: str
+    created_at: datetime
+    rank: float
+    snippets: TicketSearchSnippets
+
+
+class TicketSearchResponse(BaseModel):
+    """Response model for ticket search; pass ``next_cursor`` back as ``cursor`` for the next page."""
+
+    results: list[TicketSearchHit]
+    next_cursor: str | None = None
+
+
+def _ticket_values(ticket_data: TicketCreateRequest) -> dict[str, Any]:
+    """Convert a create request into column values for a new open ticket."""
+    return {
+        "name": ticket_data.name,
+        "description": ticket_data.description,
+        "error_message": ticket_data.error_message,
+        "department": ticket_data.department.value,
+        "severity": ticket_data.severity.value,
+        "assignee": ticket_data.assignee,
+        "screenshot_url": ticket_data.screenshot_url,
+        "status": "open",
+    }
+
+
+def _bulk_too_large(detail: str) -> HTTPException:
+    """413 for a bulk body over one of its limits, e.g. ``detail="5000 tickets"``."""
+    return HTTPException(status_code=413, detail=f"Bulk requests are limited to {detail}")
+
+
+async def _read_bulk_body(request: Request) -> list[Any]:
+    """Read a bulk body given either as a JSON array or as NDJSON (one object per line).
+
+    The body is refused from its Content-Length, or once more than
+    ``BULK_MAX_BYTES`` have arrived, before it is buffered. NDJSON is parsed as
+    it streams in and refused as soon as it holds more than ``BULK_MAX_ITEMS``.
+    """
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > BULK_MAX_BYTES:
+        raise _bulk_too_large(f"{BULK_MAX_BYTES} bytes")
+
+    content_type = request.headers.get("content-type", "")
+    ndjson = "ndjson" in content_type or "jsonlines" in content_type
+    buffer = bytearray()
+    received = 0
+    items: list[Any] = []
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > BULK_MAX_BYTES:
+            raise _bulk_too_large(f"{BULK_MAX_BYTES} bytes")
+        buffer += chunk
+        if ndjson and b"\n" in chunk:
+            *lines, rest = buffer.split(b"\n")
+            buffer = bytearray(rest)
+            items.extend(json.loads(line) for line in lines if line.strip())
+            if len(items) > BULK_MAX_ITEMS:
+                raise _bulk_too_large(f"{BULK_MAX_ITEMS} tickets")
+
+    if ndjson:
+        if buffer.strip():
+            items.append(json.loads(buffer))
+    else:
+        items = json.loads(buffer)
+        if not isinstance(items, list):
+            raise ValueError("Expected a JSON array of tickets")
+    if len(items) > BULK_MAX_ITEMS:
+        raise _bulk_too_large(f"{BULK_MAX_ITEMS} tickets")
+    return items
+
+
 @router.get("", response_model=TicketListResponse)
 async def get_tickets(
+    request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(10, ge=1, le=100, description="Items per page"),
     status: str | None = Query(None, description="Filter by status"),
     department: Department | None = Query(None, description="Filter by department"),
     severity: ErrorSeverity | None = Query(None, description="Filter by severity"),
     assignee: str | None = Query(None, description="Filter by assignee"),
+    keyword: str | None = Query(None, description="Comma-separated keywords, e.g. keyword=database,timeout"),
+    keyword_mode: Literal["all", "any"] = Query("all", description="Match all keywords (AND) or any (OR)"),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return, e.g. fields=name,status,severity (id is always included)"
+    ),
     db: AsyncSession = Depends(get_db),
-) -> TicketListResponse:
-    """Get a paginated list of tickets with optional filters."""
+) -> ORJSONResponse:
+    """Get a paginated list of tickets with optional filters.
+
+    With ``fields`` only those columns are selected and returned, so list views
+    skip the large text columns. The ETag follows the tickets table version, so
+    a matching ``If-None-Match`` gets a 304 without running the page query.
+    """
+    field_names = parse_fields(fields, TICKET_FIELDS)
     try:
-        # Build query with filters
-        query = select(Ticket)
+        versions = await get_table_versions(db, ("tickets",))
+        etag = weak_etag("tickets", versions.get("tickets"), sorted(request.query_params.multi_items()))
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
 
-        if status:
-            query = query.where(Ticket.status == status)
-        if department:
-            query = query.where(Ticket.department == department.value)
-        if severity:
-            query = query.where(Ticket.severity == severity.value)
-        if assignee:
-            query = query.where(Ticket.assignee == assignee)
+        # Build query with filters
+        conditions = build_ticket_filters(
+            status=status,
+            department=department.value if department else None,
+            severity=severity.value if severity else None,
+            assignee=assignee,
+            keywords=keyword.split(",") if keyword else None,
+            match_all_keywords=keyword_mode == "all",
+        )
+        # Core rows of the requested columns only: the page is serialized straight from them
+        query = select(*project_columns(Ticket.__table__, field_names)).where(*conditions)
 
         # Add ordering
         query = query.order_by(Ticket.created_at.desc())
 
         # Count total results
-        count_query = select(func.count(Ticket.id))
-        if status:
-            count_query = count_query.where(Ticket.status == status)
-        if department:
-            count_query = count_query.where(Ticket.department == department.value)
-        if severity:
-            count_query = count_query.where(Ticket.severity == severity.value)
-        if assignee:
-            count_query = count_query.where(Ticket.assignee == assignee)
+        count_query = select(func.count(Ticket.id)).where(*conditions)
 
         total_result = await db.execute(count_query)
         total = total_result.scalar() or 0
@@ -128,37 +275,159 @@ async def get_tickets(
 
         # Execute query
         result = await db.execute(query)
-        tickets = result.scalars().all()
+        rows = result.mappings().all()
 
         # Calculate pagination info
         has_next = offset + per_page < total
         has_prev = page > 1
 
-        return TicketListResponse(
-            tickets=[TicketResponse.from_orm(ticket) for ticket in tickets],
-            total=total,
-            page=page,
-            per_page=per_page,
-            has_next=has_next,
-            has_prev=has_prev,
+        # Keywords for the whole page in one query
+        tickets = [dict(row) for row in rows]
+        if field_names is None or "keywords" in field_names:
+            keywords = await TicketRepository(db).get_keywords_for_tickets([ticket["id"] for ticket in tickets])
+            for ticket in tickets:
+                ticket["keywords"] = keywords[ticket["id"]]
+
+        # The rows already match TicketResponse, so skip building and re-validating models
+        response = ORJSONResponse(
+            {
+                "tickets": tickets,
+                "total": total,
+                "page": page,
+                "per_page": per_page,
+                "has_next": has_next,
+                "has_prev": has_prev,
+            }
         )
+        return set_cache_headers(response, etag)
 
     except Exception as e:
         logger.error(f"Error fetching tickets: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to fetch tickets: {e!s}") from e
 
 
+@router.delete("", response_model=dict[str, Any])
+async def delete_tickets(
+    status: str | None = Query(None, description="Filter by status"),
+    department: Department | None = Query(None, description="Filter by department"),
+    severity: ErrorSeverity | None = Query(None, description="Filter by severity"),
+    assignee: str | None = Query(None, description="Filter by assignee"),
+    created_before: datetime | None = Query(None, description="Only tickets created before this time"),
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """Bulk delete every ticket matching the filters in a single statement.
+
+    At least one filter is required so an empty query string cannot wipe the table.
+    """
+    conditions = build_ticket_filters(
+        status=status,
+        department=department.value if department else None,
+        severity=severity.value if severity else None,
+        assignee=assignee,
+        created_before=created_before,
+    )
+    if not conditions:
+        raise HTTPException(status_code=400, detail="At least one filter is required for bulk delete")
+
+    try:
+        ticket_repo = TicketRepository(db)
+        deleted = await ticket_repo.delete_tickets(conditions)
+
+        logger.info(f"Bulk deleted {deleted} tickets")
+        return {"message": "Tickets deleted successfully", "deleted": deleted}
+
+    except Exception as e:
+        logger.error(f"Error bulk deleting tickets: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to delete tickets: {e!s}") from e
+
+
+@router.get("/export")
+async def export_tickets(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Export format"),
+    status: str | None = Query(None, description="Filter by status"),
+    department: Department | None = Query(None, description="Filter by department"),
+    severity: ErrorSeverity | None = Query(None, description="Filter by severity"),
+    assignee: str | None = Query(None, description="Filter by assignee"),
+    keyword: str | None = Query(None, description="Comma-separated keywords"),
+    keyword_mode: Literal["all", "any"] = Query("all", description="Match all keywords (AND) or any (OR)"),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_session_factory),
+) -> StreamingResponse:
+    """Stream every matching ticket as NDJSON or CSV.
+
+    Rows are read over a server-side cursor and written straight to bytes, so
+    memory stays flat regardless of result size. ``CompressionMiddleware``
+    compresses the stream in whichever encoding the client accepts.
+    """
+    conditions = build_ticket_filters(
+        status=status,
+        department=department.value if department else None,
+        severity=severity.value if severity else None,
+        assignee=assignee,
+        keywords=keyword.split(",") if keyword else None,
+        match_all_keywords=keyword_mode == "all",
+    )
+    headers = {"Content-Disposition": f'attachment; filename="tickets.{export_format}"'}
+
+    export_service = TicketExportService(session_factory)
+    return StreamingResponse(
+        export_service.stream(export_format, conditions),
+        media_type=EXPORT_FORMATS[export_format],
+        headers=headers,
+    )
+
+
+@router.get("/search", response_model=TicketSearchResponse)
+async def search_ticket_text(
+    q: str = Query(..., min_length=1, description="Words to find in name, description or error message"),
+    limit: int = Query(20, ge=1, le=100, description="Results per page"),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    db: AsyncSession = Depends(get_db),
+) -> TicketSearchResponse:
+    """Full-text search over tickets, best matches first.
+
+    Every word must match and the last one matches as a prefix. Pages are
+    keyset-paginated on (rank, row), so deep pages cost the same as the first.
+    """
+    try:
+        hits, next_cursor = await search_tickets(db, q, limit=limit, cursor=cursor)
+        return TicketSearchResponse(results=hits, next_cursor=next_cursor)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.error(f"Error searching tickets: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to search tickets: {e!s}") from e
+
+
 @router.get("/{ticket_id}", response_model=TicketResponse)
-async def get_ticket(ticket_id: str, db: AsyncSession = Depends(get_db)) -> TicketResponse:
-    """Get a specific ticket by ID."""
+async def get_ticket(
+    ticket_id: str, request: Request, response: Response, db: AsyncSession = Depends(get_db)
+) -> TicketResponse | Response:
+    """Get a specific ticket by ID.
+
+    The ETag is derived from ``updated_at``, which a cheap lookup checks before
+    the ticket and its keywords are loaded.
+    """
     try:
+        updated_at = await db.scalar(select(Ticket.updated_at).where(Ticket.id == ticket_id))
+        if updated_at is None:
+            raise HTTPException(status_code=404, detail="Ticket not found")
+
+        etag = weak_etag("ticket", ticket_id, updated_at.isoformat())
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
         ticket_repo = TicketRepository(db)
         ticket = await ticket_repo.get_ticket_by_id(ticket_id)
 
         if not ticket:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
-        return TicketResponse.from_orm(ticket)
+        ticket_response = TicketResponse.from_orm(ticket)
+        ticket_response.keywords = await ticket_repo.get_ticket_keywords(ticket_id)
+        set_cache_headers(response, weak_etag("ticket", ticket_id, ticket.updated_at.isoformat()))
+        return ticket_response
 
     except HTTPException:
         raise
@@ -174,27 +443,64 @@ async def create_ticket(ticket_data: TicketCreateRequest, db: AsyncSession = Dep
         ticket_repo = TicketRepository(db)
 
         # Convert to dict for database creation
-        ticket_dict = {
-            "name": ticket_data.name,
-            "description": ticket_data.description,
-            "error_message": ticket_data.error_message,
-            "department": ticket_data.department.value,
-            "severity": ticket_data.severity.value,
-            "assignee": ticket_data.assignee,
-            "screenshot_url": ticket_data.screenshot_url,
-            "status": "open",
-        }
-
-        ticket = await ticket_repo.create_ticket(ticket_dict)
+        keywords = normalize_keywords(ticket_data.keywords)
+        ticket = await ticket_repo.create_ticket(_ticket_values(ticket_data), keywords=keywords)
         logger.info(f"Created ticket with ID: {ticket.id}")
 
-        return TicketResponse.from_orm(ticket)
+        response = TicketResponse.from_orm(ticket)
+        response.keywords = keywords
+        return response
 
     except Exception as e:
         logger.error(f"Error creating ticket: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to create ticket: {e!s}") from e
 
 
+@router.post("/bulk", response_model=BulkTicketResponse)
+async def create_tickets_bulk(request: Request, db: AsyncSession = Depends(get_db)) -> BulkTicketResponse:
+    """Create many tickets from a JSON array or NDJSON body.
+
+    Every item is validated up front; valid items are inserted in chunks of
+    ``TICKET_BULK_CHUNK_SIZE`` inside a single transaction, and invalid items
+    are reported back without blocking the rest of the batch.
+    """
+    try:
+        items = await _read_bulk_body(request)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid bulk body: {e!s}") from e
+
+    # Validate everything in one pass
+    now = datetime.utcnow()
+    rows: list[dict[str, Any]] = []
+    keywords: dict[str, list[str]] = {}
+    results: list[BulkTicketItemResult] = []
+    for index, item in enumerate(items):
+        try:
+            ticket_data = TicketCreateRequest.model_validate(item)
+        except ValidationError as e:
+            errors = e.errors(include_url=False, include_context=False, include_input=False)
+            results.append(BulkTicketItemResult(index=index, status="invalid", errors=errors))
+            continue
+
+        ticket_id = str(uuid4())
+        rows.append({**_ticket_values(ticket_data), "id": ticket_id, "created_at": now, "updated_at": now})
+        if ticket_data.keywords:
+            keywords[ticket_id] = ticket_data.keywords
+        results.append(BulkTicketItemResult(index=index, status="created", id=ticket_id))
+
+    try:
+        if rows:
+            ticket_repo = TicketRepository(db)
+            await ticket_repo.bulk_create_tickets(rows, chunk_size=BULK_CHUNK_SIZE, keywords=keywords)
+
+        logger.info(f"Bulk created {len(rows)} tickets ({len(items) - len(rows)} invalid)")
+        return BulkTicketResponse(created=len(rows), failed=len(items) - len(rows), results=results)
+
+    except Exception as e:
+        logger.error(f"Error bulk creating tickets: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to create tickets: {e!s}") from e
+
+
 @router.put("/{ticket_id}", response_model=TicketResponse)
 async def update_ticket(
     ticket_id: str, ticket_data: TicketUpdateRequest, db: AsyncSession = Depends(get_db)
@@ -202,37 +508,14 @@ async def update_ticket(
     """Update an existing ticket."""
     try:
         ticket_repo = TicketRepository(db)
-        ticket = await ticket_repo.get_ticket_by_id(ticket_id)
+
+        # Update only provided fields in a single UPDATE ... RETURNING
+        values = ticket_data.model_dump(mode="json", exclude_none=True)
+        ticket = await ticket_repo.update_ticket(ticket_id, values)
 
         if not ticket:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
-        # Update only provided fields
-        if ticket_data.name is not None:
-            ticket.name = ticket_data.name
-        if ticket_data.description is not None:
-            ticket.description = ticket_data.description
-        if ticket_data.error_message is not None:
-            ticket.error_message = ticket_data.error_message
-        if ticket_data.department is not None:
-            ticket.department = ticket_data.department.value
-        if ticket_data.severity is not None:
-            ticket.severity = ticket_data.severity.value
-        if ticket_data.status is not None:
-            ticket.status = ticket_data.status
-            # Set resolved_at if status is resolved/closed
-            if ticket_data.status in ["resolved", "closed"] and not ticket.resolved_at:
-                ticket.resolved_at = datetime.utcnow()
-        if ticket_data.assignee is not None:
-            ticket.assignee = ticket_data.assignee
-        if ticket_data.screenshot_url is not None:
-            ticket.screenshot_url = ticket_data.screenshot_url
-
-        ticket.updated_at = datetime.utcnow()
-
-        await db.commit()
-        await db.refresh(ticket)
-
         logger.info(f"Updated ticket {ticket_id}")
         return TicketResponse.from_orm(ticket)
 
@@ -268,14 +551,11 @@ async def delete_ticket(ticket_id: str, db: AsyncSession = Depends(get_db)) -> d
     """Delete a ticket."""
     try:
         ticket_repo = TicketRepository(db)
-        ticket = await ticket_repo.get_ticket_by_id(ticket_id)
+        deleted = await ticket_repo.delete_ticket(ticket_id)
 
-        if not ticket:
+        if not deleted:
             raise HTTPException(status_code=404, detail="Ticket not found")
 
-        await db.delete(ticket)
-        await db.commit()
-
         logger.info(f"Deleted ticket {ticket_id}")
         return {"message": "Ticket deleted successfully", "ticket_id": ticket_id}
 
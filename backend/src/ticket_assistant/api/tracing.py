@@ -0,0 +1,58 @@
+"""Server spans around each request, named after the route that handled it."""
+
+from opentelemetry import propagate
+from opentelemetry.trace import SpanKind
+from opentelemetry.trace import Status
+from opentelemetry.trace import StatusCode
+from starlette.types import ASGIApp
+from starlette.types import Message
+from starlette.types import Receive
+from starlette.types import Scope
+from starlette.types import Send
+
+from ticket_assistant.core import tracing
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per request while tracing is set up.
+
+    Repository, classifier and report delivery spans nest under it. An incoming
+    W3C ``traceparent`` header makes the request part of the caller's trace.
+    Newer FastAPI versions trace requests natively; their span is used instead.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # FastAPI releases with built-in telemetry open the server span themselves
+        if scope["type"] != "http" or tracing.tracer_provider is None or scope.get("fastapi.telemetry") is not None:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        carrier = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope["headers"]}
+        status_code = 500
+
+        async def status_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with tracing.tracer.start_as_current_span(
+            method,
+            context=propagate.extract(carrier),
+            kind=SpanKind.SERVER,
+            attributes={"http.request.method": method, "url.path": scope["path"]},
+        ) as span:
+            try:
+                await self.app(scope, receive, status_send)
+            finally:
+                route = getattr(scope.get("route"), "path", None)
+                if route:
+                    span.update_name(f"{method} {route}")
+                    span.set_attribute("http.route", route)
+                span.set_attribute("http.response.status_code", status_code)
+                if status_code >= 500:
+                    span.set_status(Status(StatusCode.ERROR))
@@ -0,0 +1,88 @@
+"""Event-loop lag monitor and blocking-call detector.
+
+A ticker coroutine sleeps ``LOOP_MONITOR_INTERVAL`` seconds at a time and
+records how late it wakes up in the ``event_loop_lag_seconds`` histogram.
+A watchdog thread watches the ticker's heartbeat: when the loop has not run
+the ticker for ``LOOP_BLOCK_THRESHOLD_MS`` it logs the loop thread's current
+stack, which names the synchronous call holding the loop while it still
+holds it.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from ticket_assistant.core.metrics import EVENT_LOOP_BLOCKS
+from ticket_assistant.core.metrics import EVENT_LOOP_LAG
+
+logger = logging.getLogger(__name__)
+
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() == "true"
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL", "0.1"))
+LOOP_BLOCK_THRESHOLD_MS = float(os.getenv("LOOP_BLOCK_THRESHOLD_MS", "250"))
+
+
+class LoopMonitor:
+    """Measure event-loop lag and log the stack of whatever blocks the loop for too long."""
+
+    def __init__(self, interval: float = LOOP_MONITOR_INTERVAL, block_threshold_ms: float = LOOP_BLOCK_THRESHOLD_MS):
+        self.interval = interval
+        self.block_threshold = block_threshold_ms / 1000
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._loop_thread: int | None = None
+        self._heartbeat = 0.0
+        self._reported_heartbeat = 0.0
+
+    async def run(self) -> None:
+        """Tick until stopped, recording the lag of every wake-up."""
+        while not self._stopping.is_set():
+            started = time.monotonic()
+            self._heartbeat = started
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - started - self.interval)
+            EVENT_LOOP_LAG.observe(lag)
+            if lag >= self.block_threshold:
+                EVENT_LOOP_BLOCKS.inc()
+                logger.warning(f"Event loop was blocked for {lag * 1000:.0f}ms")
+
+    def _watch(self) -> None:
+        """Watchdog thread: dump the loop thread's stack once per stall longer than the threshold."""
+        check_every = min(self.block_threshold / 2, self.interval)
+        while not self._stopping.wait(check_every):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.block_threshold or heartbeat == self._reported_heartbeat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self._reported_heartbeat = heartbeat
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(f"Event loop blocked for over {stalled * 1000:.0f}ms, loop thread is at:\n{stack}")
+
+    def start(self) -> None:
+        """Start the ticker on the running loop and the watchdog thread."""
+        self._stopping.clear()
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self.run())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(f"Event loop monitor started (block threshold {self.block_threshold * 1000:.0f}ms)")
+
+    async def stop(self) -> None:
+        """Stop the ticker and the watchdog thread."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        await asyncio.to_thread(self._watchdog.join)
+        self._task = None
+        self._watchdog = None
+        logger.info("Event loop monitor stopped")
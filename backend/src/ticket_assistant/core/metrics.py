@@ -0,0 +1,96 @@
+"""Prometheus metrics: request latency, SQL query timing, upstream call latency and event-loop lag.
+
+Metrics live in the default ``prometheus_client`` registry and are served by
+``GET /metrics``. With ``PROMETHEUS_MULTIPROC_DIR`` set (several uvicorn workers)
+the endpoint aggregates every worker's files instead.
+"""
+
+import os
+import time
+
+from prometheus_client import CONTENT_TYPE_LATEST
+from prometheus_client import REGISTRY
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Histogram
+from prometheus_client import generate_latest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve an HTTP request, by route template",
+    ["method", "route"],
+)
+HTTP_REQUESTS = Counter(
+    "http_requests",
+    "HTTP requests served, by route template and status code",
+    ["method", "route", "status"],
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Time to execute a SQL statement, by statement type",
+    ["statement"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+GROQ_REQUEST_DURATION = Histogram(
+    "groq_request_duration_seconds",
+    "Latency of Groq chat completion calls",
+    ["outcome"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 30.0),
+)
+GROQ_TOKENS = Counter(
+    "groq_tokens",
+    "Tokens used by Groq chat completions",
+    ["kind"],
+)
+TICKET_API_REQUEST_DURATION = Histogram(
+    "ticket_api_request_duration_seconds",
+    "Latency of ReportService calls to the external ticket API",
+    ["endpoint", "outcome"],
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a timer, sampled by the loop monitor",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_BLOCKS = Counter(
+    "event_loop_blocks",
+    "Times the event loop was blocked for longer than LOOP_BLOCK_THRESHOLD_MS",
+)
+
+STATEMENT_TYPES = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK", "PRAGMA"})
+
+
+def statement_type(statement: str) -> str:
+    """First keyword of a SQL statement, or ``OTHER``, as a low-cardinality label."""
+    words = statement.lstrip()[:10].split(None, 1)
+    keyword = words[0].upper() if words else ""
+    return keyword if keyword in STATEMENT_TYPES else "OTHER"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    DB_QUERY_DURATION.labels(statement_type(statement)).observe(time.perf_counter() - context._metrics_started)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Time every statement run on ``engine`` (the ``sync_engine`` of an async engine)."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Current metrics in the Prometheus text format, with its content type."""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -68,3 +68,4 @@ class DashboardStats(BaseModel):
     classification_accuracy: float  # percentage (0-100)
     department_distribution: dict[str, int]
     severity_distribution: dict[str, int]
+    top_keywords: dict[str, int] = {}  # keyword -> ticket count, most used first
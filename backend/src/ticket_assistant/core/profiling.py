@@ -0,0 +1,199 @@
+"""In-process sampling profiler and event-loop lag measurement.
+
+``StackSampler`` runs in a background thread and records the Python stack of
+the watched threads every few milliseconds through ``sys._current_frames``,
+so a live worker can be profiled without restarting it under a profiler and
+without any extra dependency. Samples are exported as speedscope JSON
+(https://www.speedscope.app) or as collapsed stacks for ``flamegraph.pl``.
+
+``loop_report`` measures how late the event loop wakes up sleepers (lag) and
+attributes the loop thread's samples to the innermost running coroutine, which
+points at handlers doing CPU-heavy or blocking work on the loop.
+"""
+
+import asyncio
+import inspect
+import os
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+# A code object's identity in reports: qualified name, file and first line
+Frame = tuple[str, str, int]
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+def _frame_key(frame) -> Frame:
+    code = frame.f_code
+    return (code.co_qualname, code.co_filename, code.co_firstlineno)
+
+
+def frame_label(frame: Frame) -> str:
+    """Human-readable frame name, e.g. ``TicketRepository.get_ticket_by_id (ticket_repository.py:42)``."""
+    name, filename, line = frame
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+class StackSampler:
+    """Background thread sampling the stacks of ``thread_ids`` (every thread but itself when None).
+
+    Each sample stores the root-first stack, the time since the previous
+    sample as its weight and, for the thread listed in ``coroutine_thread``,
+    the innermost coroutine on the stack.
+    """
+
+    def __init__(
+        self, interval: float = 0.005, thread_ids: set[int] | None = None, coroutine_thread: int | None = None
+    ):
+        self.interval = interval
+        self.thread_ids = thread_ids
+        self.coroutine_thread = coroutine_thread
+        self.samples: dict[int, list[tuple[tuple[Frame, ...], float]]] = {}
+        self.coroutines: Counter = Counter()
+        self.started = 0.0
+        self.stopped = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self.started = time.perf_counter()
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; ``join`` waits for the sample being taken to finish."""
+        self._stop.set()
+        self.stopped = time.perf_counter()
+
+    def join(self) -> None:
+        self._thread.join()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        previous = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight = now - previous
+            previous = now
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (self.thread_ids is not None and thread_id not in self.thread_ids):
+                    continue
+                stack = []
+                coroutine = None
+                while frame is not None:
+                    stack.append(_frame_key(frame))
+                    if coroutine is None and frame.f_code.co_flags & inspect.CO_COROUTINE:
+                        coroutine = stack[-1]
+                    frame = frame.f_back
+                stack.reverse()
+                self.samples.setdefault(thread_id, []).append((tuple(stack), weight))
+                if thread_id == self.coroutine_thread:
+                    self.coroutines[coroutine] += weight
+
+    def speedscope(self, name: str = "ticket-assistant") -> dict[str, Any]:
+        """Samples as a speedscope file, one sampled profile per thread, weights in milliseconds."""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames: list[dict[str, Any]] = []
+        index: dict[Frame, int] = {}
+        profiles = []
+        for thread_id, samples in self.samples.items():
+            stacks = []
+            weights = []
+            for stack, weight in samples:
+                for frame in stack:
+                    if frame not in index:
+                        index[frame] = len(frames)
+                        frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+                stacks.append([index[frame] for frame in stack])
+                weights.append(round(weight * 1000, 3))
+            profiles.append(
+                {
+                    "type": "sampled",
+                    "name": thread_names.get(thread_id, str(thread_id)),
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": round(sum(weights), 3),
+                    "samples": stacks,
+                    "weights": weights,
+                }
+            )
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": name,
+            "exporter": "ticket_assistant.core.profiling",
+            "shared": {"frames": frames},
+            "profiles": profiles,
+        }
+
+    def collapsed(self) -> str:
+        """Samples in the collapsed-stack format read by ``flamegraph.pl`` and speedscope, one line per stack."""
+        thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+        counts: Counter = Counter()
+        for thread_id, samples in self.samples.items():
+            root = thread_names.get(thread_id, str(thread_id))
+            for stack, _ in samples:
+                counts[";".join([root, *(frame_label(frame).replace(";", ":") for frame in stack)])] += 1
+        return "".join(f"{stack} {count}\n" for stack, count in counts.most_common())
+
+
+async def profile(seconds: float, interval: float = 0.005, all_threads: bool = False) -> StackSampler:
+    """Sample the event loop thread (or every thread) for ``seconds`` while the loop keeps serving."""
+    thread_ids = None if all_threads else {threading.get_ident()}
+    sampler = StackSampler(interval=interval, thread_ids=thread_ids)
+    sampler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        sampler.stop()
+        await asyncio.to_thread(sampler.join)
+    return sampler
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def loop_report(seconds: float, interval: float = 0.005, tick: float = 0.01, top: int = 20) -> dict[str, Any]:
+    """Event-loop lag percentiles and the coroutines that held the loop longest over ``seconds``.
+
+    Lag is how much later than requested a ``tick``-second sleep resumes. Loop
+    time is attributed to the innermost coroutine on the loop thread's stack;
+    time with no coroutine on the stack (waiting for I/O, running callbacks) is
+    reported as idle.
+    """
+    loop_thread = threading.get_ident()
+    sampler = StackSampler(interval=interval, thread_ids={loop_thread}, coroutine_thread=loop_thread)
+    lags = []
+    sampler.start()
+    try:
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            await asyncio.sleep(tick)
+            lags.append(max(0.0, time.perf_counter() - started - tick))
+    finally:
+        sampler.stop()
+        await asyncio.to_thread(sampler.join)
+
+    lags.sort()
+    sampled = sum(sampler.coroutines.values()) or 1.0
+    idle = sampler.coroutines.pop(None, 0.0)
+    # The report's own ticker is not application work
+    sampler.coroutines.pop(_frame_key(sys._getframe()), None)
+    return {
+        "seconds": round(sampler.stopped - sampler.started, 3),
+        "lag_ms": {
+            "p50": round(statistics.median(lags) * 1000, 3),
+            "p95": round(_percentile(lags, 0.95) * 1000, 3),
+            "p99": round(_percentile(lags, 0.99) * 1000, 3),
+            "max": round(lags[-1] * 1000, 3),
+        },
+        "idle_share": round(idle / sampled, 3),
+        "coroutines": [
+            {"coroutine": frame_label(frame), "loop_ms": round(weight * 1000, 2), "share": round(weight / sampled, 3)}
+            for frame, weight in sampler.coroutines.most_common(top)
+        ],
+    }
@@ -0,0 +1,194 @@
+"""OpenTelemetry tracing without a collector.
+
+Code creates spans through the OpenTelemetry API (``traced``, ``trace_methods``,
+``start_span``), which costs next to nothing until ``setup_tracing`` installs an
+SDK tracer provider. Finished spans go to a JSON-lines file (``TRACING_FILE``),
+to memory (tests and interactive analysis) or to the console. Summarize a file with::
+
+    python -m ticket_assistant.core.tracing traces.jsonl
+
+The SDK comes with the optional ``tracing`` extra; without it tracing stays off.
+"""
+
+import argparse
+import functools
+import inspect
+import json
+import logging
+import os
+import statistics
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from opentelemetry import trace
+
+logger = logging.getLogger(__name__)
+
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "false").lower() == "true"
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "file")  # file, memory or console
+TRACING_FILE = os.getenv("TRACING_FILE", "traces.jsonl")
+TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+
+tracer = trace.get_tracer("ticket_assistant")
+
+# Set by setup_tracing; None while tracing is off
+tracer_provider = None
+memory_exporter = None
+
+
+def start_span(name: str, **attributes: Any):
+    """Context manager for a child span of the current span."""
+    return tracer.start_as_current_span(name, attributes=attributes or None)
+
+
+def traced(name: str | None = None) -> Callable:
+    """Decorator running a coroutine function inside a span named ``name`` (its qualified name by default)."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with tracer.start_as_current_span(span_name):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def trace_methods(cls: type) -> type:
+    """Class decorator giving every coroutine method of ``cls`` a ``Class.method`` span."""
+    for attribute, value in list(vars(cls).items()):
+        if not attribute.startswith("__") and inspect.iscoroutinefunction(value):
+            setattr(cls, attribute, traced(f"{cls.__name__}.{attribute}")(value))
+    return cls
+
+
+class JsonLinesSpanExporter:
+    """Span exporter appending each finished span as one JSON line to ``path``."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Any]):
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        lines = "".join(span.to_json(indent=None) + "\n" for span in spans)
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as file:
+                file.write(lines)
+        except OSError as e:
+            logger.error(f"Failed to write spans to {self.path}: {e}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:  # noqa: ARG002
+        return True
+
+
+def setup_tracing(
+    enabled: bool = TRACING_ENABLED,
+    exporter: str = TRACING_EXPORTER,
+    sample_ratio: float = TRACING_SAMPLE_RATIO,
+    path: str = TRACING_FILE,
+):
+    """Install the SDK tracer provider and its exporter; returns the provider, or None when off.
+
+    ``sample_ratio`` of new traces are recorded; spans in a sampled request
+    (or under a sampled incoming ``traceparent``) are always kept together.
+    """
+    global tracer_provider, memory_exporter
+    if not enabled:
+        return None
+    if tracer_provider is not None:
+        return tracer_provider
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from opentelemetry.sdk.trace.sampling import ParentBased
+        from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+    except ImportError:
+        logger.warning("TRACING_ENABLED is set but opentelemetry-sdk is missing; spans are not recorded")
+        return None
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": "ticket-assistant"}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+    if exporter == "memory":
+        memory_exporter = InMemorySpanExporter()
+        provider.add_span_processor(SimpleSpanProcessor(memory_exporter))
+    elif exporter == "console":
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    else:
+        provider.add_span_processor(BatchSpanProcessor(JsonLinesSpanExporter(path)))
+        logger.info(f"Writing traces to {path} (sample ratio {sample_ratio})")
+
+    trace.set_tracer_provider(provider)
+    tracer_provider = provider
+    return provider
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans to the exporter."""
+    if tracer_provider is not None:
+        tracer_provider.force_flush()
+
+
+def summarize_spans(path: str) -> list[dict[str, Any]]:
+    """Count and duration percentiles (ms) per span name in a JSON-lines trace file, slowest total first."""
+    durations: dict[str, list[float]] = defaultdict(list)
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                span = json.loads(line)
+                durations[span["name"]].append(_duration_ms(span))
+
+    summary = []
+    for name, values in durations.items():
+        values.sort()
+        summary.append(
+            {
+                "name": name,
+                "count": len(values),
+                "total_ms": round(sum(values), 2),
+                "p50_ms": round(statistics.median(values), 2),
+                "p95_ms": round(values[min(len(values) - 1, int(len(values) * 0.95))], 2),
+                "max_ms": round(values[-1], 2),
+            }
+        )
+    return sorted(summary, key=lambda row: row["total_ms"], reverse=True)
+
+
+def _duration_ms(span: dict[str, Any]) -> float:
+    start = datetime.fromisoformat(span["start_time"].replace("Z", "+00:00"))
+    end = datetime.fromisoformat(span["end_time"].replace("Z", "+00:00"))
+    return (end - start).total_seconds() * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Summarize a JSON-lines trace file per span name")
+    parser.add_argument("path", nargs="?", default=TRACING_FILE)
+    args = parser.parse_args()
+    for row in summarize_spans(args.path):
+        print(
+            f"{row['name']:<60} count={row['count']:<6} total={row['total_ms']:>10.2f}ms "
+            f"p50={row['p50_ms']:>8.2f}ms p95={row['p95_ms']:>8.2f}ms max={row['max_ms']:>8.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,19 @@
 import logging
 import os
 
+from sqlalchemy import event
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.schema import CreateIndex
+
+from ticket_assistant.core.metrics import METRICS_ENABLED
+from ticket_assistant.core.metrics import instrument_engine
+from ticket_assistant.database import query_diagnostics
+from ticket_assistant.database.search import ensure_search_index
+from ticket_assistant.database.versions import ensure_version_columns
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +29,24 @@ engine = create_async_engine(
     future=True,
 )
 
+
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):  # noqa: ARG001
+    """Turn on foreign key enforcement so ON DELETE CASCADE runs in SQLite."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+
+if METRICS_ENABLED:
+    instrument_engine(engine.sync_engine)
+
+# Slow-query log (and N+1 detection in development) unless QUERY_DIAGNOSTICS=off
+query_diagnostics.instrument_engine(engine.sync_engine)
+
+
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -46,11 +73,61 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Dependency for endpoints that manage their own session lifetime (e.g. streaming)."""
+    return AsyncSessionLocal
+
+
+def _rebuild_sqlite_classifications_fk(sync_conn) -> None:
+    """Recreate the SQLite classifications table if its foreign key lacks ON DELETE CASCADE.
+
+    SQLite cannot alter constraints in place, so databases created before the
+    cascade was declared are copied into a freshly created table.
+    """
+    foreign_keys = inspect(sync_conn).get_foreign_keys("classifications")
+    if not foreign_keys or all(fk.get("options", {}).get("ondelete") == "CASCADE" for fk in foreign_keys):
+        return
+
+    table = Base.metadata.tables["classifications"]
+    columns = ", ".join(column.name for column in table.columns)
+    sync_conn.exec_driver_sql("ALTER TABLE classifications RENAME TO classifications_old")
+    # Index names are global in SQLite and stay with the renamed table
+    for index in table.indexes:
+        sync_conn.exec_driver_sql(f"DROP INDEX IF EXISTS {index.name}")
+    table.create(sync_conn)
+    # Orphans could exist while foreign keys were unenforced; they are dropped here
+    sync_conn.exec_driver_sql(
+        f"INSERT INTO classifications ({columns}) SELECT {columns} FROM classifications_old "  # noqa: S608
+        "WHERE ticket_id IN (SELECT id FROM tickets)"
+    )
+    sync_conn.exec_driver_sql("DROP TABLE classifications_old")
+    logger.info("Rebuilt classifications table with ON DELETE CASCADE")
+
+
+def _create_missing_indexes(sync_conn) -> None:
+    """Create indexes declared after a table was created; ``create_all`` skips existing tables.
+
+    ``IF NOT EXISTS`` rather than ``checkfirst``: reflection does not report
+    expression indexes on SQLite, so they would be created twice.
+    """
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            sync_conn.execute(CreateIndex(index, if_not_exists=True))
+
+
 async def init_db():
     """Initialize database tables."""
     async with engine.begin() as conn:
         # Import all models to ensure they are registered
         await conn.run_sync(Base.metadata.create_all)
+        # Databases created before classifications had updated_at, or with the former change counters
+        await conn.run_sync(ensure_version_columns)
+        if engine.dialect.name == "sqlite":
+            await conn.run_sync(_rebuild_sqlite_classifications_fk)
+        # Indexes declared after the tables existed, e.g. the one ON DELETE CASCADE needs
+        await conn.run_sync(_create_missing_indexes)
+        # Databases created before full-text search existed
+        await conn.run_sync(ensure_search_index)
         logger.info("Database tables created successfully")
 
 
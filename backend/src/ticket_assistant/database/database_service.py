@@ -25,6 +25,7 @@ class DatabaseDashboardService:
             # Get distributions
             department_distribution = await self.ticket_repo.get_department_distribution()
             severity_distribution = await self.ticket_repo.get_severity_distribution()
+            top_keywords = await self.ticket_repo.get_top_keywords()
 
             # Get average resolution time
             avg_resolution_time = await self.ticket_repo.get_average_resolution_time()
@@ -40,6 +41,7 @@ class DatabaseDashboardService:
                 classification_accuracy=classification_accuracy,
                 department_distribution=department_distribution,
                 severity_distribution=severity_distribution,
+                top_keywords=top_keywords,
             )
 
             logger.info(f"Dashboard stats calculated: {total_tickets} total tickets")
@@ -0,0 +1,106 @@
+"""Ticket keywords: normalization and the incrementally maintained keyword counts.
+
+Keywords live in ``ticket_keywords`` with a ``(keyword, ticket_id)`` primary key,
+which doubles as the inverted index from a keyword to its tickets. The
+``keyword_counts`` aggregate is kept up to date by triggers on that table, so
+the dashboard never has to scan it; cascaded ticket deletes fire them too.
+
+On PostgreSQL the triggers run once per statement and add one delta per
+keyword, so a bulk insert locks each count row once rather than once per
+ticket. SQLite only has row triggers, but it serializes writers anyway.
+"""
+
+import logging
+from collections.abc import Iterable
+
+from sqlalchemy.engine import Connection
+
+logger = logging.getLogger(__name__)
+
+MAX_KEYWORD_LENGTH = 100
+
+_SQLITE_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS ticket_keywords_count_insert AFTER INSERT ON ticket_keywords BEGIN
+        INSERT INTO keyword_counts(keyword, ticket_count) VALUES (new.keyword, 1)
+        ON CONFLICT(keyword) DO UPDATE SET ticket_count = ticket_count + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS ticket_keywords_count_delete AFTER DELETE ON ticket_keywords BEGIN
+        UPDATE keyword_counts SET ticket_count = ticket_count - 1 WHERE keyword = old.keyword;
+        DELETE FROM keyword_counts WHERE keyword = old.keyword AND ticket_count <= 0;
+    END
+    """,
+]
+
+# Statement-level triggers with transition tables: one delta per keyword per
+# statement, applied in keyword order so that concurrent bulk writes lock the
+# shared count rows in the same order instead of deadlocking. PostgreSQL does
+# not allow transition tables on a trigger for more than one event.
+_POSTGRESQL_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION ticket_keywords_count_insert() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO keyword_counts(keyword, ticket_count)
+        SELECT keyword, count(*) FROM inserted GROUP BY keyword ORDER BY keyword
+        ON CONFLICT (keyword) DO UPDATE SET ticket_count = keyword_counts.ticket_count + EXCLUDED.ticket_count;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE OR REPLACE FUNCTION ticket_keywords_count_delete() RETURNS trigger AS $$
+    BEGIN
+        PERFORM 1 FROM keyword_counts
+        WHERE keyword IN (SELECT keyword FROM deleted)
+        ORDER BY keyword
+        FOR UPDATE;
+        UPDATE keyword_counts SET ticket_count = keyword_counts.ticket_count - delta.ticket_count
+        FROM (SELECT keyword, count(*) AS ticket_count FROM deleted GROUP BY keyword) AS delta
+        WHERE keyword_counts.keyword = delta.keyword;
+        DELETE FROM keyword_counts WHERE keyword IN (SELECT keyword FROM deleted) AND ticket_count <= 0;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    # The former row-level trigger upserted a count row once per inserted keyword
+    "DROP TRIGGER IF EXISTS ticket_keywords_count ON ticket_keywords",
+    "DROP FUNCTION IF EXISTS ticket_keywords_count()",
+    "DROP TRIGGER IF EXISTS ticket_keywords_count_insert ON ticket_keywords",
+    """
+    CREATE TRIGGER ticket_keywords_count_insert AFTER INSERT ON ticket_keywords
+    REFERENCING NEW TABLE AS inserted
+    FOR EACH STATEMENT EXECUTE FUNCTION ticket_keywords_count_insert()
+    """,
+    "DROP TRIGGER IF EXISTS ticket_keywords_count_delete ON ticket_keywords",
+    """
+    CREATE TRIGGER ticket_keywords_count_delete AFTER DELETE ON ticket_keywords
+    REFERENCING OLD TABLE AS deleted
+    FOR EACH STATEMENT EXECUTE FUNCTION ticket_keywords_count_delete()
+    """,
+]
+
+
+def normalize_keywords(keywords: Iterable[str]) -> list[str]:
+    """Lower-case, trim and de-duplicate keywords, keeping their first-seen order."""
+    normalized: dict[str, None] = {}
+    for keyword in keywords:
+        keyword = " ".join(keyword.split()).lower()[:MAX_KEYWORD_LENGTH]
+        if keyword:
+            normalized[keyword] = None
+    return list(normalized)
+
+
+def ensure_keyword_counts(connection: Connection) -> None:
+    """Create the triggers that maintain ``keyword_counts`` for the current dialect."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        statements = _SQLITE_DDL
+    elif dialect == "postgresql":
+        statements = _POSTGRESQL_DDL
+    else:
+        logger.warning(f"Keyword counts are not maintained on {dialect}")
+        return
+    for statement in statements:
+        connection.exec_driver_sql(statement)
@@ -6,13 +6,20 @@ from uuid import uuid4
 from sqlalchemy import DateTime
 from sqlalchemy import Float
 from sqlalchemy import ForeignKey
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import LargeBinary
 from sqlalchemy import String
 from sqlalchemy import Text
+from sqlalchemy import event
+from sqlalchemy import func
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import relationship
 
 from ticket_assistant.database.connection import Base
+from ticket_assistant.database.keywords import ensure_keyword_counts
+from ticket_assistant.database.search import ensure_search_index
 
 
 class Ticket(Base):
@@ -31,33 +38,154 @@ class Ticket(Base):
     screenshot_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
     )
     resolved_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
     # Relationships
     classifications: Mapped[list["Classification"]] = relationship(
-        "Classification", back_populates="ticket", cascade="all, delete-orphan"
+        "Classification", back_populates="ticket", cascade="all, delete-orphan", passive_deletes=True
     )
 
     def __repr__(self):
         return f"<Ticket(id={self.id}, name={self.name}, status={self.status})>"
 
 
+# Retention selects finished tickets by status and resolution time (updated_at
+# for tickets resolved before resolved_at existed); same expression as the purge
+Index("ix_tickets_status_resolved", Ticket.status, func.coalesce(Ticket.resolved_at, Ticket.updated_at))
+
+
+@event.listens_for(Ticket.__table__, "after_create")
+def _create_search_index(target, connection, **kw):  # noqa: ARG001
+    """Create the full-text search index together with the tickets table."""
+    ensure_search_index(connection)
+
+
 class Classification(Base):
     """Classification database model."""
 
     __tablename__ = "classifications"
 
     id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
-    ticket_id: Mapped[str] = mapped_column(String, ForeignKey("tickets.id"), nullable=False)
+    ticket_id: Mapped[str] = mapped_column(
+        String, ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False, index=True
+    )
     confidence: Mapped[float] = mapped_column(Float, nullable=False)
     reasoning: Mapped[str] = mapped_column(Text, nullable=False)
     suggested_actions: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow, index=True
+    )
 
     # Relationships
     ticket: Mapped["Ticket"] = relationship("Ticket", back_populates="classifications")
 
     def __repr__(self):
         return f"<Classification(id={self.id}, ticket_id={self.ticket_id}, confidence={self.confidence})>"
+
+
+class TicketKeyword(Base):
+    """Keyword attached to a ticket; the primary key is the keyword -> ticket inverted index."""
+
+    __tablename__ = "ticket_keywords"
+    __table_args__ = (Index("ix_ticket_keywords_ticket_id", "ticket_id"),)
+
+    keyword: Mapped[str] = mapped_column(String(100), primary_key=True)
+    ticket_id: Mapped[str] = mapped_column(String, ForeignKey("tickets.id", ondelete="CASCADE"), primary_key=True)
+
+    def __repr__(self):
+        return f"<TicketKeyword(keyword={self.keyword}, ticket_id={self.ticket_id})>"
+
+
+class KeywordCount(Base):
+    """Number of tickets per keyword, maintained by triggers on ``ticket_keywords``."""
+
+    __tablename__ = "keyword_counts"
+    __table_args__ = (Index("ix_keyword_counts_ticket_count", "ticket_count"),)
+
+    keyword: Mapped[str] = mapped_column(String(100), primary_key=True)
+    ticket_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<KeywordCount(keyword={self.keyword}, ticket_count={self.ticket_count})>"
+
+
+@event.listens_for(TicketKeyword.__table__, "after_create")
+def _create_keyword_count_triggers(target, connection, **kw):  # noqa: ARG001
+    """Create the keyword count triggers together with the ticket_keywords table."""
+    ensure_keyword_counts(connection)
+
+
+class OutboxMessage(Base):
+    """Ticket waiting to be delivered to the external ticket API (transactional outbox).
+
+    Written in the same transaction as its ticket and drained by the outbox
+    dispatcher. ``status`` is ``pending``, ``delivered`` or ``dead`` (gave up).
+    """
+
+    __tablename__ = "outbox_messages"
+    __table_args__ = (Index("ix_outbox_messages_due", "status", "next_attempt_at"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
+    ticket_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    idempotency_key: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)  # JSON string
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    delivered_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<OutboxMessage(id={self.id}, ticket_id={self.ticket_id}, status={self.status})>"
+
+
+class ClassificationJob(Base):
+    """Queued classification of a ticket created in ``pending_classification`` state.
+
+    Claimed by the classification workers, which fill in the ticket's department
+    and severity. ``status`` is ``pending``, ``done`` or ``failed`` (gave up).
+    """
+
+    __tablename__ = "classification_jobs"
+    __table_args__ = (Index("ix_classification_jobs_due", "status", "next_attempt_at"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid4()))
+    ticket_id: Mapped[str] = mapped_column(
+        String, ForeignKey("tickets.id", ondelete="CASCADE"), nullable=False, unique=True
+    )
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    next_attempt_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    outbox_payload: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string, forwarded when done
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<ClassificationJob(id={self.id}, ticket_id={self.ticket_id}, status={self.status})>"
+
+
+class IdempotencyRecord(Base):
+    """Response stored for an ``Idempotency-Key`` so retried requests replay it.
+
+    ``status`` is ``in_flight`` while the first request runs and ``completed``
+    once its response is stored; rows are purged after ``expires_at``.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of method, path and header
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)  # sha256 of query string and body
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="in_flight")
+    response_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    response_headers: Mapped[str | None] = mapped_column(Text, nullable=True)  # JSON string
+    response_body: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<IdempotencyRecord(key={self.key}, status={self.status})>"
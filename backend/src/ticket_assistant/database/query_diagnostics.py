@@ -0,0 +1,191 @@
+"""Slow-query log and per-request N+1 / fan-out detection.
+
+``QUERY_DIAGNOSTICS`` selects the mode:
+
+- ``production`` (default): statements slower than ``SLOW_QUERY_THRESHOLD_MS``
+  are logged with the route that issued them and the database's EXPLAIN plan,
+  and kept in ``slow_queries``. Their parameters (ticket text, assignees) are
+  redacted.
+- ``development``: as above with parameters, and each request's statements are also counted.
+  A request running one statement shape more than ``N_PLUS_ONE_THRESHOLD``
+  times (a query per row) or more than ``QUERY_FANOUT_THRESHOLD`` statements in
+  total (fan-out) is logged as a warning and kept in ``findings``.
+- ``off``: nothing is recorded.
+
+Requests are scoped by ``QueryDiagnosticsMiddleware``; statements outside a
+request (startup, background workers) are only checked against the slow threshold.
+"""
+
+import logging
+import os
+import re
+import time
+from collections import Counter
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import UTC
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+QUERY_DIAGNOSTICS = os.getenv("QUERY_DIAGNOSTICS", "production").lower()  # off, production or development
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "500"))
+N_PLUS_ONE_THRESHOLD = int(os.getenv("N_PLUS_ONE_THRESHOLD", "5"))
+QUERY_FANOUT_THRESHOLD = int(os.getenv("QUERY_FANOUT_THRESHOLD", "5"))
+
+# Most recent slow statements and request findings, newest last
+slow_queries: deque[dict[str, Any]] = deque(maxlen=100)
+findings: deque[dict[str, Any]] = deque(maxlen=100)
+
+EXPLAINABLE = frozenset({"SELECT", "WITH", "INSERT", "UPDATE", "DELETE"})
+MAX_PARAMETERS_LENGTH = 500
+REDACTED = "<redacted>"
+_EXPLAIN_SAVEPOINT = "query_diagnostics_explain"
+
+_WHITESPACE = re.compile(r"\s+")
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LISTS = re.compile(r"\(\s*(?:\?|%s|\$\d+|:\w+|%\(\w+\)s)(?:\s*,\s*(?:\?|%s|\$\d+|:\w+|%\(\w+\)s))*\s*\)")
+
+
+@dataclass
+class RequestQueries:
+    """Statements run while serving one request."""
+
+    method: str
+    scope: dict[str, Any] = field(repr=False)
+    statements: Counter = field(default_factory=Counter)
+
+    @property
+    def route(self) -> str:
+        """Route template once the router has matched, the raw path before that."""
+        route = getattr(self.scope.get("route"), "path", None)
+        return f"{self.method} {route or self.scope.get('path', '')}"
+
+
+_current_request: ContextVar[RequestQueries | None] = ContextVar("query_diagnostics_request", default=None)
+
+
+def normalize_statement(statement: str) -> str:
+    """Statement shape: whitespace collapsed, literals and expanded ``IN`` lists replaced by placeholders."""
+    statement = _WHITESPACE.sub(" ", statement.strip())
+    statement = _LITERALS.sub("?", statement)
+    return _PLACEHOLDER_LISTS.sub("(?)", statement)
+
+
+def _explain(conn, statement: str, parameters: Any) -> str:
+    """The database's plan for ``statement``, run on a separate cursor of the same connection.
+
+    On PostgreSQL a failed statement aborts the whole transaction, so EXPLAIN runs
+    inside a savepoint that is rolled back on failure; the request's next
+    statement runs as if EXPLAIN had never been tried.
+    """
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    elif dialect == "postgresql":
+        prefix = "EXPLAIN "
+    else:
+        return f"EXPLAIN not supported on {dialect}"
+
+    savepoint = dialect == "postgresql"
+    cursor = conn.connection.cursor()
+    try:
+        if savepoint:
+            cursor.execute(f"SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception:
+            if savepoint:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+            raise
+        finally:
+            if savepoint:
+                cursor.execute(f"RELEASE SAVEPOINT {_EXPLAIN_SAVEPOINT}")
+    except Exception as e:
+        return f"EXPLAIN failed: {e!s}"
+    finally:
+        cursor.close()
+    # SQLite rows are (id, parent, notused, detail); PostgreSQL returns one text column
+    return "\n".join(str(row[-1]) for row in rows)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    context._diagnostics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+    elapsed_ms = (time.perf_counter() - context._diagnostics_started) * 1000
+    request = _current_request.get()
+    if request is not None and QUERY_DIAGNOSTICS == "development":
+        request.statements[normalize_statement(statement)] += 1
+
+    if elapsed_ms < SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    keyword = statement.lstrip()[:10].split(None, 1)
+    plan = None
+    if not executemany and keyword and keyword[0].upper() in EXPLAINABLE:
+        plan = _explain(conn, statement, parameters)
+    entry = {
+        "at": datetime.now(UTC).isoformat(),
+        "duration_ms": round(elapsed_ms, 2),
+        "route": request.route if request is not None else None,
+        "statement": statement,
+        "parameters": repr(parameters)[:MAX_PARAMETERS_LENGTH] if QUERY_DIAGNOSTICS == "development" else REDACTED,
+        "plan": plan,
+    }
+    slow_queries.append(entry)
+    logger.warning(
+        f"Slow query ({entry['duration_ms']}ms) in {entry['route'] or 'no request'}: {statement}\n"
+        f"  parameters: {entry['parameters']}\n  plan:\n    " + (plan or "n/a").replace("\n", "\n    ")
+    )
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Watch every statement run on ``engine`` (the ``sync_engine`` of an async engine) unless diagnostics are off."""
+    if QUERY_DIAGNOSTICS == "off":
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def check_request(request: RequestQueries) -> list[dict[str, Any]]:
+    """Flag repeated statement shapes (N+1) and too many statements (fan-out) in one request."""
+    problems = []
+    for statement, count in request.statements.most_common():
+        if count <= N_PLUS_ONE_THRESHOLD:
+            break
+        problems.append({"kind": "n_plus_one", "route": request.route, "count": count, "statement": statement})
+
+    total = sum(request.statements.values())
+    if total > QUERY_FANOUT_THRESHOLD:
+        problems.append({"kind": "fan_out", "route": request.route, "count": total, "statement": None})
+
+    for problem in problems:
+        findings.append(problem)
+        if problem["kind"] == "n_plus_one":
+            logger.warning(f"Possible N+1 in {problem['route']}: {problem['count']}x {problem['statement']}")
+        else:
+            logger.warning(f"Query fan-out in {problem['route']}: {problem['count']} statements in one request")
+    return problems
+
+
+@contextmanager
+def track_request(method: str, scope: dict[str, Any]):
+    """Attribute statements run inside the block to one request and check them on exit (development mode)."""
+    request = RequestQueries(method, scope)
+    token = _current_request.set(request)
+    try:
+        yield request
+    finally:
+        _current_request.reset(token)
+        if QUERY_DIAGNOSTICS == "development":
+            check_request(request)
@@ -0,0 +1,167 @@
+"""Classification job repository for tickets waiting on background classification."""
+
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import Row
+from sqlalchemy import case
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ticket_assistant.core.models import ClassificationResponse
+from ticket_assistant.core.models import Department
+from ticket_assistant.core.models import ErrorSeverity
+from ticket_assistant.database.models import Classification
+from ticket_assistant.database.models import ClassificationJob
+from ticket_assistant.database.models import Ticket
+from ticket_assistant.database.repositories.outbox_repository import OutboxRepository
+
+# Ticket status while its classification job is outstanding
+PENDING_CLASSIFICATION = "pending_classification"
+
+JOB_PENDING = "pending"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+class ClassificationJobRepository:
+    """Repository for classification job database operations."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def add(self, ticket_id: str, outbox_payload: dict[str, Any] | None = None) -> ClassificationJob:
+        """Stage a job in the current transaction; the caller commits it with its ticket.
+
+        ``outbox_payload`` is queued for the external ticket API once the ticket
+        is classified, with the department and severity filled in.
+        """
+        job = ClassificationJob(
+            ticket_id=ticket_id,
+            status=JOB_PENDING,
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+            outbox_payload=json.dumps(outbox_payload) if outbox_payload is not None else None,
+        )
+        self.session.add(job)
+        return job
+
+    async def claim_due(self, limit: int, lease: float = 120.0) -> Sequence[Row]:
+        """Claim up to ``limit`` due jobs, leasing them for ``lease`` seconds.
+
+        Returns the job id, ticket id and attempt count together with the ticket
+        text the classifier needs. A worker that dies mid-job leaves it to be
+        picked up again once the lease expires.
+        """
+        now = datetime.utcnow()
+        due = (
+            select(ClassificationJob.id)
+            .where(ClassificationJob.status == JOB_PENDING, ClassificationJob.next_attempt_at <= now)
+            .order_by(ClassificationJob.next_attempt_at)
+            .limit(limit)
+        )
+        result = await self.session.execute(
+            update(ClassificationJob)
+            .where(
+                ClassificationJob.id.in_(due.scalar_subquery()),
+                ClassificationJob.status == JOB_PENDING,
+                ClassificationJob.next_attempt_at <= now,
+            )
+            .values(next_attempt_at=now + timedelta(seconds=lease), attempts=ClassificationJob.attempts + 1)
+            .returning(ClassificationJob.id, ClassificationJob.ticket_id, ClassificationJob.attempts)
+            .execution_options(synchronize_session=False)
+        )
+        claimed = {row.id: row for row in result.all()}
+        await self.session.commit()
+        if not claimed:
+            return []
+
+        result = await self.session.execute(
+            select(
+                ClassificationJob.id,
+                ClassificationJob.ticket_id,
+                ClassificationJob.attempts,
+                Ticket.description,
+                Ticket.error_message,
+            )
+            .join(Ticket, Ticket.id == ClassificationJob.ticket_id)
+            .where(ClassificationJob.id.in_(claimed))
+        )
+        return result.all()
+
+    async def complete(self, job_id: str, classification: ClassificationResponse) -> None:
+        """Apply a classification to the job's ticket and finish the job in one transaction.
+
+        The ticket moves from ``pending_classification`` to ``open``; a status set
+        by someone else in the meantime is left alone.
+        """
+        job = await self.session.get(ClassificationJob, job_id)
+        if job is None or job.status != JOB_PENDING:
+            return
+        await self._finish(job, classification.department, classification.severity)
+        self.session.add(
+            Classification(
+                id=str(uuid4()),
+                ticket_id=job.ticket_id,
+                confidence=classification.confidence,
+                reasoning=classification.reasoning,
+                suggested_actions=json.dumps(classification.suggested_actions),
+                created_at=datetime.utcnow(),
+            )
+        )
+        job.status = JOB_DONE
+        job.last_error = None
+        await self.session.commit()
+
+    async def mark_failed(self, job_id: str, error: str, retry_at: datetime | None) -> None:
+        """Record a failed attempt; retry at ``retry_at``, or give up when it is None.
+
+        A ticket whose job gives up is opened (and forwarded) with the default
+        department and severity so it is not stuck waiting forever.
+        """
+        job = await self.session.get(ClassificationJob, job_id)
+        if job is None:
+            return
+        job.last_error = error[:1000]
+        if retry_at is None:
+            await self._finish(job, Department.GENERAL, ErrorSeverity.MEDIUM)
+            job.status = JOB_FAILED
+        else:
+            job.next_attempt_at = retry_at
+        await self.session.commit()
+
+    async def _finish(self, job: ClassificationJob, department: Department, severity: ErrorSeverity) -> None:
+        """Classify the job's ticket, open it if it is still pending, and queue its delivery."""
+        await self.session.execute(
+            update(Ticket)
+            .where(Ticket.id == job.ticket_id)
+            .values(
+                department=department.value,
+                severity=severity.value,
+                status=case((Ticket.status == PENDING_CLASSIFICATION, "open"), else_=Ticket.status),
+                updated_at=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if job.outbox_payload is not None:
+            payload = {**json.loads(job.outbox_payload), "department": department.value, "severity": severity.value}
+            OutboxRepository(self.session).add(payload, idempotency_key=job.ticket_id, ticket_id=job.ticket_id)
+        job.completed_at = datetime.utcnow()
+
+    async def get_job_for_ticket(self, ticket_id: str) -> ClassificationJob | None:
+        """Get the classification job of a ticket."""
+        result = await self.session.execute(select(ClassificationJob).where(ClassificationJob.ticket_id == ticket_id))
+        return result.scalar_one_or_none()
+
+    async def get_status_counts(self) -> dict[str, int]:
+        """Get the number of jobs per status."""
+        result = await self.session.execute(
+            select(ClassificationJob.status, func.count(ClassificationJob.id)).group_by(ClassificationJob.status)
+        )
+        return {row[0]: row[1] for row in result.fetchall()}
@@ -0,0 +1,112 @@
+"""Outbox repository for queued deliveries to the external ticket API."""
+
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import Row
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ticket_assistant.database.models import OutboxMessage
+
+OUTBOX_PENDING = "pending"
+OUTBOX_DELIVERED = "delivered"
+OUTBOX_DEAD = "dead"
+
+
+class OutboxRepository:
+    """Repository for outbox database operations."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def add(self, payload: dict[str, Any], idempotency_key: str, ticket_id: str | None = None) -> OutboxMessage:
+        """Stage a message in the current transaction; the caller commits it with its ticket."""
+        message = OutboxMessage(
+            ticket_id=ticket_id,
+            idempotency_key=idempotency_key,
+            payload=json.dumps(payload),
+            status=OUTBOX_PENDING,
+            attempts=0,
+            next_attempt_at=datetime.utcnow(),
+        )
+        self.session.add(message)
+        return message
+
+    async def claim_due(self, limit: int, lease: float = 60.0) -> Sequence[Row]:
+        """Claim up to ``limit`` due messages by pushing their next attempt ``lease`` seconds out.
+
+        The push is a lease: a dispatcher that dies mid-batch leaves the messages
+        to be retried once it expires, and a second dispatcher skips them meanwhile.
+        """
+        now = datetime.utcnow()
+        due = (
+            select(OutboxMessage.id)
+            .where(OutboxMessage.status == OUTBOX_PENDING, OutboxMessage.next_attempt_at <= now)
+            .order_by(OutboxMessage.next_attempt_at)
+            .limit(limit)
+        )
+        result = await self.session.execute(
+            update(OutboxMessage)
+            .where(
+                OutboxMessage.id.in_(due.scalar_subquery()),
+                OutboxMessage.status == OUTBOX_PENDING,
+                OutboxMessage.next_attempt_at <= now,
+            )
+            .values(next_attempt_at=now + timedelta(seconds=lease), attempts=OutboxMessage.attempts + 1)
+            .returning(OutboxMessage.id, OutboxMessage.idempotency_key, OutboxMessage.payload, OutboxMessage.attempts)
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await self.session.commit()
+        return rows
+
+    async def mark_delivered(self, message_ids: Sequence[str]) -> None:
+        """Mark messages as delivered."""
+        if not message_ids:
+            return
+        await self.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(message_ids))
+            .values(status=OUTBOX_DELIVERED, delivered_at=datetime.utcnow(), last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+
+    async def mark_failed(self, message_id: str, error: str, retry_at: datetime | None) -> None:
+        """Record a failed attempt; retry at ``retry_at``, or dead-letter the message when it is None."""
+        values: dict[str, Any] = {"last_error": error[:1000]}
+        if retry_at is None:
+            values["status"] = OUTBOX_DEAD
+        else:
+            values["next_attempt_at"] = retry_at
+        await self.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.id == message_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+
+    async def requeue_dead(self) -> int:
+        """Move every dead-lettered message back to pending with a fresh attempt budget."""
+        result = await self.session.execute(
+            update(OutboxMessage)
+            .where(OutboxMessage.status == OUTBOX_DEAD)
+            .values(status=OUTBOX_PENDING, attempts=0, next_attempt_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def get_status_counts(self) -> dict[str, int]:
+        """Get the number of messages per status."""
+        result = await self.session.execute(
+            select(OutboxMessage.status, func.count(OutboxMessage.id)).group_by(OutboxMessage.status)
+        )
+        return {row[0]: row[1] for row in result.fetchall()}
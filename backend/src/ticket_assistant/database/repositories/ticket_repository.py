@@ -1,15 +1,78 @@
 """Ticket repository for database operations."""
 
+import asyncio
+from collections.abc import AsyncIterator
+from collections.abc import Mapping
+from collections.abc import Sequence
 from datetime import datetime
+from typing import Any
 
+from sqlalchemy import ColumnElement
+from sqlalchemy import CompoundSelect
+from sqlalchemy import Row
+from sqlalchemy import Select
 from sqlalchemy import and_
+from sqlalchemy import delete
 from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import intersect
 from sqlalchemy import select
+from sqlalchemy import union
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ticket_assistant.core.tracing import start_span
+from ticket_assistant.core.tracing import trace_methods
+from ticket_assistant.database.keywords import normalize_keywords
+from ticket_assistant.database.models import KeywordCount
 from ticket_assistant.database.models import Ticket
+from ticket_assistant.database.models import TicketKeyword
+from ticket_assistant.database.repositories.classification_job_repository import ClassificationJobRepository
+from ticket_assistant.database.repositories.outbox_repository import OutboxRepository
 
+# Statuses that mark a ticket as finished and stamp ``resolved_at``
+RESOLVED_STATUSES = ("resolved", "closed")
 
+
+def build_ticket_filters(
+    status: str | None = None,
+    department: str | None = None,
+    severity: str | None = None,
+    assignee: str | None = None,
+    created_before: datetime | None = None,
+    keywords: Sequence[str] | None = None,
+    match_all_keywords: bool = True,
+) -> list[ColumnElement[bool]]:
+    """Build WHERE conditions for the common ticket filters, skipping unset ones."""
+    conditions: list[ColumnElement[bool]] = []
+    if status:
+        conditions.append(Ticket.status == status)
+    if department:
+        conditions.append(Ticket.department == department)
+    if severity:
+        conditions.append(Ticket.severity == severity)
+    if assignee:
+        conditions.append(Ticket.assignee == assignee)
+    if created_before:
+        conditions.append(Ticket.created_at < created_before)
+    if keywords := normalize_keywords(keywords or ()):
+        conditions.append(Ticket.id.in_(keyword_ticket_ids(keywords, match_all=match_all_keywords)))
+    return conditions
+
+
+def keyword_ticket_ids(keywords: Sequence[str], match_all: bool = True) -> Select | CompoundSelect:
+    """Ids of tickets tagged with all (or any) of ``keywords``.
+
+    Each keyword is an index-only range scan of the ``(keyword, ticket_id)``
+    primary key; the scans are intersected (all) or unioned (any).
+    """
+    selects = [select(TicketKeyword.ticket_id).where(TicketKeyword.keyword == k) for k in normalize_keywords(keywords)]
+    if len(selects) == 1:
+        return selects[0]
+    return intersect(*selects) if match_all else union(*selects)
+
+
+@trace_methods
 class TicketRepository:
     """Repository for ticket database operations."""
 
@@ -71,27 +134,194 @@ class TicketRepository:
         )
         return list(result.scalars().all())
 
-    async def create_ticket(self, ticket_data: dict) -> Ticket:
-        """Create a new ticket."""
+    async def create_ticket(
+        self,
+        ticket_data: dict,
+        keywords: Sequence[str] = (),
+        outbox_payload: dict[str, Any] | None = None,
+        queue_classification: bool = False,
+    ) -> Ticket:
+        """Create a new ticket, with its keywords, in one transaction.
+
+        With ``outbox_payload`` the ticket is also queued for delivery to the
+        external ticket API in that same transaction, keyed by the ticket id.
+        With ``queue_classification`` a classification job is queued instead and
+        the delivery waits until the workers have classified the ticket.
+        """
         ticket = Ticket(**ticket_data)
         self.session.add(ticket)
-        await self.session.commit()
-        await self.session.refresh(ticket)
+        if keywords:
+            await self.session.flush()
+            await self._insert_keywords({ticket.id: keywords})
+        if queue_classification:
+            # The job references the ticket, so the ticket row must be written first
+            await self.session.flush()
+            ClassificationJobRepository(self.session).add(ticket.id, outbox_payload=outbox_payload)
+        elif outbox_payload is not None:
+            OutboxRepository(self.session).add(outbox_payload, idempotency_key=ticket.id, ticket_id=ticket.id)
+        with start_span("commit"):
+            await self.session.commit()
+        with start_span("refresh"):
+            await self.session.refresh(ticket)
         return ticket
 
+    async def stream_ticket_rows(
+        self,
+        conditions: Sequence[ColumnElement[bool]] = (),
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """Stream matching ticket rows newest first, in batches, over a server-side cursor.
+
+        Yields plain Core rows (no ORM objects), so memory stays bounded by
+        ``batch_size`` regardless of how many tickets match.
+        """
+        result = await self.session.stream(
+            select(*Ticket.__table__.c)
+            .where(*conditions)
+            .order_by(Ticket.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            yield partition
+
+    async def bulk_create_tickets(
+        self,
+        rows: Sequence[dict[str, Any]],
+        chunk_size: int = 500,
+        keywords: Mapping[str, Sequence[str]] | None = None,
+    ) -> None:
+        """Insert many tickets in one transaction using executemany in chunks.
+
+        Rows must be complete column dicts (including ``id`` and timestamps);
+        nothing is refreshed back into the session. ``keywords`` maps ticket
+        ids to their keywords.
+        """
+        try:
+            for start in range(0, len(rows), chunk_size):
+                await self.session.execute(insert(Ticket), list(rows[start : start + chunk_size]))
+            if keywords:
+                await self._insert_keywords(keywords, chunk_size=chunk_size)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    async def _insert_keywords(self, keywords: Mapping[str, Sequence[str]], chunk_size: int = 500) -> None:
+        rows = [
+            {"ticket_id": ticket_id, "keyword": keyword}
+            for ticket_id, ticket_keywords in keywords.items()
+            for keyword in normalize_keywords(ticket_keywords)
+        ]
+        for start in range(0, len(rows), chunk_size):
+            await self.session.execute(insert(TicketKeyword), rows[start : start + chunk_size])
+
+    async def get_ticket_keywords(self, ticket_id: str) -> list[str]:
+        """Get the keywords of a ticket in alphabetical order."""
+        result = await self.session.execute(
+            select(TicketKeyword.keyword).where(TicketKeyword.ticket_id == ticket_id).order_by(TicketKeyword.keyword)
+        )
+        return list(result.scalars().all())
+
+    async def get_keywords_for_tickets(self, ticket_ids: Sequence[str]) -> dict[str, list[str]]:
+        """Get the keywords of several tickets in one query, keyed by ticket id."""
+        result = await self.session.execute(
+            select(TicketKeyword.ticket_id, TicketKeyword.keyword)
+            .where(TicketKeyword.ticket_id.in_(ticket_ids))
+            .order_by(TicketKeyword.keyword)
+        )
+        keywords: dict[str, list[str]] = {ticket_id: [] for ticket_id in ticket_ids}
+        for ticket_id, keyword in result.fetchall():
+            keywords[ticket_id].append(keyword)
+        return keywords
+
+    async def get_top_keywords(self, limit: int = 10) -> dict[str, int]:
+        """Get the most used keywords and their ticket counts from the maintained aggregate."""
+        result = await self.session.execute(
+            select(KeywordCount.keyword, KeywordCount.ticket_count)
+            .order_by(KeywordCount.ticket_count.desc(), KeywordCount.keyword)
+            .limit(limit)
+        )
+        return {row[0]: row[1] for row in result.fetchall()}
+
     async def get_ticket_by_id(self, ticket_id: str) -> Ticket | None:
         """Get a ticket by ID."""
         result = await self.session.execute(select(Ticket).where(Ticket.id == ticket_id))
         return result.scalar_one_or_none()
 
-    async def update_ticket_status(self, ticket_id: str, status: str) -> Ticket | None:
+    async def update_ticket(self, ticket_id: str, values: dict[str, Any]) -> Row | None:
+        """Apply a partial update with a single UPDATE ... RETURNING statement.
+
+        ``resolved_at`` is stamped in SQL the first time the status moves to a
+        resolved state, so no prior SELECT is needed. Returns the updated row,
+        or None when no ticket matched.
+        """
+        now = datetime.utcnow()
+        values = {**values, "updated_at": now}
+        if values.get("status") in RESOLVED_STATUSES:
+            values["resolved_at"] = func.coalesce(Ticket.resolved_at, now)
+
+        result = await self.session.execute(
+            update(Ticket)
+            .where(Ticket.id == ticket_id)
+            .values(**values)
+            .returning(*Ticket.__table__.c)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.one_or_none()
+        await self.session.commit()
+        return row
+
+    async def update_ticket_status(self, ticket_id: str, status: str) -> Row | None:
         """Update ticket status and set resolved_at if status is resolved."""
-        ticket = await self.get_ticket_by_id(ticket_id)
-        if ticket:
-            ticket.status = status
-            ticket.updated_at = datetime.utcnow()
-            if status in ["resolved", "closed"] and not ticket.resolved_at:
-                ticket.resolved_at = datetime.utcnow()
+        return await self.update_ticket(ticket_id, {"status": status})
+
+    async def delete_ticket(self, ticket_id: str) -> bool:
+        """Delete a ticket with a single DELETE; classifications go via ON DELETE CASCADE."""
+        result = await self.session.execute(
+            delete(Ticket).where(Ticket.id == ticket_id).execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount > 0
+
+    async def delete_tickets(self, conditions: Sequence[ColumnElement[bool]]) -> int:
+        """Delete every ticket matching the conditions in one statement and return the row count."""
+        result = await self.session.execute(
+            delete(Ticket).where(*conditions).execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def purge_resolved_tickets(
+        self,
+        older_than: datetime,
+        batch_size: int = 500,
+        statuses: Sequence[str] = RESOLVED_STATUSES,
+        pause: float = 0.0,
+    ) -> int:
+        """Delete finished tickets resolved before ``older_than`` in bounded batches.
+
+        Each batch selects at most ``batch_size`` ids and deletes them in its own
+        short transaction, so writers are never blocked for the whole purge.
+        Returns the total number of tickets deleted.
+        """
+        resolved_at = func.coalesce(Ticket.resolved_at, Ticket.updated_at)
+        total = 0
+        while True:
+            result = await self.session.execute(
+                select(Ticket.id).where(Ticket.status.in_(statuses), resolved_at < older_than).limit(batch_size)
+            )
+            ids = result.scalars().all()
+            if not ids:
+                break
+
+            result = await self.session.execute(
+                delete(Ticket).where(Ticket.id.in_(ids)).execution_options(synchronize_session=False)
+            )
             await self.session.commit()
-            await self.session.refresh(ticket)
-        return ticket
+            total += result.rowcount
+
+            if len(ids) < batch_size:
+                break
+            if pause:
+                await asyncio.sleep(pause)
+        return total
@@ -0,0 +1,99 @@
+"""Retention job that purges old resolved and closed tickets.
+
+Run periodically (e.g. from cron) with::
+
+    python -m ticket_assistant.database.retention --days 90
+
+``--vacuum`` returns the space freed by the purge to the filesystem on SQLite.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from datetime import datetime
+from datetime import timedelta
+
+from ticket_assistant.database.connection import AsyncSessionLocal
+from ticket_assistant.database.connection import close_db
+from ticket_assistant.database.connection import engine
+from ticket_assistant.database.repositories.ticket_repository import RESOLVED_STATUSES
+from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = int(os.getenv("TICKET_RETENTION_DAYS", "90"))
+DEFAULT_BATCH_SIZE = int(os.getenv("TICKET_PURGE_BATCH_SIZE", "500"))
+
+
+async def purge_old_tickets(
+    days: int = DEFAULT_RETENTION_DAYS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    statuses: tuple[str, ...] = RESOLVED_STATUSES,
+    pause: float = 0.05,
+) -> int:
+    """Delete tickets in ``statuses`` that were resolved more than ``days`` days ago."""
+    cutoff = datetime.utcnow() - timedelta(days=days)
+
+    async with AsyncSessionLocal() as session:
+        ticket_repo = TicketRepository(session)
+        deleted = await ticket_repo.purge_resolved_tickets(
+            older_than=cutoff,
+            batch_size=batch_size,
+            statuses=statuses,
+            pause=pause,
+        )
+
+    logger.info(f"Purged {deleted} tickets resolved before {cutoff.isoformat()}")
+    return deleted
+
+
+async def vacuum_database() -> None:
+    """VACUUM a SQLite database to return the space freed by purges to the filesystem.
+
+    PostgreSQL reclaims space with autovacuum, so nothing is done there.
+    """
+    if engine.dialect.name != "sqlite":
+        logger.info(f"Skipping VACUUM on {engine.dialect.name}")
+        return
+    async with engine.connect() as conn:
+        # VACUUM cannot run inside a transaction
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.exec_driver_sql("VACUUM")
+    logger.info("Vacuumed the database")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    try:
+        deleted = await purge_old_tickets(
+            days=args.days,
+            batch_size=args.batch_size,
+            statuses=tuple(args.status or RESOLVED_STATUSES),
+            pause=args.pause,
+        )
+        print(f"Deleted {deleted} tickets")
+        if args.vacuum:
+            await vacuum_database()
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    """Command line entry point for the retention job."""
+    parser = argparse.ArgumentParser(description="Purge resolved/closed tickets older than N days")
+    parser.add_argument("--days", type=int, default=DEFAULT_RETENTION_DAYS, help="Retention period in days")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Tickets deleted per transaction")
+    parser.add_argument("--pause", type=float, default=0.05, help="Seconds to sleep between batches")
+    parser.add_argument(
+        "--status",
+        action="append",
+        help="Status to purge (repeatable, defaults to resolved and closed)",
+    )
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM afterwards (SQLite)")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
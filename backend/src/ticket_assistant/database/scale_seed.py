@@ -0,0 +1,446 @@
+"""Bulk loader for production-scale data: millions of tickets with classifications and keywords.
+
+``seed_data`` adds a hundred ORM objects one at a time; this loader generates
+rows with realistic distributions in a pool of worker processes and writes
+them as multi-row ``INSERT`` statements on SQLite or with ``COPY`` on PostgreSQL.
+Triggers and secondary indexes on the loaded tables are dropped (SQLite) or
+disabled (PostgreSQL) for the load. Afterwards the full-text index,
+``keyword_counts`` are updated in one pass each, the indexes are rebuilt and
+the tables are analyzed.
+
+Run against ``DATABASE_URL`` with::
+
+    python -m ticket_assistant.database.scale_seed --tickets 1000000
+"""
+
+import argparse
+import asyncio
+import bisect
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from datetime import timedelta
+from typing import Any
+from typing import NamedTuple
+
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from ticket_assistant.core.models import Department
+from ticket_assistant.core.models import ErrorSeverity
+from ticket_assistant.database.connection import Base
+from ticket_assistant.database.connection import close_db
+from ticket_assistant.database.connection import engine
+from ticket_assistant.database.connection import init_db
+from ticket_assistant.database.seed_data import ASSIGNEES
+from ticket_assistant.database.seed_data import SAMPLE_ACTIONS
+from ticket_assistant.database.seed_data import SAMPLE_REASONINGS
+from ticket_assistant.database.seed_data import SAMPLE_TICKETS
+from ticket_assistant.database.seed_data import STATUS_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+TICKET_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "error_message",
+    "department",
+    "severity",
+    "status",
+    "assignee",
+    "screenshot_url",
+    "created_at",
+    "updated_at",
+    "resolved_at",
+)
+CLASSIFICATION_COLUMNS = (
+    "id",
+    "ticket_id",
+    "confidence",
+    "reasoning",
+    "suggested_actions",
+    "created_at",
+    "updated_at",
+)
+KEYWORD_COLUMNS = ("keyword", "ticket_id")
+
+# Tables written by the loader, parents first
+LOADED_TABLES = ("tickets", "classifications", "ticket_keywords")
+
+# Default SQLITE_MAX_VARIABLE_NUMBER since SQLite 3.32
+SQLITE_MAX_VARIABLES = 32766
+
+DEPARTMENT_WEIGHTS = {
+    Department.BACKEND.value: 0.26,
+    Department.FRONTEND.value: 0.2,
+    Department.API.value: 0.14,
+    Department.DATABASE.value: 0.12,
+    Department.DEVOPS.value: 0.12,
+    Department.SECURITY.value: 0.06,
+    Department.INTEGRATION.value: 0.06,
+    Department.GENERAL.value: 0.04,
+}
+SEVERITY_WEIGHTS = {
+    ErrorSeverity.LOW.value: 0.33,
+    ErrorSeverity.MEDIUM.value: 0.4,
+    ErrorSeverity.HIGH.value: 0.2,
+    ErrorSeverity.CRITICAL.value: 0.07,
+}
+
+# Keywords are drawn Zipf-style: a few very common terms and a long tail of service names
+COMMON_KEYWORDS = [
+    "timeout",
+    "login",
+    "checkout",
+    "payment",
+    "database",
+    "deploy",
+    "memory",
+    "latency",
+    "certificate",
+    "crash",
+    "cache",
+    "search",
+    "upload",
+    "session",
+    "migration",
+    "dns",
+    "queue",
+    "mobile",
+    "rate limit",
+    "permissions",
+]
+KEYWORD_VOCABULARY = COMMON_KEYWORDS + [f"svc-{index}" for index in range(2000)]
+KEYWORD_CUM_WEIGHTS = list(itertools.accumulate(1 / rank**1.1 for rank in range(1, len(KEYWORD_VOCABULARY) + 1)))
+
+# Median and spread of the log-normal time to resolution
+RESOLUTION_HOURS_MEDIAN = 18.0
+RESOLUTION_HOURS_SIGMA = 1.2
+
+
+class Batch(NamedTuple):
+    """Rows for one transaction, as tuples in the column order of the ``*_COLUMNS`` constants."""
+
+    tickets: list[tuple]
+    classifications: list[tuple]
+    keywords: list[tuple]
+
+
+def _cum_weights(weights: dict[str, float]) -> tuple[list[str], list[float]]:
+    return list(weights), list(itertools.accumulate(weights.values()))
+
+
+# Version and variant bits of a random (version 4) UUID, set as uuid.UUID(int=..., version=4) does
+_UUID4_MASK = ~((0xC000 << 48) | (0xF000 << 64)) & ((1 << 128) - 1)
+_UUID4_BITS = (0x8000 << 48) | (4 << 76)
+
+
+def generate_batch(
+    first_serial: int,
+    size: int,
+    now: datetime,
+    days: int = 365,
+    classified: float = 0.7,
+    seed: int | None = None,
+    timestamp: Callable[[datetime], Any] | None = None,
+) -> Batch:
+    """Generate ``size`` tickets numbered from ``first_serial``, with their classifications and keywords.
+
+    Tickets are spread over the ``days`` days before ``now`` with volume growing
+    towards today; resolved and closed tickets get a log-normal time to
+    resolution. ``classified`` is the share of tickets with a classification.
+    Each batch draws from its own stream derived from ``seed`` and
+    ``first_serial``, so a fixed seed generates the same rows, ids included, in
+    whichever process builds the batch. ``timestamp`` converts datetimes to what
+    the driver expects.
+    """
+    timestamp = timestamp or (lambda value: value)
+    rng = random.Random(None if seed is None else f"{seed}:{first_serial}")  # noqa: S311
+    # Generation costs more than writing: the loop avoids Random.choices,
+    # uuid.UUID and other per-call overhead
+    rand = rng.random
+    departments, department_weights = _cum_weights(DEPARTMENT_WEIGHTS)
+    severities, severity_weights = _cum_weights(SEVERITY_WEIGHTS)
+    statuses, status_weights = _cum_weights(dict(STATUS_WEIGHTS))
+    templates = {
+        department: [t for t in SAMPLE_TICKETS if t["department"] == department] or SAMPLE_TICKETS
+        for department in departments
+    }
+    suggested_actions = [json.dumps(actions) for actions in SAMPLE_ACTIONS]
+    span = days * 86400
+    resolution_mu = math.log(RESOLUTION_HOURS_MEDIAN)
+
+    def pick(values: Sequence, cum_weights: Sequence[float]) -> Any:
+        return values[bisect.bisect(cum_weights, rand() * cum_weights[-1])]
+
+    def pick_uniform(values: Sequence) -> Any:
+        return values[int(rand() * len(values))]
+
+    def new_id() -> str:
+        digits = f"{rng.getrandbits(128) & _UUID4_MASK | _UUID4_BITS:032x}"
+        return f"{digits[:8]}-{digits[8:12]}-{digits[12:16]}-{digits[16:20]}-{digits[20:]}"
+
+    batch = Batch([], [], [])
+    for serial in range(first_serial, first_serial + size):
+        ticket_id = new_id()
+        department = pick(departments, department_weights)
+        template = pick_uniform(templates[department])
+        keywords = list(
+            dict.fromkeys(pick(KEYWORD_VOCABULARY, KEYWORD_CUM_WEIGHTS) for _ in range(1 + int(rand() * 4)))
+        )
+        # 1 - sqrt(u) puts more tickets in recent days, as for a growing product
+        created_at = now - timedelta(seconds=span * (1 - math.sqrt(rand())))
+        status = pick(statuses, status_weights)
+        resolved_at = None
+        if status in ("resolved", "closed"):
+            hours = rng.lognormvariate(resolution_mu, RESOLUTION_HOURS_SIGMA)
+            resolved_at = min(now, created_at + timedelta(hours=hours))
+        updated_at = resolved_at or min(now, created_at + timedelta(hours=rand() * 24))
+
+        batch.tickets.append(
+            (
+                ticket_id,
+                f"{template['name']} #{serial}",
+                f"{template['description']}. Affected component: {keywords[0]}",
+                template["error_message"],
+                department,
+                pick(severities, severity_weights),
+                status,
+                pick_uniform(ASSIGNEES),
+                None,
+                timestamp(created_at),
+                timestamp(updated_at),
+                timestamp(resolved_at) if resolved_at else None,
+            )
+        )
+        batch.keywords.extend((keyword, ticket_id) for keyword in keywords)
+        if rand() < classified:
+            classified_at = timestamp(created_at + timedelta(seconds=60 + rand() * 1740))
+            batch.classifications.append(
+                (
+                    new_id(),
+                    ticket_id,
+                    # Skewed towards confident answers
+                    round(rng.triangular(0.5, 0.99, 0.92), 4),
+                    pick_uniform(SAMPLE_REASONINGS),
+                    pick_uniform(suggested_actions),
+                    classified_at,
+                    classified_at,
+                )
+            )
+    return batch
+
+
+def _sqlite_timestamp(value: datetime) -> str:
+    # The format SQLAlchemy's SQLite DateTime type stores and parses
+    return value.isoformat(" ", "microseconds")
+
+
+async def _suspend_maintenance(conn: AsyncConnection) -> list[str]:
+    """Drop or disable triggers and secondary indexes on the loaded tables; returns the statements restoring them."""
+    dialect = conn.dialect.name
+    tables = ", ".join(f"'{table}'" for table in LOADED_TABLES)
+    restore = []
+    if dialect == "sqlite":
+        result = await conn.exec_driver_sql(
+            f"SELECT type, name, sql FROM sqlite_master WHERE type IN ('index', 'trigger') "  # noqa: S608
+            f"AND sql IS NOT NULL AND tbl_name IN ({tables})"
+        )
+        for kind, name, sql in result.all():
+            await conn.exec_driver_sql(f"DROP {kind.upper()} {name}")
+            restore.append(sql)
+    elif dialect == "postgresql":
+        # Indexes backing primary keys and unique constraints stay
+        result = await conn.exec_driver_sql(
+            f"SELECT indexname, indexdef FROM pg_indexes WHERE schemaname = current_schema() "  # noqa: S608
+            f"AND tablename IN ({tables}) AND indexname NOT IN (SELECT conname FROM pg_constraint)"
+        )
+        for name, definition in result.all():
+            await conn.exec_driver_sql(f"DROP INDEX {name}")
+            restore.append(definition)
+        for table in LOADED_TABLES:
+            await conn.exec_driver_sql(f"ALTER TABLE {table} DISABLE TRIGGER USER")
+            restore.append(f"ALTER TABLE {table} ENABLE TRIGGER USER")
+    await conn.commit()
+    return restore
+
+
+async def _write_rows(conn: AsyncConnection, table: str, columns: Sequence[str], rows: list[tuple]) -> None:
+    """Insert ``rows`` with the fastest bulk path of the dialect."""
+    if not rows:
+        return
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        per_statement = SQLITE_MAX_VARIABLES // len(columns)
+        row_sql = f"({', '.join(['?'] * len(columns))})"
+        head = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "  # noqa: S608
+        for start in range(0, len(rows), per_statement):
+            chunk = rows[start : start + per_statement]
+            await conn.exec_driver_sql(
+                head + ", ".join([row_sql] * len(chunk)), tuple(itertools.chain.from_iterable(chunk))
+            )
+    elif dialect == "postgresql":
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(table, records=rows, columns=list(columns))
+    else:
+        await conn.execute(Base.metadata.tables[table].insert(), [dict(zip(columns, row, strict=True)) for row in rows])
+
+
+async def _refresh_derived(conn: AsyncConnection, first_rowid: int) -> None:
+    """Bring the data the suspended triggers maintain up to date, then refresh planner statistics."""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        # Key the appended rows past every existing search_rowid, then index only them
+        # (tickets_fts is external-content)
+        await conn.exec_driver_sql(
+            "UPDATE tickets SET search_rowid = rowid + (SELECT coalesce(max(search_rowid), 0) FROM tickets) "  # noqa: S608
+            f"WHERE rowid >= {first_rowid}"
+        )
+        await conn.exec_driver_sql(
+            "INSERT INTO tickets_fts(rowid, name, description, error_message) "  # noqa: S608
+            f"SELECT search_rowid, name, description, error_message FROM tickets WHERE rowid >= {first_rowid}"
+        )
+    await conn.exec_driver_sql("DELETE FROM keyword_counts")
+    await conn.exec_driver_sql(
+        "INSERT INTO keyword_counts(keyword, ticket_count) "
+        "SELECT keyword, count(*) FROM ticket_keywords GROUP BY keyword"
+    )
+    await conn.commit()
+    if dialect == "sqlite":
+        # Sample each index instead of reading it whole
+        await conn.exec_driver_sql("PRAGMA analysis_limit = 1000")
+    await conn.exec_driver_sql("ANALYZE")
+    await conn.commit()
+
+
+async def seed_scale_data(
+    tickets: int,
+    batch_size: int = 50_000,
+    days: int = 365,
+    classified: float = 0.7,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> dict[str, Any]:
+    """Append ``tickets`` generated tickets with classifications and keywords to the database.
+
+    ``workers`` processes (default: all CPUs but one) generate batches ahead of
+    the writer; each batch of ``batch_size`` tickets is one transaction.
+    Returns the row counts written and the time spent loading and rebuilding.
+    """
+    await init_db()
+    dialect = engine.dialect.name
+    timestamp = _sqlite_timestamp if dialect == "sqlite" else None
+    workers = workers or max(1, (os.cpu_count() or 2) - 1)
+    now = datetime.utcnow()
+    first_serials = iter(range(1, tickets + 1, batch_size))
+    written = dict.fromkeys(LOADED_TABLES, 0)
+
+    loop = asyncio.get_running_loop()
+    # spawn: forking would copy this process's driver threads mid-flight
+    pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+    generating: deque[asyncio.Future] = deque()
+
+    def generate_ahead() -> None:
+        # Keep every worker busy plus one batch ready for the writer
+        for first in itertools.islice(first_serials, workers + 1 - len(generating)):
+            size = min(batch_size, tickets - first + 1)
+            generating.append(
+                loop.run_in_executor(pool, generate_batch, first, size, now, days, classified, seed, timestamp)
+            )
+
+    started = time.perf_counter()
+    async with engine.connect() as conn:
+        first_rowid = 1
+        if dialect == "sqlite":
+            first_rowid = (await conn.exec_driver_sql("SELECT coalesce(max(rowid), 0) + 1 FROM tickets")).scalar()
+            # Nothing here must survive a crash: a failed load is thrown away
+            await conn.exec_driver_sql("PRAGMA foreign_keys = OFF")
+            await conn.exec_driver_sql("PRAGMA synchronous = OFF")
+            await conn.exec_driver_sql("PRAGMA cache_size = -262144")
+        elif dialect == "postgresql":
+            await conn.exec_driver_sql("SET synchronous_commit = off")
+        restore = await _suspend_maintenance(conn)
+
+        try:
+            generate_ahead()
+            while generating:
+                batch = await generating.popleft()
+                generate_ahead()
+                await _write_rows(conn, "tickets", TICKET_COLUMNS, batch.tickets)
+                await _write_rows(conn, "classifications", CLASSIFICATION_COLUMNS, batch.classifications)
+                await _write_rows(conn, "ticket_keywords", KEYWORD_COLUMNS, batch.keywords)
+                await conn.commit()
+                written["tickets"] += len(batch.tickets)
+                written["classifications"] += len(batch.classifications)
+                written["ticket_keywords"] += len(batch.keywords)
+                rate = written["tickets"] / (time.perf_counter() - started)
+                logger.info(f"Loaded {written['tickets']}/{tickets} tickets ({rate:,.0f} tickets/s)")
+        finally:
+            pool.shutdown(cancel_futures=True)
+            await conn.rollback()
+            loaded = time.perf_counter() - started
+            logger.info(f"Rebuilding {len(restore)} indexes and triggers")
+            for statement in restore:
+                await conn.exec_driver_sql(statement)
+            await conn.commit()
+            # The connection goes back to the pool
+            if dialect == "sqlite":
+                await conn.exec_driver_sql("PRAGMA cache_size = -2000")
+                await conn.exec_driver_sql("PRAGMA synchronous = FULL")
+                await conn.exec_driver_sql("PRAGMA foreign_keys = ON")
+            elif dialect == "postgresql":
+                await conn.exec_driver_sql("RESET synchronous_commit")
+
+        await _refresh_derived(conn, first_rowid)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Seeded {written['tickets']} tickets in {elapsed:.1f}s")
+    return {
+        **written,
+        "load_seconds": round(loaded, 2),
+        "total_seconds": round(elapsed, 2),
+        "tickets_per_second": round(written["tickets"] / elapsed),
+    }
+
+
+async def _run(args: argparse.Namespace) -> None:
+    try:
+        report = await seed_scale_data(
+            tickets=args.tickets,
+            batch_size=args.batch_size,
+            days=args.days,
+            classified=args.classified,
+            seed=args.seed,
+            workers=args.workers,
+        )
+        print(json.dumps(report, indent=2))
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    """Command line entry point for the scale seeder."""
+    parser = argparse.ArgumentParser(description="Bulk-load generated tickets, classifications and keywords")
+    parser.add_argument("--tickets", type=int, default=1_000_000, help="Number of tickets to add")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Tickets per transaction")
+    parser.add_argument("--days", type=int, default=365, help="Spread creation dates over this many past days")
+    parser.add_argument("--classified", type=float, default=0.7, help="Share of tickets with a classification")
+    parser.add_argument("--workers", type=int, help="Generator processes (default: all CPUs but one)")
+    parser.add_argument("--seed", type=int, help="Random seed for a reproducible data set (into an empty database)")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
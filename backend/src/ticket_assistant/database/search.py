@@ -0,0 +1,252 @@
+"""Full-text search index over ticket name, description and error message.
+
+SQLite uses an external-content FTS5 table kept in sync by triggers; PostgreSQL
+uses a generated ``tsvector`` column with a GIN index. Both are created when the
+``tickets`` table is created and by ``ensure_search_index`` for existing databases.
+
+``tickets`` has no INTEGER PRIMARY KEY and ``VACUUM`` may renumber its implicit
+rowid, so FTS5 is keyed on ``search_rowid``: an integer column outside the ORM
+model (like PostgreSQL's ``search_vector``) that the insert trigger assigns.
+
+Only the ``SEARCH_CANDIDATES`` most recent matches are ranked. A term found in
+most tickets would otherwise be scored row by row across the whole table before
+the first page could be returned.
+"""
+
+import base64
+import json
+import logging
+import os
+import re
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+SEARCH_CANDIDATES = int(os.getenv("SEARCH_CANDIDATES", "1000"))
+
+_SQLITE_DDL = [
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_tickets_search_rowid ON tickets (search_rowid)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tickets_fts USING fts5(
+        name, description, error_message,
+        content='tickets', content_rowid='search_rowid', tokenize='porter unicode61'
+    )
+    """,
+    # A BEFORE trigger cannot set NEW columns in SQLite, so the key is assigned
+    # right after the insert; the max comes from ix_tickets_search_rowid
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_insert AFTER INSERT ON tickets BEGIN
+        UPDATE tickets SET search_rowid = (SELECT coalesce(max(search_rowid), 0) + 1 FROM tickets)
+        WHERE rowid = new.rowid;
+        INSERT INTO tickets_fts(rowid, name, description, error_message)
+        SELECT search_rowid, name, description, error_message FROM tickets WHERE rowid = new.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_delete AFTER DELETE ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, name, description, error_message)
+        VALUES ('delete', old.search_rowid, old.name, old.description, old.error_message);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_update
+    AFTER UPDATE OF name, description, error_message ON tickets BEGIN
+        INSERT INTO tickets_fts(tickets_fts, rowid, name, description, error_message)
+        VALUES ('delete', old.search_rowid, old.name, old.description, old.error_message);
+        INSERT INTO tickets_fts(rowid, name, description, error_message)
+        VALUES (new.search_rowid, new.name, new.description, new.error_message);
+    END
+    """,
+]
+
+# Objects of the index that was keyed on the implicit rowid
+_SQLITE_LEGACY_DDL = [
+    "DROP TRIGGER IF EXISTS tickets_fts_insert",
+    "DROP TRIGGER IF EXISTS tickets_fts_delete",
+    "DROP TRIGGER IF EXISTS tickets_fts_update",
+    "DROP TABLE IF EXISTS tickets_fts",
+]
+
+_POSTGRESQL_DDL = [
+    """
+    ALTER TABLE tickets ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(error_message, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_tickets_search_vector ON tickets USING GIN (search_vector)",
+]
+
+
+def ensure_search_index(connection: Connection) -> None:
+    """Create the full-text index for the current dialect if it is missing."""
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        columns = {row[1] for row in connection.exec_driver_sql("PRAGMA table_info(tickets)")}
+        if "search_rowid" not in columns:
+            # Databases whose index followed the implicit rowid: key every ticket, then re-index
+            connection.exec_driver_sql("ALTER TABLE tickets ADD COLUMN search_rowid INTEGER")
+            connection.exec_driver_sql("UPDATE tickets SET search_rowid = rowid")
+            for statement in _SQLITE_LEGACY_DDL:
+                connection.exec_driver_sql(statement)
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tickets_fts'"
+        ).first()
+        for statement in _SQLITE_DDL:
+            connection.exec_driver_sql(statement)
+        if not exists:
+            # Index tickets that were written before the FTS table existed
+            rebuild_search_index(connection)
+            logger.info("Created SQLite FTS5 index for tickets")
+    elif dialect == "postgresql":
+        for statement in _POSTGRESQL_DDL:
+            connection.exec_driver_sql(statement)
+    else:
+        logger.warning(f"Full-text search is not supported on {dialect}")
+
+
+def rebuild_search_index(connection: Connection) -> None:
+    """Re-index every ticket in SQLite, e.g. after rows were written with the triggers dropped."""
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')")
+
+
+def _fts5_query(query: str) -> str:
+    """Turn free text into a safe FTS5 query: every term required, last term as a prefix."""
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return ""
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _tsquery(query: str) -> str:
+    """The PostgreSQL counterpart of ``_fts5_query`` for ``to_tsquery``."""
+    terms = re.findall(r"\w+", query)
+    if not terms:
+        return ""
+    terms[-1] += ":*"
+    return " & ".join(terms)
+
+
+def encode_cursor(rank: float, key: Any) -> str:
+    """Opaque keyset cursor for the position after (rank, key)."""
+    return base64.urlsafe_b64encode(json.dumps([rank, key]).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[float, Any]:
+    """Decode a cursor from ``encode_cursor``; raises ValueError if malformed."""
+    try:
+        rank, key = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+    return float(rank), key
+
+
+async def search_tickets(
+    session: AsyncSession,
+    query: str,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """Return ranked ticket hits with highlighted snippets and the cursor for the next page."""
+    after = decode_cursor(cursor) if cursor else None
+    dialect = session.bind.dialect.name
+
+    if dialect == "sqlite":
+        match = _fts5_query(query)
+        if not match:
+            return [], None
+        # One FTS5 cursor walks matches newest first and stops after
+        # SEARCH_CANDIDATES; only those are scored by bm25 (lower is better,
+        # weighted name > description > error_message) and snippeted. A second
+        # MATCH per page row would reload the whole doclist of a prefix term.
+        sql = f"""
+            SELECT t.id, t.name, t.status, t.department, t.severity, t.created_at,
+                   hit.score AS rank, hit.rowid AS sort_key,
+                   hit.name_snippet, hit.description_snippet, hit.error_message_snippet
+            FROM (
+                SELECT rowid, bm25(tickets_fts, 10.0, 4.0, 1.0) AS score,
+                       highlight(tickets_fts, 0, :start, :end) AS name_snippet,
+                       snippet(tickets_fts, 1, :start, :end, '…', 16) AS description_snippet,
+                       snippet(tickets_fts, 2, :start, :end, '…', 16) AS error_message_snippet
+                FROM tickets_fts
+                WHERE tickets_fts MATCH :match
+                ORDER BY rowid DESC
+                LIMIT :candidates
+            ) AS hit
+            JOIN tickets AS t ON t.search_rowid = hit.rowid
+            {"WHERE hit.score > :after_rank OR (hit.score = :after_rank AND hit.rowid > :after_key)" if after else ""}
+            ORDER BY hit.score, hit.rowid
+            LIMIT :limit
+        """  # noqa: S608 - only fixed fragments are interpolated
+    elif dialect == "postgresql":
+        match = _tsquery(query)
+        if not match:
+            return [], None
+        # ts_rank_cd: higher is better, negated so both dialects sort ascending.
+        # As on SQLite only the most recent SEARCH_CANDIDATES matches are ranked.
+        sql = f"""
+            SELECT id, name, status, department, severity, created_at,
+                   -ts_rank_cd(search_vector, q) AS rank, id AS sort_key,
+                   ts_headline('english', name, q, 'StartSel=' || :start || ', StopSel=' || :end
+                               || ', HighlightAll=true') AS name_snippet,
+                   ts_headline('english', description, q, 'StartSel=' || :start || ', StopSel=' || :end)
+                       AS description_snippet,
+                   ts_headline('english', coalesce(error_message, ''), q,
+                               'StartSel=' || :start || ', StopSel=' || :end) AS error_message_snippet
+            FROM (
+                SELECT * FROM tickets WHERE search_vector @@ to_tsquery('english', :match)
+                ORDER BY created_at DESC
+                LIMIT :candidates
+            ) AS tickets, to_tsquery('english', :match) AS q
+            WHERE search_vector @@ q
+            {"AND (-ts_rank_cd(search_vector, q), id) > (:after_rank, :after_key)" if after else ""}
+            ORDER BY rank, id
+            LIMIT :limit
+        """  # noqa: S608 - only fixed fragments are interpolated
+    else:
+        raise NotImplementedError(f"Full-text search is not supported on {dialect}")
+
+    params: dict[str, Any] = {
+        "match": match,
+        "start": SNIPPET_START,
+        "end": SNIPPET_END,
+        "limit": limit + 1,
+        "candidates": SEARCH_CANDIDATES,
+    }
+    if after:
+        params["after_rank"], params["after_key"] = after
+
+    rows = (await session.execute(text(sql), params)).mappings().all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    hits = [
+        {
+            "id": row["id"],
+            "name": row["name"],
+            "status": row["status"],
+            "department": row["department"],
+            "severity": row["severity"],
+            "created_at": row["created_at"],
+            "rank": row["rank"],
+            "snippets": {
+                "name": row["name_snippet"],
+                "description": row["description_snippet"],
+                "error_message": row["error_message_snippet"] or None,
+            },
+        }
+        for row in rows
+    ]
+    next_cursor = encode_cursor(rows[-1]["rank"], rows[-1]["sort_key"]) if has_more else None
+    return hits, next_cursor
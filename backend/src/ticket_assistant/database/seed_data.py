@@ -107,6 +107,25 @@ ASSIGNEES = [
     None,  # Unassigned tickets
 ]
 
+# Classification reasonings and suggested actions
+SAMPLE_REASONINGS = [
+    "Based on error message and description, this appears to be a backend service issue",
+    "Frontend validation error suggests client-side JavaScript problem",
+    "Database timeout indicates performance or connectivity issues",
+    "Security vulnerability requires immediate attention",
+    "Infrastructure issue affecting system reliability",
+    "API performance degradation needs investigation",
+]
+
+SAMPLE_ACTIONS = [
+    ["Check server logs", "Restart service", "Monitor performance"],
+    ["Review JavaScript code", "Update validation library", "Test on multiple browsers"],
+    ["Analyze database performance", "Check connection pool", "Review slow queries"],
+    ["Apply security patch", "Update dependencies", "Run security audit"],
+    ["Scale infrastructure", "Check monitoring alerts", "Review system metrics"],
+    ["Optimize API endpoints", "Check rate limiting", "Review caching strategy"],
+]
+
 
 def weighted_choice(choices):
     """Select a choice based on weights."""
@@ -170,33 +189,17 @@ async def create_sample_tickets(session, count: int = 50):
 
 async def create_sample_classifications(session, tickets):
     """Create sample classifications for tickets."""
-    sample_reasonings = [
-        "Based on error message and description, this appears to be a backend service issue",
-        "Frontend validation error suggests client-side JavaScript problem",
-        "Database timeout indicates performance or connectivity issues",
-        "Security vulnerability requires immediate attention",
-        "Infrastructure issue affecting system reliability",
-        "API performance degradation needs investigation",
-    ]
-
-    sample_actions = [
-        ["Check server logs", "Restart service", "Monitor performance"],
-        ["Review JavaScript code", "Update validation library", "Test on multiple browsers"],
-        ["Analyze database performance", "Check connection pool", "Review slow queries"],
-        ["Apply security patch", "Update dependencies", "Run security audit"],
-        ["Scale infrastructure", "Check monitoring alerts", "Review system metrics"],
-        ["Optimize API endpoints", "Check rate limiting", "Review caching strategy"],
-    ]
-
     for ticket in tickets:
         # Create classification for 70% of tickets
         if uniform(0, 1) < 0.7:  # noqa: S311
+            created_at = ticket.created_at + timedelta(minutes=randint(1, 30))  # noqa: S311
             classification = Classification(
                 ticket_id=ticket.id,
                 confidence=uniform(0.7, 0.99),  # noqa: S311
-                reasoning=choice(sample_reasonings),  # noqa: S311
-                suggested_actions=json.dumps(choice(sample_actions)),  # noqa: S311
-                created_at=ticket.created_at + timedelta(minutes=randint(1, 30)),  # noqa: S311
+                reasoning=choice(SAMPLE_REASONINGS),  # noqa: S311
+                suggested_actions=json.dumps(choice(SAMPLE_ACTIONS)),  # noqa: S311
+                created_at=created_at,
+                updated_at=created_at,
             )
             session.add(classification)
 
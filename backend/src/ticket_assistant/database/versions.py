@@ -0,0 +1,78 @@
+"""Per-table change validators for conditional GETs.
+
+A table's version is its row count plus its newest ``updated_at``, read through
+the ``updated_at`` index. Inserts and updates move the maximum and deletes move
+the count, so list and dashboard endpoints derive their ETag from these instead
+of running the full query, without a shared counter row that every writer
+would have to lock.
+"""
+
+import logging
+from collections.abc import Sequence
+
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+VERSIONED_TABLES = ("tickets", "classifications")
+
+# Triggers, function and table of the former shared change counter
+_LEGACY_DDL = {
+    "sqlite": [
+        f"DROP TRIGGER IF EXISTS {table}_version_{operation}"
+        for table in VERSIONED_TABLES
+        for operation in ("insert", "update", "delete")
+    ],
+    "postgresql": [
+        *(f"DROP TRIGGER IF EXISTS {table}_version ON {table}" for table in VERSIONED_TABLES),
+        "DROP FUNCTION IF EXISTS table_versions_bump()",
+    ],
+}
+
+
+def ensure_version_columns(connection: Connection) -> None:
+    """Add ``updated_at`` and its index where missing, and drop the former counter triggers.
+
+    Databases created before classifications had an ``updated_at`` get the
+    column backfilled from ``created_at``.
+    """
+    from ticket_assistant.database.connection import Base
+
+    dialect = connection.dialect
+    columns = {column["name"] for column in inspect(connection).get_columns("classifications")}
+    if "updated_at" not in columns:
+        column_type = Base.metadata.tables["classifications"].c.updated_at.type.compile(dialect=dialect)
+        connection.exec_driver_sql(f"ALTER TABLE classifications ADD COLUMN updated_at {column_type}")
+        connection.exec_driver_sql("UPDATE classifications SET updated_at = created_at")
+        if dialect.name == "postgresql":
+            connection.exec_driver_sql("ALTER TABLE classifications ALTER COLUMN updated_at SET NOT NULL")
+        logger.info("Added updated_at to classifications")
+
+    for table in VERSIONED_TABLES:
+        for index in Base.metadata.tables[table].indexes:
+            if "updated_at" in index.columns:
+                index.create(connection, checkfirst=True)
+
+    for statement in _LEGACY_DDL.get(dialect.name, []):
+        connection.exec_driver_sql(statement)
+    connection.exec_driver_sql("DROP TABLE IF EXISTS table_versions")
+
+
+async def get_table_versions(session: AsyncSession, tables: Sequence[str]) -> dict[str, str]:
+    """Current version of each of ``tables``, read in a single statement."""
+    from ticket_assistant.database.connection import Base
+
+    columns = []
+    for name in tables:
+        table = Base.metadata.tables[name]
+        columns.append(select(func.count()).select_from(table).scalar_subquery())
+        columns.append(select(func.max(table.c.updated_at)).scalar_subquery())
+    row = (await session.execute(select(*columns))).one()
+    return {
+        name: f"{count}:{latest.isoformat() if latest else ''}"
+        for name, count, latest in zip(tables, row[::2], row[1::2], strict=True)
+    }
@@ -0,0 +1,245 @@
+"""Columnar Arrow/Parquet exports of tickets and classifications for analytics.
+
+Requires the optional ``pyarrow`` dependency (``pip install ticket-assistant[analytics]``).
+
+Write Parquet files from the command line with::
+
+    python -m ticket_assistant.services.arrow_export --table joined --output exports/
+    python -m ticket_assistant.services.arrow_export --table tickets --since 2025-07-01T00:00:00
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+
+from sqlalchemy import Select
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.database.models import Classification
+from ticket_assistant.database.models import Ticket
+
+logger = logging.getLogger(__name__)
+
+ExportTable = Literal["tickets", "classifications", "joined"]
+EXPORT_TABLES: tuple[str, ...] = ("tickets", "classifications", "joined")
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# A joined row changes when either its ticket or its classification does
+WATERMARK_COLUMNS: dict[str, tuple[str, ...]] = {
+    "tickets": ("updated_at",),
+    "classifications": ("updated_at",),
+    "joined": ("updated_at", "classification_updated_at"),
+}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise RuntimeError(
+            "pyarrow is required for Arrow/Parquet exports: pip install 'ticket-assistant[analytics]'"
+        ) from e
+    return pyarrow
+
+
+def _ticket_fields(pa) -> list:
+    return [
+        pa.field("id", pa.string(), nullable=False),
+        pa.field("name", pa.string(), nullable=False),
+        pa.field("description", pa.string(), nullable=False),
+        pa.field("error_message", pa.string()),
+        pa.field("department", pa.string(), nullable=False),
+        pa.field("severity", pa.string(), nullable=False),
+        pa.field("status", pa.string(), nullable=False),
+        pa.field("assignee", pa.string()),
+        pa.field("screenshot_url", pa.string()),
+        pa.field("created_at", pa.timestamp("us"), nullable=False),
+        pa.field("updated_at", pa.timestamp("us"), nullable=False),
+        pa.field("resolved_at", pa.timestamp("us")),
+    ]
+
+
+def _classification_fields(pa, prefix: str = "") -> list:
+    nullable = bool(prefix)  # joined rows may have no classification
+    return [
+        pa.field(f"{prefix}id", pa.string(), nullable=nullable),
+        *([] if prefix else [pa.field("ticket_id", pa.string(), nullable=False)]),
+        pa.field(f"{prefix}confidence", pa.float64(), nullable=nullable),
+        pa.field(f"{prefix}reasoning", pa.string(), nullable=nullable),
+        pa.field(f"{prefix}suggested_actions", pa.list_(pa.string())),
+        pa.field(f"{prefix}created_at", pa.timestamp("us"), nullable=nullable),
+        pa.field(f"{prefix}updated_at", pa.timestamp("us"), nullable=nullable),
+    ]
+
+
+def export_schema(table: ExportTable):
+    """Arrow schema of the given export table."""
+    pa = _require_pyarrow()
+    if table == "tickets":
+        return pa.schema(_ticket_fields(pa))
+    if table == "classifications":
+        return pa.schema(_classification_fields(pa))
+    return pa.schema(_ticket_fields(pa) + _classification_fields(pa, prefix="classification_"))
+
+
+def _export_statement(table: ExportTable, since: datetime | None) -> Select:
+    """Build the SELECT for an export; ``since`` keeps only rows changed after the watermark.
+
+    Single tables are read in ``updated_at`` order through its index. The joined
+    export is read in primary-key order: with ``since`` a row qualifies through
+    either side, so no single timestamp index covers both filter and order.
+    """
+    if table == "tickets":
+        statement = select(*Ticket.__table__.c).order_by(Ticket.updated_at)
+        return statement.where(Ticket.updated_at > since) if since else statement
+
+    if table == "classifications":
+        statement = select(*Classification.__table__.c).order_by(Classification.updated_at)
+        return statement.where(Classification.updated_at > since) if since else statement
+
+    statement = (
+        select(
+            *Ticket.__table__.c,
+            Classification.id.label("classification_id"),
+            Classification.confidence.label("classification_confidence"),
+            Classification.reasoning.label("classification_reasoning"),
+            Classification.suggested_actions.label("classification_suggested_actions"),
+            Classification.created_at.label("classification_created_at"),
+            Classification.updated_at.label("classification_updated_at"),
+        )
+        .outerjoin(Classification, Classification.ticket_id == Ticket.id)
+        .order_by(Ticket.id, Classification.id)
+    )
+    if since:
+        statement = statement.where(or_(Ticket.updated_at > since, Classification.updated_at > since))
+    return statement
+
+
+def _decode_actions(value: str | None) -> list[str] | None:
+    if value is None:
+        return None
+    try:
+        actions = json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return []
+    return actions if isinstance(actions, list) else []
+
+
+async def iter_record_batches(
+    session_factory: async_sessionmaker[AsyncSession],
+    table: ExportTable,
+    since: datetime | None = None,
+    batch_size: int = 50_000,
+) -> AsyncIterator:
+    """Read an export table in chunks over a server-side cursor and yield Arrow record batches."""
+    pa = _require_pyarrow()
+    schema = export_schema(table)
+    actions_index = next((i for i, name in enumerate(schema.names) if name.endswith("suggested_actions")), None)
+
+    async with session_factory() as session:
+        result = await session.stream(_export_statement(table, since).execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            columns = [list(column) for column in zip(*partition, strict=True)]
+            if actions_index is not None:
+                columns[actions_index] = [_decode_actions(value) for value in columns[actions_index]]
+            yield pa.RecordBatch.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema, strict=True)],
+                schema=schema,
+            )
+
+
+async def stream_arrow_ipc(
+    session_factory: async_sessionmaker[AsyncSession],
+    table: ExportTable,
+    since: datetime | None = None,
+    batch_size: int = 50_000,
+) -> AsyncIterator[bytes]:
+    """Stream an export table as Arrow IPC stream bytes, one record batch at a time."""
+    pa = _require_pyarrow()
+    sink = io.BytesIO()
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    writer = pa.ipc.new_stream(sink, export_schema(table))
+    yield drain()
+    async for batch in iter_record_batches(session_factory, table, since=since, batch_size=batch_size):
+        writer.write_batch(batch)
+        yield drain()
+    writer.close()
+    yield drain()
+
+
+async def write_parquet(
+    session_factory: async_sessionmaker[AsyncSession],
+    table: ExportTable,
+    path: Path,
+    since: datetime | None = None,
+    batch_size: int = 50_000,
+) -> tuple[int, datetime | None]:
+    """Write an export table to a Parquet file; returns (row count, new watermark)."""
+    _require_pyarrow()
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    schema = export_schema(table)
+    rows = 0
+    watermark = None
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        async for batch in iter_record_batches(session_factory, table, since=since, batch_size=batch_size):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+            for column in WATERMARK_COLUMNS[table]:
+                batch_max = pc.max(batch.column(column)).as_py()
+                if batch_max and (watermark is None or batch_max > watermark):
+                    watermark = batch_max
+
+    logger.info(f"Wrote {rows} {table} rows to {path}")
+    return rows, watermark
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+
+    tables = EXPORT_TABLES[:2] if args.table == "all" else (args.table,)
+    try:
+        for table in tables:
+            path = Path(args.output) / f"{table}.parquet"
+            rows, watermark = await write_parquet(
+                AsyncSessionLocal, table, path, since=args.since, batch_size=args.batch_size
+            )
+            print(f"{table}: {rows} rows -> {path} (watermark: {watermark.isoformat() if watermark else '-'})")
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    """Command line entry point for Parquet exports."""
+    parser = argparse.ArgumentParser(description="Export tickets and classifications to Parquet")
+    parser.add_argument("--table", choices=[*EXPORT_TABLES, "all"], default="all", help="What to export")
+    parser.add_argument("--output", default="exports", help="Output directory")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Only rows changed after this ISO timestamp")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows read per database round trip")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
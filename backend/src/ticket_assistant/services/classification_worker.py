@@ -0,0 +1,184 @@
+"""Background classification of tickets created in ``pending_classification`` state.
+
+``/api/combined/classify-and-create-ticket?background=true`` inserts the ticket
+and a classification job in one transaction and returns immediately; these
+workers claim the jobs, ask the classifier, and fill in department and severity.
+Clients poll ``/api/combined/classification-jobs/{ticket_id}`` for the result.
+
+Workers run inside the API process (``CLASSIFICATION_WORKERS``) or, with that set
+to 0, as a separate process consuming the same database-backed queue::
+
+    python -m ticket_assistant.services.classification_worker
+    python -m ticket_assistant.services.classification_worker --stats
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+from datetime import datetime
+from datetime import timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.database.repositories.classification_job_repository import ClassificationJobRepository
+from ticket_assistant.services import outbox_dispatcher
+from ticket_assistant.services.groq_classifier import GroqClassifier
+
+logger = logging.getLogger(__name__)
+
+# Number of in-process workers; 0 leaves the queue to a separate worker process
+CLASSIFICATION_WORKERS = int(os.getenv("CLASSIFICATION_WORKERS", "2"))
+CLASSIFICATION_POLL_INTERVAL = float(os.getenv("CLASSIFICATION_QUEUE_POLL_INTERVAL", "1.0"))
+CLASSIFICATION_MAX_ATTEMPTS = int(os.getenv("CLASSIFICATION_QUEUE_MAX_ATTEMPTS", "5"))
+CLASSIFICATION_BASE_BACKOFF = float(os.getenv("CLASSIFICATION_QUEUE_BASE_BACKOFF", "2.0"))
+CLASSIFICATION_MAX_BACKOFF = float(os.getenv("CLASSIFICATION_QUEUE_MAX_BACKOFF", "60.0"))
+
+# Worker pool running in this process, if any
+_running_pool: "ClassificationWorkerPool | None" = None
+
+
+def notify_workers() -> None:
+    """Wake the in-process workers, if any are running, after new jobs were committed."""
+    if _running_pool is not None:
+        _running_pool.notify()
+
+
+class ClassificationWorkerPool:
+    """Classify queued tickets with a fixed number of concurrent asyncio workers."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        classifier: GroqClassifier,
+        workers: int = CLASSIFICATION_WORKERS,
+        poll_interval: float = CLASSIFICATION_POLL_INTERVAL,
+        max_attempts: int = CLASSIFICATION_MAX_ATTEMPTS,
+        base_backoff: float = CLASSIFICATION_BASE_BACKOFF,
+        max_backoff: float = CLASSIFICATION_MAX_BACKOFF,
+    ):
+        self.session_factory = session_factory
+        self.classifier = classifier
+        self.workers = max(workers, 1)
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._tasks: list[asyncio.Task] = []
+        self._wake = asyncio.Event()
+        self._stopping = False
+
+    def backoff(self, attempts: int) -> float:
+        """Seconds to wait after the ``attempts``-th failure: exponential, capped, with jitter."""
+        delay = min(self.base_backoff * 2 ** (attempts - 1), self.max_backoff)
+        return random.uniform(delay / 2, delay)  # noqa: S311
+
+    async def process_once(self, limit: int = 1) -> int:
+        """Claim and classify up to ``limit`` due jobs concurrently; returns how many were claimed."""
+        async with self.session_factory() as session:
+            jobs = await ClassificationJobRepository(session).claim_due(limit)
+        if jobs:
+            await asyncio.gather(*(self._process(job) for job in jobs))
+        return len(jobs)
+
+    async def _process(self, job) -> None:
+        try:
+            classification = await self.classifier.classify_error(
+                error_description=job.description,
+                error_message=job.error_message,
+                fallback_on_error=False,
+            )
+        except Exception as e:
+            if job.attempts >= self.max_attempts:
+                logger.error(f"Giving up on classification of ticket {job.ticket_id} after {job.attempts} attempts")
+                retry_at = None
+            else:
+                retry_at = datetime.utcnow() + timedelta(seconds=self.backoff(job.attempts))
+                logger.warning(f"Classification of ticket {job.ticket_id} failed (attempt {job.attempts}): {e}")
+            async with self.session_factory() as session:
+                await ClassificationJobRepository(session).mark_failed(job.id, str(e) or type(e).__name__, retry_at)
+            if retry_at is None:
+                outbox_dispatcher.notify_dispatcher()
+            return
+
+        async with self.session_factory() as session:
+            await ClassificationJobRepository(session).complete(job.id, classification)
+        outbox_dispatcher.notify_dispatcher()
+        logger.info(f"Classified ticket {job.ticket_id} as {classification.department.value}")
+
+    def notify(self) -> None:
+        """Wake an idle worker now instead of at the next poll."""
+        self._wake.set()
+
+    async def _run_worker(self) -> None:
+        while not self._stopping:
+            try:
+                claimed = await self.process_once()
+            except Exception as e:
+                logger.error(f"Classification worker failed: {e}")
+                claimed = 0
+            if not claimed and not self._stopping:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+                self._wake.clear()
+
+    async def run(self) -> None:
+        """Run the workers until stopped."""
+        self._stopping = False
+        await asyncio.gather(*(self._run_worker() for _ in range(self.workers)))
+
+    def start(self) -> None:
+        """Start the workers as background tasks."""
+        global _running_pool
+        self._stopping = False
+        self._tasks = [asyncio.create_task(self._run_worker()) for _ in range(self.workers)]
+        _running_pool = self
+        logger.info(f"Started {self.workers} classification workers")
+
+    async def stop(self) -> None:
+        """Stop after the jobs in flight; unclaimed jobs stay queued."""
+        global _running_pool
+        if not self._tasks:
+            return
+        if _running_pool is self:
+            _running_pool = None
+        self._stopping = True
+        self._wake.set()
+        await asyncio.gather(*self._tasks)
+        self._tasks = []
+        logger.info("Classification workers stopped")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+    from ticket_assistant.database.connection import init_db
+
+    try:
+        if args.stats:
+            async with AsyncSessionLocal() as session:
+                print(json.dumps(await ClassificationJobRepository(session).get_status_counts()))
+            return
+        await init_db()
+        pool = ClassificationWorkerPool(AsyncSessionLocal, GroqClassifier(), workers=args.workers)
+        await pool.run()
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    """Command line entry point to run classification workers outside the API process."""
+    parser = argparse.ArgumentParser(description="Classify tickets queued for background classification")
+    parser.add_argument("--workers", type=int, default=max(CLASSIFICATION_WORKERS, 1), help="Concurrent workers")
+    parser.add_argument("--stats", action="store_true", help="Print job counts per status and exit")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
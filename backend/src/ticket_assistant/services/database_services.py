@@ -12,13 +12,20 @@ from ticket_assistant.core.models import Department
 from ticket_assistant.core.models import ErrorSeverity
 from ticket_assistant.core.models import ReportRequest
 from ticket_assistant.core.models import ReportResponse
+from ticket_assistant.core.tracing import start_span
+from ticket_assistant.core.tracing import trace_methods
 from ticket_assistant.database.models import Classification
 from ticket_assistant.database.models import Ticket
+from ticket_assistant.database.repositories.classification_job_repository import PENDING_CLASSIFICATION
 from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+from ticket_assistant.services import classification_worker
+from ticket_assistant.services import outbox_dispatcher
+from ticket_assistant.services.report_service import build_report_payload
 
 logger = logging.getLogger(__name__)
 
 
+@trace_methods
 class DatabaseTicketService:
     """Service for handling tickets with database persistence."""
 
@@ -31,8 +38,16 @@ class DatabaseTicketService:
         report: ReportRequest,
         department: Department | None = None,
         severity: ErrorSeverity | None = None,
+        forward: bool = False,
+        classify_in_background: bool = False,
     ) -> Ticket:
-        """Create a new ticket in the database from a report."""
+        """Create a new ticket in the database from a report.
+
+        With ``forward`` the ticket is also queued in the outbox for delivery to
+        the external ticket API, committed atomically with the ticket. With
+        ``classify_in_background`` it is created in ``pending_classification``
+        state and queued for the classification workers.
+        """
         ticket_data = {
             "id": str(uuid4()),
             "name": report.name,
@@ -40,13 +55,19 @@ class DatabaseTicketService:
             "error_message": report.error_message,
             "department": department.value if department else Department.GENERAL.value,
             "severity": severity.value if severity else ErrorSeverity.MEDIUM.value,
-            "status": "open",
+            "status": PENDING_CLASSIFICATION if classify_in_background else "open",
             "screenshot_url": report.screenshot_url,
             "created_at": datetime.utcnow(),
             "updated_at": datetime.utcnow(),
         }
 
-        ticket = await self.ticket_repo.create_ticket(ticket_data)
+        outbox_payload = build_report_payload(report, ticket_data["id"], department, severity) if forward else None
+        ticket = await self.ticket_repo.create_ticket(
+            ticket_data,
+            keywords=report.keywords,
+            outbox_payload=outbox_payload,
+            queue_classification=classify_in_background,
+        )
         logger.info(f"Created ticket {ticket.id} in database")
         return ticket
 
@@ -66,8 +87,10 @@ class DatabaseTicketService:
         )
 
         self.session.add(classification_data)
-        await self.session.commit()
-        await self.session.refresh(classification_data)
+        with start_span("commit"):
+            await self.session.commit()
+        with start_span("refresh"):
+            await self.session.refresh(classification_data)
 
         logger.info(f"Created classification {classification_data.id} for ticket {ticket_id}")
         return classification_data
@@ -76,6 +99,7 @@ class DatabaseTicketService:
         self,
         report: ReportRequest,
         classification: ClassificationResponse,
+        forward: bool = False,
     ) -> tuple[Ticket, Classification]:
         """Create both ticket and classification in a single transaction."""
         # Create ticket
@@ -83,6 +107,7 @@ class DatabaseTicketService:
             report=report,
             department=classification.department,
             severity=classification.severity,
+            forward=forward,
         )
 
         # Create classification
@@ -105,17 +130,32 @@ class EnhancedReportService:
         report: ReportRequest,
         db_session: AsyncSession,
         classification: ClassificationResponse | None = None,
+        forward: bool | None = None,
+        classify_in_background: bool = False,
     ) -> tuple[ReportResponse, Ticket]:
-        """Send report and save to database."""
+        """Send report and save to database.
+
+        The ticket is queued for the external ticket API when ``forward`` is set,
+        which defaults to ``TICKET_OUTBOX_ENABLED``. With ``classify_in_background``
+        the ticket is returned right away and classified by the workers.
+        """
         try:
             # Create database service
             db_service = DatabaseTicketService(db_session)
+            if forward is None:
+                forward = outbox_dispatcher.OUTBOX_ENABLED
 
             # Create ticket in database
             if classification:
-                ticket, _ = await db_service.create_ticket_with_classification(report, classification)
+                ticket, _ = await db_service.create_ticket_with_classification(report, classification, forward=forward)
             else:
-                ticket = await db_service.create_ticket_from_report(report)
+                ticket = await db_service.create_ticket_from_report(
+                    report, forward=forward, classify_in_background=classify_in_background
+                )
+            if classify_in_background:
+                classification_worker.notify_workers()
+            elif forward:
+                outbox_dispatcher.notify_dispatcher()
 
             # Create successful response
             response = ReportResponse(
@@ -149,5 +189,5 @@ class EnhancedReportService:
 
         await asyncio.sleep(0.1)
 
-        # Use the same database logic as the real version
-        return await self.send_report_with_database(report, db_session, classification)
+        # Use the same database logic as the real version, never forwarding
+        return await self.send_report_with_database(report, db_session, classification, forward=False)
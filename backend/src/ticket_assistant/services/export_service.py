@@ -0,0 +1,87 @@
+"""Streaming exports of tickets for analytics and offline processing."""
+
+import csv
+import io
+import json
+import logging
+from collections.abc import AsyncIterator
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.database.models import Ticket
+from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+
+logger = logging.getLogger(__name__)
+
+TICKET_COLUMNS = [column.name for column in Ticket.__table__.columns]
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _json_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class TicketExportService:
+    """Serialize tickets straight from database rows to bytes, batch by batch."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], batch_size: int = 1000):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+
+    async def stream(
+        self,
+        export_format: str,
+        conditions: Sequence[ColumnElement[bool]] = (),
+    ) -> AsyncIterator[bytes]:
+        """Stream matching tickets in ``export_format``.
+
+        The session is owned by the generator so it stays open for as long as
+        the response is being sent.
+        """
+        chunks = self._ndjson(conditions) if export_format == "ndjson" else self._csv(conditions)
+        async for chunk in chunks:
+            yield chunk
+
+    async def _partitions(self, conditions: Sequence[ColumnElement[bool]]):
+        async with self.session_factory() as session:
+            ticket_repo = TicketRepository(session)
+            exported = 0
+            async for partition in ticket_repo.stream_ticket_rows(conditions, batch_size=self.batch_size):
+                exported += len(partition)
+                yield partition
+            logger.info(f"Exported {exported} tickets")
+
+    async def _ndjson(self, conditions: Sequence[ColumnElement[bool]]) -> AsyncIterator[bytes]:
+        async for partition in self._partitions(conditions):
+            lines = [
+                json.dumps({name: _json_value(value) for name, value in zip(TICKET_COLUMNS, row, strict=True)})
+                for row in partition
+            ]
+            yield ("\n".join(lines) + "\n").encode()
+
+    async def _csv(self, conditions: Sequence[ColumnElement[bool]]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(TICKET_COLUMNS)
+        async for partition in self._partitions(conditions):
+            writer.writerows([_csv_value(value) for value in row] for row in partition)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            # Header only: nothing matched
+            yield buffer.getvalue().encode()
@@ -1,16 +1,30 @@
+import asyncio
 import json
 import logging
 import os
+import time
 
 from groq import Groq
 
+from ticket_assistant.core.metrics import GROQ_REQUEST_DURATION
+from ticket_assistant.core.metrics import GROQ_TOKENS
 from ticket_assistant.core.models import ClassificationResponse
 from ticket_assistant.core.models import Department
 from ticket_assistant.core.models import ErrorSeverity
+from ticket_assistant.core.tracing import traced
 
 logger = logging.getLogger(__name__)
 
 
+def _record_token_usage(chat_completion) -> None:
+    # usage may be missing, e.g. on responses from OpenAI-compatible stand-ins
+    usage = getattr(chat_completion, "usage", None)
+    for kind in ("prompt", "completion"):
+        tokens = getattr(usage, f"{kind}_tokens", None)
+        if isinstance(tokens, int):
+            GROQ_TOKENS.labels(kind).inc(tokens)
+
+
 class GroqClassifier:
     def __init__(self, api_key: str | None = None):
         self.api_key = api_key or os.getenv("GROQ_API_KEY")
@@ -19,33 +33,47 @@ class GroqClassifier:
 
         self.client = Groq(api_key=self.api_key)
 
+    @traced()
     async def classify_error(
         self,
         error_description: str,
         error_message: str | None = None,
         context: str | None = None,
+        fallback_on_error: bool = True,
     ) -> ClassificationResponse:
-        """Classify error and route to appropriate department using Groq API."""
+        """Classify error and route to appropriate department using Groq API.
+
+        API errors yield a default classification, or are raised when
+        ``fallback_on_error`` is False so the caller can retry.
+        """
         try:
             # Construct the prompt for classification
             prompt = self._build_classification_prompt(error_description, error_message, context)
 
-            # Call Groq API
-            chat_completion = self.client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are an expert technical support classifier. "
-                            "Analyze errors and route them to the appropriate department."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                model="llama-3.3-70b-versatile",
-                temperature=0.1,
-                max_tokens=1000,
-            )
+            # Call Groq API; the SDK client is synchronous, so keep it off the event loop
+            started = time.perf_counter()
+            try:
+                chat_completion = await asyncio.to_thread(
+                    self.client.chat.completions.create,
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": (
+                                "You are an expert technical support classifier. "
+                                "Analyze errors and route them to the appropriate department."
+                            ),
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    model="llama-3.3-70b-versatile",
+                    temperature=0.1,
+                    max_tokens=1000,
+                )
+            except Exception:
+                GROQ_REQUEST_DURATION.labels("error").observe(time.perf_counter() - started)
+                raise
+            GROQ_REQUEST_DURATION.labels("success").observe(time.perf_counter() - started)
+            _record_token_usage(chat_completion)
 
             response_text = chat_completion.choices[0].message.content
 
@@ -56,6 +84,8 @@ class GroqClassifier:
 
         except Exception as e:
             logger.error(f"Error in Groq classification: {e!s}")
+            if not fallback_on_error:
+                raise
             # Return a default classification
             return ClassificationResponse(
                 department=Department.GENERAL,
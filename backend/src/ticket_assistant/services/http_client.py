@@ -0,0 +1,45 @@
+"""Shared, pooled HTTP client for calls to the external ticket API.
+
+One client is created in the app lifespan and reused for every report, so
+connections (and their TCP/TLS handshakes) are kept alive between requests.
+"""
+
+import logging
+import os
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled client from ``TICKET_API_*`` environment settings.
+
+    HTTP/2 (``TICKET_API_HTTP2=true``) needs the ``h2`` package
+    (``pip install 'httpx[http2]'``); without it the client falls back to HTTP/1.1.
+    """
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("TICKET_API_MAX_CONNECTIONS", "100")),
+        max_keepalive_connections=int(os.getenv("TICKET_API_MAX_KEEPALIVE", "20")),
+        keepalive_expiry=_env_float("TICKET_API_KEEPALIVE_EXPIRY", 30.0),
+    )
+    timeout = httpx.Timeout(
+        connect=_env_float("TICKET_API_CONNECT_TIMEOUT", 5.0),
+        read=_env_float("TICKET_API_READ_TIMEOUT", 30.0),
+        write=_env_float("TICKET_API_WRITE_TIMEOUT", 10.0),
+        pool=_env_float("TICKET_API_POOL_TIMEOUT", 5.0),
+    )
+
+    http2 = os.getenv("TICKET_API_HTTP2", "false").lower() == "true"
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("TICKET_API_HTTP2 is set but the h2 package is missing; using HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(limits=limits, timeout=timeout, http2=http2)
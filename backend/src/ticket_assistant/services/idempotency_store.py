@@ -0,0 +1,277 @@
+"""Stores for responses replayed to requests retried with the same ``Idempotency-Key``.
+
+``InMemoryIdempotencyStore`` suits a single API process; ``DatabaseIdempotencyStore``
+shares keys between processes through the ``idempotency_keys`` table. Pick one
+with ``IDEMPOTENCY_STORE`` (``memory`` or ``database``).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from datetime import timedelta
+from typing import NamedTuple
+
+from sqlalchemy import delete
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.database.models import IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_STORE = os.getenv("IDEMPOTENCY_STORE", "memory").lower()
+IDEMPOTENCY_TTL = float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "86400"))
+# How long a retry waits for the first request with its key before answering 409
+IDEMPOTENCY_WAIT_TIMEOUT = float(os.getenv("IDEMPOTENCY_WAIT_TIMEOUT", "30"))
+# An in-flight key older than this belongs to a request whose process died
+IDEMPOTENCY_IN_FLIGHT_LEASE = float(os.getenv("IDEMPOTENCY_IN_FLIGHT_LEASE", "120"))
+
+IN_FLIGHT = "in_flight"
+COMPLETED = "completed"
+
+# Expired database rows are deleted once every this many acquires
+_PURGE_EVERY = 1000
+
+
+class StoredResponse(NamedTuple):
+    """Response captured for an idempotency key."""
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    body: bytes
+
+
+class IdempotencyKeyMismatchError(Exception):
+    """The key was already used for a request with a different body."""
+
+
+class IdempotencyInFlightError(Exception):
+    """The first request with the key is still running after the wait timeout."""
+
+
+class IdempotencyStore(ABC):
+    """Interface of an idempotency store.
+
+    ``acquire`` either returns the stored response of an earlier request with the
+    key, or None to hand the key to the caller, who must then ``complete`` it with
+    the response or ``release`` it so a retry can run the request again.
+    """
+
+    @abstractmethod
+    async def acquire(self, key: str, fingerprint: str) -> StoredResponse | None:
+        """Reserve ``key`` for this request or return the response stored for it.
+
+        A concurrent request holding the key is waited for. Raises
+        IdempotencyKeyMismatchError when ``fingerprint`` differs from the first
+        request's and IdempotencyInFlightError when the wait times out.
+        """
+
+    @abstractmethod
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        """Store the response for ``key`` until the TTL runs out."""
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Give up ``key`` without storing a response (the request failed)."""
+
+
+class _MemoryEntry:
+    __slots__ = ("done", "expires_at", "fingerprint", "response")
+
+    def __init__(self, fingerprint: str, expires_at: float):
+        self.fingerprint = fingerprint
+        self.expires_at = expires_at
+        self.response: StoredResponse | None = None
+        self.done = asyncio.Event()
+
+
+class InMemoryIdempotencyStore(IdempotencyStore):
+    """Keys held in this process; waiting retries are woken as soon as the first request finishes."""
+
+    def __init__(self, ttl: float = IDEMPOTENCY_TTL, wait_timeout: float = IDEMPOTENCY_WAIT_TIMEOUT):
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        # Completed keys in completion order, so the expired ones are at the front;
+        # in-flight keys apart, so a stuck request cannot hold expired ones back
+        self._completed: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._in_flight: dict[str, _MemoryEntry] = {}
+
+    def _purge(self, now: float) -> None:
+        while self._completed:
+            key, entry = next(iter(self._completed.items()))
+            if entry.expires_at > now:
+                break
+            del self._completed[key]
+
+    async def acquire(self, key: str, fingerprint: str) -> StoredResponse | None:
+        now = time.monotonic()
+        self._purge(now)
+        entry = self._in_flight.get(key) or self._completed.get(key)
+        if entry is None:
+            self._in_flight[key] = _MemoryEntry(fingerprint, now + self.ttl)
+            return None
+        if entry.fingerprint != fingerprint:
+            raise IdempotencyKeyMismatchError(key)
+        if entry.response is None:
+            try:
+                await asyncio.wait_for(entry.done.wait(), timeout=self.wait_timeout)
+            except TimeoutError as e:
+                raise IdempotencyInFlightError(key) from e
+            if entry.response is None:
+                # The first request failed and released the key: run this one instead
+                return await self.acquire(key, fingerprint)
+        return entry.response
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        entry = self._in_flight.pop(key, None)
+        if entry is None:
+            return
+        entry.response = response
+        entry.expires_at = time.monotonic() + self.ttl
+        self._completed[key] = entry
+        entry.done.set()
+
+    async def release(self, key: str) -> None:
+        entry = self._in_flight.pop(key, None)
+        if entry is not None:
+            entry.done.set()
+
+
+class DatabaseIdempotencyStore(IdempotencyStore):
+    """Keys in the ``idempotency_keys`` table, shared by every API process.
+
+    Retries of a request still running elsewhere poll the row until it completes.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        ttl: float = IDEMPOTENCY_TTL,
+        wait_timeout: float = IDEMPOTENCY_WAIT_TIMEOUT,
+        in_flight_lease: float = IDEMPOTENCY_IN_FLIGHT_LEASE,
+        poll_interval: float = 0.05,
+    ):
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.wait_timeout = wait_timeout
+        self.in_flight_lease = in_flight_lease
+        self.poll_interval = poll_interval
+        self._acquires = 0
+
+    async def acquire(self, key: str, fingerprint: str) -> StoredResponse | None:
+        self._acquires += 1
+        if self._acquires % _PURGE_EVERY == 0:
+            await self.purge_expired()
+
+        deadline = time.monotonic() + self.wait_timeout
+        while True:
+            async with self.session_factory() as session:
+                now = datetime.utcnow()
+                record = await session.get(IdempotencyRecord, key)
+                if record is None:
+                    session.add(
+                        IdempotencyRecord(
+                            key=key,
+                            fingerprint=fingerprint,
+                            status=IN_FLIGHT,
+                            created_at=now,
+                            expires_at=now + timedelta(seconds=self.ttl),
+                        )
+                    )
+                    try:
+                        await session.commit()
+                        return None
+                    except IntegrityError:
+                        continue  # another request inserted the key first
+
+                abandoned = record.status == IN_FLIGHT and record.created_at <= now - timedelta(
+                    seconds=self.in_flight_lease
+                )
+                if record.expires_at <= now or abandoned:
+                    # Take the key over, unless someone else did since we read it
+                    result = await session.execute(
+                        update(IdempotencyRecord)
+                        .where(
+                            IdempotencyRecord.key == key,
+                            IdempotencyRecord.status == record.status,
+                            IdempotencyRecord.created_at == record.created_at,
+                        )
+                        .values(
+                            fingerprint=fingerprint,
+                            status=IN_FLIGHT,
+                            response_status=None,
+                            response_headers=None,
+                            response_body=None,
+                            created_at=now,
+                            expires_at=now + timedelta(seconds=self.ttl),
+                        )
+                        .execution_options(synchronize_session=False)
+                    )
+                    await session.commit()
+                    if result.rowcount == 1:
+                        return None
+                    continue
+
+                if record.fingerprint != fingerprint:
+                    raise IdempotencyKeyMismatchError(key)
+                if record.status == COMPLETED:
+                    return StoredResponse(
+                        record.response_status,
+                        [tuple(header) for header in json.loads(record.response_headers)],
+                        record.response_body,
+                    )
+
+            if time.monotonic() >= deadline:
+                raise IdempotencyInFlightError(key)
+            await asyncio.sleep(self.poll_interval)
+
+    async def complete(self, key: str, response: StoredResponse) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(IdempotencyRecord)
+                .where(IdempotencyRecord.key == key)
+                .values(
+                    status=COMPLETED,
+                    response_status=response.status_code,
+                    response_headers=json.dumps(response.headers),
+                    response_body=response.body,
+                    expires_at=datetime.utcnow() + timedelta(seconds=self.ttl),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+
+    async def release(self, key: str) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(IdempotencyRecord).where(IdempotencyRecord.key == key, IdempotencyRecord.status == IN_FLIGHT)
+            )
+            await session.commit()
+
+    async def purge_expired(self) -> int:
+        """Delete every expired key; returns how many were removed."""
+        async with self.session_factory() as session:
+            result = await session.execute(
+                delete(IdempotencyRecord).where(IdempotencyRecord.expires_at <= datetime.utcnow())
+            )
+            await session.commit()
+        if result.rowcount:
+            logger.info(f"Purged {result.rowcount} expired idempotency keys")
+        return result.rowcount
+
+
+def create_idempotency_store(session_factory: async_sessionmaker[AsyncSession]) -> IdempotencyStore:
+    """Build the store selected by ``IDEMPOTENCY_STORE``."""
+    if IDEMPOTENCY_STORE == "database":
+        return DatabaseIdempotencyStore(session_factory)
+    if IDEMPOTENCY_STORE != "memory":
+        logger.warning(f"Unknown IDEMPOTENCY_STORE {IDEMPOTENCY_STORE!r}, using the in-memory store")
+    return InMemoryIdempotencyStore()
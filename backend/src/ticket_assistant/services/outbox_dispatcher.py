@@ -0,0 +1,199 @@
+"""Background delivery of outbox messages to the external ticket API.
+
+Tickets are written to the outbox in the same transaction as the ticket
+itself; this dispatcher drains it in batches so request latency never depends
+on the downstream API. Delivery is at-least-once: every POST carries the
+message's ``Idempotency-Key`` so the receiver can drop duplicates.
+
+Inspect or recover the outbox from the command line with::
+
+    python -m ticket_assistant.services.outbox_dispatcher --stats
+    python -m ticket_assistant.services.outbox_dispatcher --requeue-dead
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import random
+from datetime import datetime
+from datetime import timedelta
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.database.repositories.outbox_repository import OutboxRepository
+from ticket_assistant.services.report_service import ReportService
+
+logger = logging.getLogger(__name__)
+
+# Forward DB-backed tickets to TICKET_API_ENDPOINT through the outbox
+OUTBOX_ENABLED = os.getenv("TICKET_OUTBOX_ENABLED", "false").lower() == "true"
+OUTBOX_BATCH_SIZE = int(os.getenv("TICKET_OUTBOX_BATCH_SIZE", "50"))
+OUTBOX_POLL_INTERVAL = float(os.getenv("TICKET_OUTBOX_POLL_INTERVAL", "1.0"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("TICKET_OUTBOX_MAX_ATTEMPTS", "8"))
+OUTBOX_BASE_BACKOFF = float(os.getenv("TICKET_OUTBOX_BASE_BACKOFF", "2.0"))
+OUTBOX_MAX_BACKOFF = float(os.getenv("TICKET_OUTBOX_MAX_BACKOFF", "300.0"))
+
+# Client errors that will not succeed on retry; everything else is retried
+_RETRYABLE_STATUS = {408, 409, 425, 429}
+
+# Dispatcher running in this process, if any
+_running_dispatcher: "OutboxDispatcher | None" = None
+
+
+def notify_dispatcher() -> None:
+    """Wake the in-process dispatcher, if one is running, after new messages were committed."""
+    if _running_dispatcher is not None:
+        _running_dispatcher.notify()
+
+
+class PermanentDeliveryError(Exception):
+    """The ticket API rejected a message in a way retrying cannot fix."""
+
+
+class OutboxDispatcher:
+    """Drain the outbox in batches with retries, exponential backoff and dead-lettering."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        report_service: ReportService,
+        batch_size: int = OUTBOX_BATCH_SIZE,
+        poll_interval: float = OUTBOX_POLL_INTERVAL,
+        max_attempts: int = OUTBOX_MAX_ATTEMPTS,
+        base_backoff: float = OUTBOX_BASE_BACKOFF,
+        max_backoff: float = OUTBOX_MAX_BACKOFF,
+    ):
+        self.session_factory = session_factory
+        self.report_service = report_service
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._task: asyncio.Task | None = None
+        self._wake = asyncio.Event()
+        self._stopping = False
+
+    def backoff(self, attempts: int) -> float:
+        """Seconds to wait after the ``attempts``-th failure: exponential, capped, with jitter."""
+        delay = min(self.base_backoff * 2 ** (attempts - 1), self.max_backoff)
+        return random.uniform(delay / 2, delay)  # noqa: S311
+
+    @staticmethod
+    def _check(result: httpx.Response | BaseException) -> BaseException | None:
+        """Turn a delivery result into the error to record, or None when it was delivered."""
+        if isinstance(result, BaseException):
+            return result
+        if result.status_code < 300:
+            return None
+        message = f"API returned {result.status_code}: {result.text[:200]}"
+        if 400 <= result.status_code < 500 and result.status_code not in _RETRYABLE_STATUS:
+            return PermanentDeliveryError(message)
+        return httpx.HTTPStatusError(message, request=result.request, response=result)
+
+    async def dispatch_once(self) -> int:
+        """Deliver one batch of due messages; returns how many were attempted.
+
+        The batch goes out through ``ReportService.deliver_many``: one request to
+        the ticket API's batch endpoint if it has one, concurrent single posts otherwise.
+        """
+        async with self.session_factory() as session:
+            outbox_repo = OutboxRepository(session)
+            messages = await outbox_repo.claim_due(self.batch_size)
+            if not messages:
+                return 0
+
+            results = await self.report_service.deliver_many(
+                [(json.loads(message.payload), message.idempotency_key) for message in messages]
+            )
+            errors = [self._check(result) for result in results]
+
+            delivered = [message.id for message, error in zip(messages, errors, strict=True) if error is None]
+            await outbox_repo.mark_delivered(delivered)
+
+            for message, error in zip(messages, errors, strict=True):
+                if error is None:
+                    continue
+                if isinstance(error, PermanentDeliveryError) or message.attempts >= self.max_attempts:
+                    logger.error(
+                        f"Dead-lettering outbox message {message.id} after {message.attempts} attempts: {error}"
+                    )
+                    retry_at = None
+                else:
+                    retry_at = datetime.utcnow() + timedelta(seconds=self.backoff(message.attempts))
+                    logger.warning(f"Outbox message {message.id} failed (attempt {message.attempts}): {error}")
+                await outbox_repo.mark_failed(message.id, str(error) or type(error).__name__, retry_at)
+
+        logger.info(f"Outbox batch: {len(delivered)} delivered, {len(messages) - len(delivered)} failed")
+        return len(messages)
+
+    def notify(self) -> None:
+        """Wake the dispatcher now instead of at the next poll (e.g. after a commit)."""
+        self._wake.set()
+
+    async def run(self) -> None:
+        """Dispatch until stopped; full batches are followed immediately by the next one."""
+        while not self._stopping:
+            try:
+                attempted = await self.dispatch_once()
+            except Exception as e:
+                logger.error(f"Outbox dispatch failed: {e}")
+                attempted = 0
+            if attempted < self.batch_size and not self._stopping:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+                self._wake.clear()
+
+    def start(self) -> None:
+        """Start dispatching in a background task."""
+        global _running_dispatcher
+        self._stopping = False
+        self._task = asyncio.create_task(self.run())
+        _running_dispatcher = self
+        logger.info("Outbox dispatcher started")
+
+    async def stop(self) -> None:
+        """Stop after the batch in flight; undelivered messages stay in the outbox."""
+        global _running_dispatcher
+        if self._task is None:
+            return
+        if _running_dispatcher is self:
+            _running_dispatcher = None
+        self._stopping = True
+        self._wake.set()
+        await self._task
+        self._task = None
+        logger.info("Outbox dispatcher stopped")
+
+
+async def _run(args: argparse.Namespace) -> None:
+    from ticket_assistant.database.connection import AsyncSessionLocal
+    from ticket_assistant.database.connection import close_db
+
+    try:
+        async with AsyncSessionLocal() as session:
+            outbox_repo = OutboxRepository(session)
+            if args.requeue_dead:
+                print(f"Requeued {await outbox_repo.requeue_dead()} dead-lettered messages")
+            print(json.dumps(await outbox_repo.get_status_counts()))
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    """Command line entry point to inspect and recover the outbox."""
+    parser = argparse.ArgumentParser(description="Inspect the ticket delivery outbox")
+    parser.add_argument("--stats", action="store_true", help="Print message counts per status (default)")
+    parser.add_argument("--requeue-dead", action="store_true", help="Retry every dead-lettered message")
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
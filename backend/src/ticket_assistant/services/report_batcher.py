@@ -0,0 +1,72 @@
+"""Coalesce concurrent report deliveries into batch requests.
+
+Callers submit one payload each and wait for their own result; the batcher
+sends everything submitted within ``max_wait`` seconds (or as soon as
+``max_items`` are waiting) as a single batch and hands each caller back the
+result for its item.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable
+from collections.abc import Callable
+from collections.abc import Sequence
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+BatchItem = tuple[dict, str]  # (payload, idempotency key)
+BatchResult = httpx.Response | BaseException
+SendBatch = Callable[[Sequence[BatchItem]], Awaitable[list[BatchResult]]]
+
+
+class ReportBatcher:
+    """Group submissions by size (``max_items``) or age (``max_wait`` seconds) and send them together."""
+
+    def __init__(self, send_batch: SendBatch, max_items: int = 50, max_wait: float = 0.05):
+        self.send_batch = send_batch
+        self.max_items = max_items
+        self.max_wait = max_wait
+        self._pending: list[tuple[BatchItem, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._in_flight: set[asyncio.Task] = set()
+
+    async def submit(self, payload: dict, idempotency_key: str) -> httpx.Response:
+        """Queue one payload and wait for its own response; its transport error is raised here."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(((payload, idempotency_key), future))
+        if len(self._pending) >= self.max_items:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.create_task(self._send(pending))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, pending: list[tuple[BatchItem, asyncio.Future]]) -> None:
+        try:
+            results = await self.send_batch([item for item, _ in pending])
+        except Exception as e:
+            results = [e] * len(pending)
+        for (_, future), result in zip(pending, results, strict=True):
+            if future.done():  # caller went away
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def aclose(self) -> None:
+        """Send whatever is still waiting and wait for batches in flight."""
+        self._flush()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
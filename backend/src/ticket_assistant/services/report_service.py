@@ -1,22 +1,152 @@
+import asyncio
 import logging
+import time
 import uuid
+from collections.abc import Sequence
 from datetime import datetime
 
 import httpx
 
+from ticket_assistant.core.metrics import TICKET_API_REQUEST_DURATION
 from ticket_assistant.core.models import Department
 from ticket_assistant.core.models import ErrorSeverity
 from ticket_assistant.core.models import ReportRequest
 from ticket_assistant.core.models import ReportResponse
 from ticket_assistant.core.models import TicketData
+from ticket_assistant.core.tracing import traced
+from ticket_assistant.services.report_batcher import BatchItem
+from ticket_assistant.services.report_batcher import BatchResult
+from ticket_assistant.services.report_batcher import ReportBatcher
 
 logger = logging.getLogger(__name__)
 
 
+def build_report_payload(
+    report: ReportRequest,
+    ticket_id: str,
+    department: Department | None = None,
+    severity: ErrorSeverity | None = None,
+) -> dict:
+    """Build the JSON body the external ticket API expects for a report."""
+    payload = {
+        "ticket_id": ticket_id,
+        "name": report.name,
+        "keywords": report.keywords,
+        "description": report.description,
+        "error_message": report.error_message,
+        "screenshot_url": report.screenshot_url,
+        "created_at": datetime.utcnow().isoformat(),
+        "status": "open",
+    }
+    if department:
+        payload["department"] = department.value
+    if severity:
+        payload["severity"] = severity.value
+    return payload
+
+
+# Batch endpoint answers meaning "no batch support here": fall back to single posts
+_BATCH_UNSUPPORTED_STATUS = {404, 405, 501}
+
+
 class ReportService:
-    def __init__(self, api_endpoint: str | None = None):
+    def __init__(
+        self,
+        api_endpoint: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        batch_endpoint: str | None = None,
+        batch_max_items: int = 50,
+        batch_max_wait: float = 0.05,
+    ):
         self.api_endpoint = api_endpoint or "https://api.example.com/tickets"
+        # Shared pooled client owned by the app lifespan; without one, each report opens its own
+        self.client = client
+        # Batch creation endpoint of the ticket API, if it has one: POST a JSON array of
+        # payloads, get back a JSON array of per-item results ({"status": <code>, ...})
+        self.batch_endpoint = batch_endpoint
+        self.batch_max_items = batch_max_items
+        self._batcher = (
+            ReportBatcher(self.deliver_many, max_items=batch_max_items, max_wait=batch_max_wait)
+            if batch_endpoint
+            else None
+        )
 
+    async def _post(
+        self, payload: dict | list, headers: dict[str, str] | None = None, url: str | None = None
+    ) -> httpx.Response:
+        endpoint = "batch" if url is not None and url == self.batch_endpoint else "single"
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            response = await self._send(payload, headers, url or self.api_endpoint)
+            outcome = f"{response.status_code // 100}xx"
+            return response
+        finally:
+            TICKET_API_REQUEST_DURATION.labels(endpoint, outcome).observe(time.perf_counter() - started)
+
+    async def _send(self, payload: dict | list, headers: dict[str, str] | None, url: str) -> httpx.Response:
+        if self.client is not None:
+            return await self.client.post(url, json=payload, headers=headers)
+
+        async with httpx.AsyncClient() as client:
+            return await client.post(
+                url,
+                json=payload,
+                headers={"Content-Type": "application/json", **(headers or {})},
+                timeout=30.0,
+            )
+
+    async def deliver(self, payload: dict, idempotency_key: str) -> httpx.Response:
+        """POST a prepared payload with an ``Idempotency-Key`` so redeliveries are safe.
+
+        Transport errors propagate to the caller.
+        """
+        return await self._post(payload, headers={"Idempotency-Key": idempotency_key})
+
+    async def deliver_many(self, items: Sequence[BatchItem]) -> list[BatchResult]:
+        """Deliver several (payload, idempotency key) items, returning one result per item in order.
+
+        Items go to the batch endpoint in chunks of ``batch_max_items`` when one is
+        configured, otherwise (or once it turns out to be unsupported) as
+        concurrent single posts. A result is the item's response or the
+        exception that prevented delivering it.
+        """
+        results: list[BatchResult] = []
+        for start in range(0, len(items), self.batch_max_items):
+            chunk = items[start : start + self.batch_max_items]
+            chunk_results = await self._post_batch(chunk) if self.batch_endpoint and len(chunk) > 1 else None
+            if chunk_results is None:
+                chunk_results = await asyncio.gather(
+                    *(self.deliver(payload, key) for payload, key in chunk), return_exceptions=True
+                )
+            results.extend(chunk_results)
+        return results
+
+    async def _post_batch(self, items: Sequence[BatchItem]) -> list[BatchResult] | None:
+        """POST one batch; returns None when the endpoint does not support batches."""
+        body = [{**payload, "idempotency_key": key} for payload, key in items]
+        try:
+            response = await self._post(body, url=self.batch_endpoint)
+        except Exception as e:
+            return [e] * len(items)
+
+        if response.status_code in _BATCH_UNSUPPORTED_STATUS:
+            logger.warning(f"Batch endpoint returned {response.status_code}; falling back to single posts")
+            self.batch_endpoint = None
+            return None
+        if response.status_code >= 300:
+            # The whole batch failed the same way, e.g. 503: each item carries the response
+            return [response] * len(items)
+
+        item_results = response.json()
+        if not isinstance(item_results, list) or len(item_results) != len(items):
+            return [ValueError("Batch response does not match the items sent")] * len(items)
+        return [
+            httpx.Response(int(result.get("status", 500)), json=result, request=response.request)
+            for result in item_results
+        ]
+
+    @traced()
     async def send_report(self, report: ReportRequest) -> ReportResponse:
         """Send a report to the ticketing system API endpoint."""
         try:
@@ -24,39 +154,27 @@ class ReportService:
             ticket_id = str(uuid.uuid4())
 
             # Prepare the payload
-            payload = {
-                "ticket_id": ticket_id,
-                "name": report.name,
-                "keywords": report.keywords,
-                "description": report.description,
-                "error_message": report.error_message,
-                "screenshot_url": report.screenshot_url,
-                "created_at": datetime.utcnow().isoformat(),
-                "status": "open",
-            }
-
-            # Send the report to the API endpoint
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.api_endpoint,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=30.0,
+            payload = build_report_payload(report, ticket_id)
+
+            # Send the report to the API endpoint, coalesced with concurrent reports when batching
+            if self._batcher is not None:
+                response = await self._batcher.submit(payload, ticket_id)
+            else:
+                response = await self._post(payload)
+
+            if response.status_code == 200 or response.status_code == 201:
+                return ReportResponse(
+                    success=True,
+                    message="Report sent successfully",
+                    ticket_id=ticket_id,
+                )
+            else:
+                logger.error(f"API returned status {response.status_code}: {response.text}")
+                return ReportResponse(
+                    success=False,
+                    message=f"Failed to send report: API returned {response.status_code}",
+                    ticket_id=None,
                 )
-
-                if response.status_code == 200 or response.status_code == 201:
-                    return ReportResponse(
-                        success=True,
-                        message="Report sent successfully",
-                        ticket_id=ticket_id,
-                    )
-                else:
-                    logger.error(f"API returned status {response.status_code}: {response.text}")
-                    return ReportResponse(
-                        success=False,
-                        message=f"Failed to send report: API returned {response.status_code}",
-                        ticket_id=None,
-                    )
 
         except httpx.TimeoutException:
             logger.error("Timeout while sending report to API")
@@ -69,6 +187,11 @@ class ReportService:
             logger.error(f"Error sending report: {e!s}")
             return ReportResponse(success=False, message=f"Error sending report: {e!s}", ticket_id=None)
 
+    async def aclose(self) -> None:
+        """Flush reports still waiting to be batched."""
+        if self._batcher is not None:
+            await self._batcher.aclose()
+
     def create_ticket_data(self, report: ReportRequest, department: Department, severity: ErrorSeverity) -> TicketData:
         """Create a TicketData object from a report and classification."""
         ticket_id = str(uuid.uuid4())
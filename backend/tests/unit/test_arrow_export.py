@@ -0,0 +1,113 @@
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.database.models import Classification
+from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+from ticket_assistant.services.arrow_export import write_parquet
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+def _ticket(name, updated_at):
+    return {
+        "id": name,
+        "name": name,
+        "description": "d",
+        "department": "backend",
+        "severity": "high",
+        "status": "open",
+        "created_at": updated_at,
+        "updated_at": updated_at,
+    }
+
+
+class TestArrowExport:
+    @pytest.fixture
+    async def session_factory(self, db_engine, db_session):
+        """Fixture that seeds two tickets (one classified) and returns a session factory"""
+        old = datetime(2025, 1, 1)
+        await TicketRepository(db_session).bulk_create_tickets(
+            [_ticket("old", old), _ticket("new", old + timedelta(days=30))]
+        )
+        db_session.add(
+            Classification(ticket_id="new", confidence=0.8, reasoning="r", suggested_actions='["restart", "page"]')
+        )
+        await db_session.commit()
+        return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @pytest.mark.asyncio
+    async def test_write_parquet_tickets(self, session_factory, tmp_path):
+        """Test tickets round-trip through Parquet with native types and a watermark"""
+        rows, watermark = await write_parquet(session_factory, "tickets", tmp_path / "tickets.parquet")
+
+        table = pq.read_table(tmp_path / "tickets.parquet")
+        assert rows == 2
+        assert table.column("name").to_pylist() == ["old", "new"]
+        assert table.schema.field("created_at").type == pa.timestamp("us")
+        assert watermark == datetime(2025, 1, 31)
+
+    @pytest.mark.asyncio
+    async def test_write_parquet_incremental(self, session_factory, tmp_path):
+        """Test that only rows after the watermark are exported"""
+        rows, _ = await write_parquet(
+            session_factory, "tickets", tmp_path / "tickets.parquet", since=datetime(2025, 1, 15)
+        )
+
+        assert rows == 1
+        assert pq.read_table(tmp_path / "tickets.parquet").column("id").to_pylist() == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_write_parquet_joined(self, session_factory, tmp_path):
+        """Test the joined export decodes suggested actions and keeps unclassified tickets"""
+        await write_parquet(session_factory, "joined", tmp_path / "joined.parquet")
+
+        rows = {row["id"]: row for row in pq.read_table(tmp_path / "joined.parquet").to_pylist()}
+        assert rows["new"]["classification_suggested_actions"] == ["restart", "page"]
+        assert rows["old"]["classification_id"] is None
+
+    @pytest.mark.asyncio
+    async def test_write_parquet_joined_incremental(self, session_factory, db_session, tmp_path):
+        """Test that a classification added to an older ticket is exported and moves the watermark"""
+        classified_at = datetime(2025, 3, 1)
+        db_session.add(
+            Classification(
+                ticket_id="old",
+                confidence=0.5,
+                reasoning="late",
+                suggested_actions="[]",
+                created_at=classified_at,
+                updated_at=classified_at,
+            )
+        )
+        await db_session.commit()
+
+        rows, watermark = await write_parquet(
+            session_factory, "joined", tmp_path / "joined.parquet", since=datetime(2025, 2, 1)
+        )
+
+        table = pq.read_table(tmp_path / "joined.parquet")
+        assert rows == 2
+        assert table.column("id").to_pylist() == ["new", "old"]
+        assert table.column("classification_reasoning").to_pylist() == ["r", "late"]
+        assert watermark > classified_at
+
+    def test_arrow_stream_endpoint(self, api_client):
+        """Test the endpoint returns a readable Arrow IPC stream"""
+        payload = {"name": "t", "description": "d", "department": "backend", "severity": "low"}
+        api_client.post("/api/tickets/bulk", json=[payload] * 3)
+
+        response = api_client.get("/api/exports/arrow", params={"table": "tickets"})
+
+        assert response.status_code == 200
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == 3
+        assert table.column("severity").to_pylist() == ["low"] * 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
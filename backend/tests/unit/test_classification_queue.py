@@ -0,0 +1,123 @@
+import json
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.core.models import ClassificationResponse
+from ticket_assistant.core.models import Department
+from ticket_assistant.core.models import ErrorSeverity
+from ticket_assistant.core.models import ReportRequest
+from ticket_assistant.database.models import Classification
+from ticket_assistant.database.models import ClassificationJob
+from ticket_assistant.database.models import OutboxMessage
+from ticket_assistant.database.models import Ticket
+from ticket_assistant.services.classification_worker import ClassificationWorkerPool
+from ticket_assistant.services.database_services import EnhancedReportService
+
+
+class FakeClassifier:
+    """Classifier stand-in that fails a set number of times before answering."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.calls = 0
+
+    async def classify_error(self, error_description, error_message=None, context=None, fallback_on_error=True):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("Groq unavailable")
+        return ClassificationResponse(
+            department=Department.DATABASE,
+            severity=ErrorSeverity.HIGH,
+            confidence=0.9,
+            reasoning="Deadlock in the orders table",
+            suggested_actions=["Check locks"],
+        )
+
+
+class TestClassificationQueue:
+    @pytest.fixture
+    def session_factory(self, db_engine):
+        """Fixture for a session factory on the test database"""
+        return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @pytest.fixture
+    def report(self):
+        """Fixture for a sample report"""
+        return ReportRequest(name="Orders stuck", keywords=["orders"], description="Deadlock detected on orders")
+
+    async def _create(self, session_factory, report, forward=False):
+        async with session_factory() as session:
+            _, ticket = await EnhancedReportService().send_report_with_database(
+                report, session, forward=forward, classify_in_background=True
+            )
+        return ticket
+
+    async def _get(self, session_factory, model):
+        async with session_factory() as session:
+            return (await session.execute(select(model))).scalars().all()
+
+    @pytest.mark.asyncio
+    async def test_ticket_is_classified_in_background(self, session_factory, report):
+        """Test that a pending ticket is classified by a worker and then forwarded"""
+        ticket = await self._create(session_factory, report, forward=True)
+        assert ticket.status == "pending_classification"
+        assert await self._get(session_factory, OutboxMessage) == []
+
+        pool = ClassificationWorkerPool(session_factory, FakeClassifier())
+        assert await pool.process_once() == 1
+        assert await pool.process_once() == 0
+
+        [ticket] = await self._get(session_factory, Ticket)
+        assert (ticket.status, ticket.department, ticket.severity) == ("open", "database", "high")
+        [classification] = await self._get(session_factory, Classification)
+        assert json.loads(classification.suggested_actions) == ["Check locks"]
+        [job] = await self._get(session_factory, ClassificationJob)
+        assert job.status == "done"
+        [message] = await self._get(session_factory, OutboxMessage)
+        assert json.loads(message.payload)["department"] == "database"
+
+    @pytest.mark.asyncio
+    async def test_retries_then_opens_ticket_unclassified(self, session_factory, report):
+        """Test that failed classifications are retried, then the ticket is opened with defaults"""
+        await self._create(session_factory, report)
+
+        classifier = FakeClassifier(failures=10)
+        pool = ClassificationWorkerPool(session_factory, classifier, max_attempts=2, base_backoff=0.0)
+        assert await pool.process_once() == 1
+        [job] = await self._get(session_factory, ClassificationJob)
+        assert (job.status, job.attempts) == ("pending", 1)
+
+        assert await pool.process_once() == 1
+        [job] = await self._get(session_factory, ClassificationJob)
+        assert (job.status, job.last_error) == ("failed", "Groq unavailable")
+        [ticket] = await self._get(session_factory, Ticket)
+        assert (ticket.status, ticket.department, ticket.severity) == ("open", "general", "medium")
+        assert classifier.calls == 2
+
+    def test_background_endpoint_returns_before_classification(self, api_client):
+        """Test that background mode answers 202 with a pending ticket and a pollable job"""
+        from ticket_assistant.api.classification import get_groq_classifier
+        from ticket_assistant.api.main import app
+
+        classifier = FakeClassifier()
+        app.dependency_overrides[get_groq_classifier] = lambda: classifier
+        try:
+            response = api_client.post(
+                "/api/combined/classify-and-create-ticket?background=true",
+                json={"name": "n", "keywords": [], "description": "d"},
+            )
+        finally:
+            app.dependency_overrides.pop(get_groq_classifier, None)
+
+        assert response.status_code == 202
+        body = response.json()
+        assert body["ticket"]["status"] == "pending_classification"
+        assert body["classification"] is None
+        assert classifier.calls == 0
+
+        job = api_client.get(body["classification_job"]["poll_url"], params={"wait": 0.3}).json()
+        assert (job["status"], job["ticket"]) == ("pending", None)
+        assert api_client.get("/api/combined/classification-jobs/missing").status_code == 404
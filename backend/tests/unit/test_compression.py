@@ -0,0 +1,70 @@
+import gzip
+
+import pytest
+
+from ticket_assistant.api.compression import choose_encoding
+
+
+class TestCompression:
+    @pytest.fixture
+    def ticket_payload(self):
+        """Fixture for a valid ticket create payload"""
+        return {
+            "name": "Checkout fails",
+            "description": "Payment step returns 502 after the card is submitted",
+            "department": "backend",
+            "severity": "high",
+        }
+
+    def test_choose_encoding(self):
+        """Test that Accept-Encoding is negotiated by q-value, then by server preference"""
+        preference = ["zstd", "br", "gzip"]
+
+        assert choose_encoding("gzip, br", preference) == "br"
+        assert choose_encoding("gzip;q=1.0, br;q=0.5", preference) == "gzip"
+        assert choose_encoding("*", preference) == "zstd"
+        assert choose_encoding("*, zstd;q=0", preference) == "br"
+        assert choose_encoding("identity", preference) is None
+        assert choose_encoding("gzip;q=0", preference) is None
+
+    def test_small_responses_are_not_compressed(self, api_client):
+        """Test that a body under the size threshold is sent as is, still varying on Accept-Encoding"""
+        response = api_client.get("/api/tickets", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    def test_uncompressed_responses_vary_on_accept_encoding(self, api_client, ticket_payload):
+        """Test that a compressible response sent without an encoding still carries Vary"""
+        api_client.post("/api/tickets/bulk", json=[ticket_payload] * 20)
+
+        response = api_client.get("/api/tickets?per_page=20", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["vary"]
+
+    def test_list_compressed_with_gzip(self, api_client, ticket_payload):
+        """Test that a large list page is gzip-compressed with Vary and a matching Content-Length"""
+        api_client.post("/api/tickets/bulk", json=[ticket_payload] * 20)
+
+        with api_client.stream("GET", "/api/tickets?per_page=20", headers={"Accept-Encoding": "gzip"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) == len(raw)
+        assert len(gzip.decompress(raw)) > len(raw)
+
+    def test_streamed_export_compressed_with_zstd(self, api_client, ticket_payload):
+        """Test that a streamed export is compressed chunk by chunk in the preferred encoding"""
+        zstandard = pytest.importorskip("zstandard")
+        api_client.post("/api/tickets/bulk", json=[ticket_payload] * 5)
+
+        with api_client.stream("GET", "/api/tickets/export", headers={"Accept-Encoding": "gzip, zstd"}) as response:
+            raw = b"".join(response.iter_raw())
+
+        assert response.headers["content-encoding"] == "zstd"
+        assert "content-length" not in response.headers
+        body = zstandard.ZstdDecompressor().decompressobj().decompress(raw)
+        assert len(body.decode().splitlines()) == 5
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.services.idempotency_store import DatabaseIdempotencyStore
+from ticket_assistant.services.idempotency_store import IdempotencyInFlightError
+from ticket_assistant.services.idempotency_store import IdempotencyKeyMismatchError
+from ticket_assistant.services.idempotency_store import InMemoryIdempotencyStore
+from ticket_assistant.services.idempotency_store import StoredResponse
+
+
+class TestIdempotency:
+    @pytest.fixture
+    def ticket_payload(self):
+        """Fixture for a valid ticket create payload"""
+        return {
+            "name": "Checkout fails",
+            "description": "Payment step returns 502",
+            "department": "backend",
+            "severity": "high",
+        }
+
+    @pytest.fixture
+    def memory_store(self, monkeypatch):
+        """Fixture installing an in-memory store in the middleware"""
+        from ticket_assistant.api import idempotency
+
+        store = InMemoryIdempotencyStore()
+        monkeypatch.setattr(idempotency, "idempotency_store", store)
+        return store
+
+    @pytest.fixture
+    def db_store(self, db_engine):
+        """Fixture for a database store on the test database"""
+        return DatabaseIdempotencyStore(
+            async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False),
+            wait_timeout=0.2,
+            poll_interval=0.01,
+        )
+
+    def test_retry_replays_first_response(self, api_client, memory_store, ticket_payload):
+        """Test that a retried create returns the stored response instead of a second ticket"""
+        headers = {"Idempotency-Key": "create-1"}
+
+        first = api_client.post("/api/tickets", json=ticket_payload, headers=headers)
+        second = api_client.post("/api/tickets", json=ticket_payload, headers=headers)
+
+        assert first.status_code == second.status_code == 200
+        assert second.json() == first.json()
+        assert second.headers["idempotent-replayed"] == "true"
+        assert "idempotent-replayed" not in first.headers
+        assert api_client.get("/api/tickets").json()["total"] == 1
+
+    def test_key_reused_with_different_body(self, api_client, memory_store, ticket_payload):
+        """Test that reusing a key for a different request is rejected"""
+        headers = {"Idempotency-Key": "create-1"}
+        api_client.post("/api/tickets", json=ticket_payload, headers=headers)
+
+        response = api_client.post("/api/tickets", json={**ticket_payload, "name": "Other"}, headers=headers)
+
+        assert response.status_code == 422
+        assert api_client.get("/api/tickets").json()["total"] == 1
+
+    def test_requests_without_key_are_untouched(self, api_client, memory_store, ticket_payload):
+        """Test that requests without the header create a ticket each time"""
+        api_client.post("/api/tickets", json=ticket_payload)
+        api_client.post("/api/tickets", json=ticket_payload)
+
+        assert api_client.get("/api/tickets").json()["total"] == 2
+        assert not memory_store._completed and not memory_store._in_flight
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_waits_for_first(self):
+        """Test that a duplicate arriving mid-request gets the first request's response"""
+        store = InMemoryIdempotencyStore()
+        response = StoredResponse(201, [("content-type", "application/json")], b"{}")
+
+        assert await store.acquire("k", "f") is None
+        waiter = asyncio.create_task(store.acquire("k", "f"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await store.complete("k", response)
+        assert await waiter == response
+
+    @pytest.mark.asyncio
+    async def test_released_key_can_be_retried(self):
+        """Test that a duplicate waiting on a failed request takes the key over"""
+        store = InMemoryIdempotencyStore()
+
+        assert await store.acquire("k", "f") is None
+        waiter = asyncio.create_task(store.acquire("k", "f"))
+        await asyncio.sleep(0)
+        await store.release("k")
+
+        assert await waiter is None
+
+    @pytest.mark.asyncio
+    async def test_expired_keys_purged_behind_stuck_request(self):
+        """Test that a key still in flight does not keep expired keys from being purged"""
+        store = InMemoryIdempotencyStore(ttl=0)
+        response = StoredResponse(201, [], b"{}")
+
+        assert await store.acquire("stuck", "f") is None
+        for key in ("a", "b"):
+            assert await store.acquire(key, "f") is None
+            await store.complete(key, response)
+        assert await store.acquire("c", "f") is None
+
+        assert list(store._completed) == []
+        assert set(store._in_flight) == {"stuck", "c"}
+
+    @pytest.mark.asyncio
+    async def test_database_store(self, db_store):
+        """Test replay, mismatch, in-flight timeout and expiry with the database store"""
+        response = StoredResponse(200, [("content-type", "application/json")], b'{"id": "1"}')
+
+        assert await db_store.acquire("k", "f") is None
+        with pytest.raises(IdempotencyInFlightError):
+            await db_store.acquire("k", "f")
+
+        await db_store.complete("k", response)
+        assert await db_store.acquire("k", "f") == response
+        with pytest.raises(IdempotencyKeyMismatchError):
+            await db_store.acquire("k", "other")
+
+        db_store.ttl = 0
+        assert await db_store.acquire("other-key", "f") is None
+        await db_store.complete("other-key", response)
+        assert await db_store.acquire("other-key", "f") is None  # expired: runs again
+        assert await db_store.purge_expired() == 1
@@ -0,0 +1,39 @@
+import asyncio
+import logging
+import time
+
+import pytest
+from prometheus_client import REGISTRY
+
+from ticket_assistant.core.loop_monitor import LoopMonitor
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+def blocking_groq_call() -> None:
+    """Stands in for a synchronous client call made straight from a handler"""
+    time.sleep(0.3)
+
+
+class TestLoopMonitor:
+    @pytest.mark.asyncio
+    async def test_blocking_call_logged_with_stack_and_counted(self, caplog):
+        """Test that a sync call stalling the loop is logged with its stack and exported as lag"""
+        monitor = LoopMonitor(interval=0.01, block_threshold_ms=100)
+        lag_before = _sample("event_loop_lag_seconds_count")
+        blocks_before = _sample("event_loop_blocks_total")
+
+        with caplog.at_level(logging.WARNING, logger="ticket_assistant.core.loop_monitor"):
+            monitor.start()
+            await asyncio.sleep(0.05)
+            blocking_groq_call()
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        stacks = [record.getMessage() for record in caplog.records if "loop thread is at" in record.getMessage()]
+        assert len(stacks) == 1
+        assert "in blocking_groq_call" in stacks[0]
+        assert _sample("event_loop_blocks_total") == blocks_before + 1
+        assert _sample("event_loop_lag_seconds_count") > lag_before + 2
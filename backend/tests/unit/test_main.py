@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock
 from unittest.mock import MagicMock
 
@@ -162,6 +163,50 @@ class TestMainAPI:
         data = response.json()
         assert "Groq classifier not initialized" in data["detail"]
 
+    def test_classify_batch_streams_ndjson(self, client):
+        """Test batch classification streams one line per request and dedupes repeats"""
+        calls = []
+
+        async def mock_classify_error(error_description, error_message=None, context=None, fallback_on_error=True):
+            calls.append(error_description)
+            # Only a caller that opted out of the fallback sees the API error
+            if error_description == "boom" and not fallback_on_error:
+                raise RuntimeError("upstream failed")
+            return ClassificationResponse(
+                department=Department.BACKEND,
+                severity=ErrorSeverity.LOW,
+                confidence=0.9,
+                reasoning=f"Classified {error_description}",
+                suggested_actions=[],
+            )
+
+        mock_classifier = MagicMock(spec=GroqClassifier)
+        mock_classifier.classify_error = mock_classify_error
+        classification.groq_classifier = mock_classifier
+
+        batch = [
+            {"error_description": "disk full"},
+            {"error_description": "boom"},
+            {"error_description": "disk full"},
+        ]
+        response = client.post("/api/classification/batch", json=batch)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+        assert sorted(lines) == [0, 1, 2]
+        assert lines[0]["result"]["reasoning"] == "Classified disk full"
+        assert lines[2]["result"] == lines[0]["result"]
+        assert "upstream failed" in lines[1]["error"]
+        assert sorted(calls) == ["boom", "disk full"]
+
+    def test_classify_batch_too_large(self, client, monkeypatch):
+        """Test that oversized classification batches are rejected"""
+        monkeypatch.setattr(classification, "BATCH_MAX_ITEMS", 1)
+
+        response = client.post("/api/classification/batch", json=[{"error_description": "a"}] * 2)
+        assert response.status_code == 413
+
     def test_classify_and_send_report(self, client, sample_report_data):
         """Test the combined classify and send report endpoint"""
         # Create a real classification response object
@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+from sqlalchemy import text
+
+from ticket_assistant.core.metrics import instrument_engine
+from ticket_assistant.core.metrics import statement_type
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetrics:
+    def test_requests_labelled_by_route_template(self, api_client):
+        """Test that request latency and status are recorded under the route template"""
+        labels = {"method": "GET", "route": "/api/tickets/{ticket_id}"}
+        before = _sample("http_request_duration_seconds_count", labels)
+        not_found_before = _sample("http_requests_total", {**labels, "status": "404"})
+
+        api_client.get("/api/tickets/does-not-exist")
+        api_client.get("/api/tickets/also-missing")
+
+        assert _sample("http_request_duration_seconds_count", labels) == before + 2
+        assert _sample("http_requests_total", {**labels, "status": "404"}) == not_found_before + 2
+
+        response = api_client.get("/metrics")
+        assert response.status_code == 200
+        assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/api/tickets/{ticket_id}"}' in (
+            response.text
+        )
+
+    def test_sql_statements_timed_by_type(self):
+        """Test that engine events time each statement under its statement type"""
+        assert statement_type("\n  select 1") == "SELECT"
+        assert statement_type("CREATE TABLE t (id INTEGER)") == "OTHER"
+
+        engine = create_engine("sqlite://")
+        instrument_engine(engine)
+        before = _sample("db_query_duration_seconds_count", {"statement": "SELECT"})
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        assert _sample("db_query_duration_seconds_count", {"statement": "SELECT"}) == before + 1
+
+    @pytest.mark.asyncio
+    async def test_groq_latency_and_tokens(self):
+        """Test that a Groq call records its latency and token usage"""
+        from ticket_assistant.services.groq_classifier import GroqClassifier
+
+        with patch("ticket_assistant.services.groq_classifier.Groq") as mock_groq:
+            completion = MagicMock()
+            completion.choices = [MagicMock(message=MagicMock(content="not json"))]
+            completion.usage.prompt_tokens = 120
+            completion.usage.completion_tokens = 30
+            mock_groq.return_value.chat.completions.create.return_value = completion
+            calls_before = _sample("groq_request_duration_seconds_count", {"outcome": "success"})
+            prompt_before = _sample("groq_tokens_total", {"kind": "prompt"})
+
+            await GroqClassifier(api_key="test-key").classify_error(error_description="Login fails")
+
+        assert _sample("groq_request_duration_seconds_count", {"outcome": "success"}) == calls_before + 1
+        assert _sample("groq_tokens_total", {"kind": "prompt"}) == prompt_before + 120
@@ -0,0 +1,118 @@
+import json
+
+import httpx
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from ticket_assistant.core.models import ReportRequest
+from ticket_assistant.database.models import OutboxMessage
+from ticket_assistant.database.repositories.outbox_repository import OutboxRepository
+from ticket_assistant.services.database_services import DatabaseTicketService
+from ticket_assistant.services.outbox_dispatcher import OutboxDispatcher
+from ticket_assistant.services.report_service import ReportService
+
+
+class TestOutbox:
+    @pytest.fixture
+    def session_factory(self, db_engine):
+        """Fixture for a session factory on the test database"""
+        return async_sessionmaker(db_engine, class_=AsyncSession, expire_on_commit=False)
+
+    @pytest.fixture
+    def report(self):
+        """Fixture for a sample report"""
+        return ReportRequest(name="Checkout fails", keywords=["checkout"], description="Payment step returns 502")
+
+    def _dispatcher(self, session_factory, handler, **kwargs):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        service = ReportService(api_endpoint="https://tickets.example.com/api", client=client)
+        return OutboxDispatcher(session_factory, service, base_backoff=0.0, **kwargs)
+
+    async def _messages(self, session_factory):
+        async with session_factory() as session:
+            return (await session.execute(select(OutboxMessage))).scalars().all()
+
+    @pytest.mark.asyncio
+    async def test_ticket_and_outbox_written_together(self, session_factory, report):
+        """Test that a forwarded ticket is queued and delivered with its idempotency key"""
+        received = []
+
+        def handler(request):
+            received.append(request)
+            return httpx.Response(201)
+
+        async with session_factory() as session:
+            ticket = await DatabaseTicketService(session).create_ticket_from_report(report, forward=True)
+
+        [message] = await self._messages(session_factory)
+        assert message.ticket_id == ticket.id
+        assert message.status == "pending"
+
+        dispatcher = self._dispatcher(session_factory, handler)
+        assert await dispatcher.dispatch_once() == 1
+        assert await dispatcher.dispatch_once() == 0
+
+        assert received[0].headers["idempotency-key"] == ticket.id
+        assert json.loads(received[0].content)["name"] == "Checkout fails"
+        [message] = await self._messages(session_factory)
+        assert message.status == "delivered"
+        assert message.delivered_at is not None
+
+    @pytest.mark.asyncio
+    async def test_retries_then_dead_letters(self, session_factory):
+        """Test that server errors are retried until the attempt budget is spent"""
+        async with session_factory() as session:
+            OutboxRepository(session).add({"name": "x"}, idempotency_key="key-1")
+            await session.commit()
+
+        dispatcher = self._dispatcher(session_factory, lambda request: httpx.Response(503), max_attempts=3)
+        for _ in range(3):
+            assert await dispatcher.dispatch_once() == 1
+
+        [message] = await self._messages(session_factory)
+        assert message.status == "dead"
+        assert message.attempts == 3
+        assert "503" in message.last_error
+
+        async with session_factory() as session:
+            assert await OutboxRepository(session).requeue_dead() == 1
+        [message] = await self._messages(session_factory)
+        assert (message.status, message.attempts) == ("pending", 0)
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_dead_lettered_immediately(self, session_factory):
+        """Test that a rejected payload is not retried"""
+        async with session_factory() as session:
+            OutboxRepository(session).add({"name": "x"}, idempotency_key="key-1")
+            await session.commit()
+
+        dispatcher = self._dispatcher(session_factory, lambda request: httpx.Response(422))
+        await dispatcher.dispatch_once()
+
+        [message] = await self._messages(session_factory)
+        assert (message.status, message.attempts) == ("dead", 1)
+
+    @pytest.mark.asyncio
+    async def test_backoff_grows_and_is_capped(self, session_factory):
+        """Test exponential backoff with jitter stays within its bounds"""
+        dispatcher = OutboxDispatcher(session_factory, ReportService(), base_backoff=2.0, max_backoff=10.0)
+
+        assert 1.0 <= dispatcher.backoff(1) <= 2.0
+        assert 4.0 <= dispatcher.backoff(3) <= 8.0
+        assert 5.0 <= dispatcher.backoff(10) <= 10.0
+
+    def test_legacy_report_is_queued(self, api_client, monkeypatch):
+        """Test that the legacy endpoint queues instead of calling the API inline when enabled"""
+        from ticket_assistant.api import reports
+        from ticket_assistant.services import outbox_dispatcher
+
+        monkeypatch.setattr(outbox_dispatcher, "OUTBOX_ENABLED", True)
+        monkeypatch.setattr(reports, "report_service", ReportService())
+
+        response = api_client.post("/api/reports/legacy", json={"name": "n", "keywords": [], "description": "d"})
+
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert response.json()["message"] == "Report queued for delivery"
@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+import pytest
+
+from ticket_assistant.api import admin
+from ticket_assistant.core import profiling
+
+
+def _busy_handler(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def blocking_handler() -> None:
+    """Stands in for an async handler that calls something blocking"""
+    for _ in range(3):
+        _busy_handler(0.05)
+        await asyncio.sleep(0)
+
+
+class TestProfiling:
+    @pytest.fixture
+    def admin_token(self, monkeypatch):
+        """Fixture enabling the admin endpoints with a known token"""
+        monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+        return {"Authorization": "Bearer s3cret"}
+
+    def test_admin_endpoints_require_token(self, api_client, monkeypatch):
+        """Test that admin endpoints are hidden without ADMIN_TOKEN and reject a wrong token"""
+        assert api_client.get("/api/admin/loop", params={"seconds": 0.05}).status_code == 404
+
+        monkeypatch.setattr(admin, "ADMIN_TOKEN", "s3cret")
+        response = api_client.get("/api/admin/loop", headers={"Authorization": "Bearer wrong"})
+        assert response.status_code == 401
+        assert response.headers["www-authenticate"] == "Bearer"
+
+    def test_profile_returns_speedscope_and_collapsed(self, api_client, admin_token):
+        """Test that a profile comes back as a speedscope file or as collapsed stacks"""
+        response = api_client.get("/api/admin/profile", params={"seconds": 0.2}, headers=admin_token)
+        assert response.status_code == 200
+        document = response.json()
+        assert document["$schema"] == profiling.SPEEDSCOPE_SCHEMA
+        profile = document["profiles"][0]
+        assert profile["type"] == "sampled"
+        assert len(profile["samples"]) == len(profile["weights"]) > 0
+        assert all(index < len(document["shared"]["frames"]) for stack in profile["samples"] for index in stack)
+
+        response = api_client.get(
+            "/api/admin/profile", params={"seconds": 0.1, "format": "collapsed"}, headers=admin_token
+        )
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text.splitlines()[0].rsplit(" ", 1)[1].isdigit()
+
+        too_long = {"seconds": admin.MAX_PROFILE_SECONDS + 1}
+        assert api_client.get("/api/admin/profile", params=too_long, headers=admin_token).status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_loop_report_names_blocking_coroutine(self):
+        """Test that a coroutine blocking the loop shows up as lag and as the busiest coroutine"""
+        task = asyncio.create_task(blocking_handler())
+        report = await profiling.loop_report(0.3, interval=0.002)
+        await task
+
+        assert report["lag_ms"]["max"] >= 30
+        assert report["coroutines"][0]["coroutine"].startswith("blocking_handler (test_profiling.py:")
@@ -0,0 +1,84 @@
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine
+from sqlalchemy import text
+
+from ticket_assistant.database import query_diagnostics
+
+
+class TestQueryDiagnostics:
+    def test_slow_query_logged_with_route_and_plan(self, api_client, monkeypatch):
+        """Test that a statement over the threshold is recorded with its route and EXPLAIN plan, parameters redacted"""
+        monkeypatch.setattr(query_diagnostics, "SLOW_QUERY_THRESHOLD_MS", 0)
+        query_diagnostics.slow_queries.clear()
+
+        api_client.get("/api/tickets/missing-ticket")
+
+        entry = next(e for e in query_diagnostics.slow_queries if "FROM tickets" in e["statement"])
+        assert entry["route"] == "GET /api/tickets/{ticket_id}"
+        assert entry["parameters"] == query_diagnostics.REDACTED
+        assert "tickets" in entry["plan"]
+
+    def test_slow_query_parameters_logged_in_development(self, api_client, monkeypatch):
+        """Test that slow query parameters are only recorded in development mode"""
+        monkeypatch.setattr(query_diagnostics, "SLOW_QUERY_THRESHOLD_MS", 0)
+        monkeypatch.setattr(query_diagnostics, "QUERY_DIAGNOSTICS", "development")
+        query_diagnostics.slow_queries.clear()
+
+        api_client.get("/api/tickets/missing-ticket")
+
+        entry = next(e for e in query_diagnostics.slow_queries if "FROM tickets" in e["statement"])
+        assert "missing-ticket" in entry["parameters"]
+
+    def test_failed_postgresql_explain_rolled_back_to_savepoint(self):
+        """Test that a failed EXPLAIN on PostgreSQL is undone by a savepoint so the transaction stays usable"""
+        conn = MagicMock()
+        conn.dialect.name = "postgresql"
+        cursor = conn.connection.cursor.return_value
+
+        def execute(sql, *args):
+            if sql.startswith("EXPLAIN"):
+                raise RuntimeError("boom")
+
+        cursor.execute.side_effect = execute
+
+        plan = query_diagnostics._explain(conn, "SELECT 1", ())
+
+        assert plan == "EXPLAIN failed: boom"
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        assert executed == [
+            "SAVEPOINT query_diagnostics_explain",
+            "EXPLAIN SELECT 1",
+            "ROLLBACK TO SAVEPOINT query_diagnostics_explain",
+            "RELEASE SAVEPOINT query_diagnostics_explain",
+        ]
+        cursor.close.assert_called_once()
+
+    def test_dashboard_fan_out_flagged_in_development(self, api_client, monkeypatch):
+        """Test that the dashboard's one-query-per-statistic fan-out is flagged in development mode"""
+        monkeypatch.setattr(query_diagnostics, "QUERY_DIAGNOSTICS", "development")
+        query_diagnostics.findings.clear()
+
+        api_client.get("/api/dashboard/stats")
+
+        (finding,) = [f for f in query_diagnostics.findings if f["kind"] == "fan_out"]
+        assert finding["route"] == "GET /api/dashboard/stats"
+        assert finding["count"] > query_diagnostics.QUERY_FANOUT_THRESHOLD
+
+    def test_repeated_statement_shape_flagged_as_n_plus_one(self, monkeypatch):
+        """Test that the same statement run per row with different values counts as one shape"""
+        monkeypatch.setattr(query_diagnostics, "QUERY_DIAGNOSTICS", "development")
+        assert query_diagnostics.normalize_statement("SELECT * FROM t WHERE id IN (?, ?,\n ?)") == (
+            "SELECT * FROM t WHERE id IN (?)"
+        )
+
+        engine = create_engine("sqlite://")
+        query_diagnostics.instrument_engine(engine)
+        with query_diagnostics.track_request("GET", {"path": "/api/tickets"}) as request, engine.connect() as conn:
+            for ticket_id in range(query_diagnostics.N_PLUS_ONE_THRESHOLD + 1):
+                conn.execute(text(f"SELECT {ticket_id}"))
+
+        problems = query_diagnostics.check_request(request)
+        assert problems[0]["kind"] == "n_plus_one"
+        assert problems[0]["count"] == query_diagnostics.N_PLUS_ONE_THRESHOLD + 1
+        assert problems[0]["route"] == "GET /api/tickets"
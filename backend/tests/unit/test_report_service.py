@@ -154,6 +154,97 @@ class TestReportService:
         service2 = ReportService()
         assert service2.api_endpoint == "https://api.example.com/tickets"
 
+    @pytest.mark.asyncio
+    async def test_send_report_reuses_shared_client(self, sample_report):
+        """Test that a shared client is reused across reports and left open"""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(201, json={"ok": True})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            report_service = ReportService(api_endpoint="https://test-api.example.com/tickets", client=client)
+
+            first = await report_service.send_report(sample_report)
+            second = await report_service.send_report(sample_report)
+
+            assert first.success is True
+            assert second.success is True
+            assert first.ticket_id != second.ticket_id
+            assert len(requests) == 2
+            assert not client.is_closed
+
+    def test_create_http_client_settings(self, monkeypatch):
+        """Test that pool limits and per-phase timeouts come from the environment"""
+        from ticket_assistant.services.http_client import create_http_client
+
+        monkeypatch.setenv("TICKET_API_CONNECT_TIMEOUT", "2")
+        monkeypatch.setenv("TICKET_API_READ_TIMEOUT", "15")
+        monkeypatch.setenv("TICKET_API_HTTP2", "false")
+
+        client = create_http_client()
+
+        assert client.timeout.connect == 2.0
+        assert client.timeout.read == 15.0
+        assert client.timeout.write == 10.0
+        assert client.timeout.pool == 5.0
+
+    @pytest.mark.asyncio
+    async def test_send_report_coalesces_into_batches(self, sample_report):
+        """Test that concurrent reports share batch requests and get their own results"""
+        import asyncio
+        import json
+
+        batches = []
+
+        def handler(request):
+            items = json.loads(request.content)
+            batches.append(items)
+            # Reject the second item of every batch
+            return httpx.Response(200, json=[{"status": 422 if i == 1 else 201} for i in range(len(items))])
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            report_service = ReportService(
+                api_endpoint="https://test-api.example.com/tickets",
+                client=client,
+                batch_endpoint="https://test-api.example.com/tickets/batch",
+                batch_max_items=4,
+                batch_max_wait=0.01,
+            )
+            results = await asyncio.gather(*(report_service.send_report(sample_report) for _ in range(10)))
+
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert all("idempotency_key" in item for batch in batches for item in batch)
+        assert sum(result.success for result in results) == 7
+        assert [result.success for result in results[:4]] == [True, False, True, True]
+
+    @pytest.mark.asyncio
+    async def test_deliver_many_falls_back_without_batch_endpoint(self):
+        """Test that an unsupported batch endpoint falls back to single posts for good"""
+        paths = []
+
+        def handler(request):
+            paths.append(request.url.path)
+            if request.url.path.endswith("/batch"):
+                return httpx.Response(404)
+            return httpx.Response(201)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            report_service = ReportService(
+                api_endpoint="https://test-api.example.com/tickets",
+                client=client,
+                batch_endpoint="https://test-api.example.com/tickets/batch",
+            )
+            items = [({"name": str(i)}, f"key-{i}") for i in range(3)]
+
+            first = await report_service.deliver_many(items)
+            second = await report_service.deliver_many(items)
+
+        assert [result.status_code for result in first + second] == [201] * 6
+        assert paths.count("/tickets/batch") == 1
+        assert paths.count("/tickets") == 6
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,61 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy import select
+
+from ticket_assistant.database import scale_seed
+from ticket_assistant.database.models import Classification
+from ticket_assistant.database.models import KeywordCount
+from ticket_assistant.database.models import Ticket
+from ticket_assistant.database.models import TicketKeyword
+from ticket_assistant.database.search import search_tickets
+
+
+async def _schema_objects(engine) -> list[str]:
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            "SELECT name FROM sqlite_master WHERE type IN ('index', 'trigger') AND sql IS NOT NULL ORDER BY name"
+        )
+        return list(result.scalars())
+
+
+class TestScaleSeed:
+    def test_same_seed_generates_same_batch(self):
+        """Test that a batch depends only on the seed and its first serial"""
+        now = datetime(2025, 6, 1)
+        first = scale_seed.generate_batch(101, 50, now, seed=7)
+        assert first == scale_seed.generate_batch(101, 50, now, seed=7)
+        assert first != scale_seed.generate_batch(151, 50, now, seed=7)
+        assert [row[1].rsplit("#", 1)[1] for row in first.tickets] == [str(n) for n in range(101, 151)]
+        assert all(row[0] == str(UUID(row[0], version=4)) for row in first.tickets)
+
+    async def test_bulk_load_restores_triggers_and_derived_data(self, db_engine, db_session, monkeypatch):
+        """Test that a load restores indexes and triggers and rebuilds keyword counts and the search index"""
+
+        async def init_db():
+            pass
+
+        monkeypatch.setattr(scale_seed, "engine", db_engine)
+        monkeypatch.setattr(scale_seed, "init_db", init_db)
+        schema = await _schema_objects(db_engine)
+
+        report = await scale_seed.seed_scale_data(300, batch_size=100, seed=3, workers=1)
+
+        assert await _schema_objects(db_engine) == schema
+        assert (await db_session.execute(select(func.count(Ticket.id)))).scalar() == report["tickets"] == 300
+        assert (await db_session.execute(select(func.count(Classification.id)))).scalar() == report["classifications"]
+        counted = dict((await db_session.execute(select(KeywordCount.keyword, KeywordCount.ticket_count))).all())
+        grouped = await db_session.execute(select(TicketKeyword.keyword, func.count()).group_by(TicketKeyword.keyword))
+        assert counted == dict(grouped.all())
+        hits, _ = await search_tickets(db_session, "timeout", limit=5)
+        assert len(hits) == 5
+
+        # Restored triggers keep the aggregates up to date again
+        ticket = (await db_session.execute(select(Ticket).limit(1))).scalar_one()
+        db_session.add(TicketKeyword(keyword="brand new keyword", ticket_id=ticket.id))
+        await db_session.commit()
+        count = await db_session.execute(
+            select(KeywordCount.ticket_count).where(KeywordCount.keyword == "brand new keyword")
+        )
+        assert count.scalar() == 1
@@ -0,0 +1,272 @@
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import inspect
+from sqlalchemy import select
+
+from ticket_assistant.database import search
+from ticket_assistant.database.connection import _create_missing_indexes
+from ticket_assistant.database.models import Classification
+from ticket_assistant.database.models import KeywordCount
+from ticket_assistant.database.models import Ticket
+from ticket_assistant.database.repositories.ticket_repository import TicketRepository
+from ticket_assistant.database.repositories.ticket_repository import build_ticket_filters
+from ticket_assistant.database.search import ensure_search_index
+from ticket_assistant.database.search import search_tickets
+from ticket_assistant.database.versions import ensure_version_columns
+
+
+class TestTicketRepository:
+    @pytest.fixture
+    async def ticket(self, db_session):
+        """Fixture that persists a single open ticket"""
+        repo = TicketRepository(db_session)
+        return await repo.create_ticket(
+            {
+                "name": "Checkout fails",
+                "description": "Payment step returns 502",
+                "department": "backend",
+                "severity": "high",
+                "status": "open",
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_update_ticket_partial(self, db_session, ticket):
+        """Test that only the provided columns are changed"""
+        repo = TicketRepository(db_session)
+
+        row = await repo.update_ticket(ticket.id, {"assignee": "jane.smith@company.com"})
+
+        assert row is not None
+        assert row.assignee == "jane.smith@company.com"
+        assert row.name == "Checkout fails"
+        assert row.status == "open"
+        assert row.resolved_at is None
+        assert row.updated_at >= ticket.updated_at
+
+    @pytest.mark.asyncio
+    async def test_update_ticket_missing(self, db_session):
+        """Test that updating an unknown ticket returns None"""
+        repo = TicketRepository(db_session)
+
+        assert await repo.update_ticket("does-not-exist", {"status": "closed"}) is None
+
+    @pytest.mark.asyncio
+    async def test_update_ticket_status_sets_resolved_at_once(self, db_session, ticket):
+        """Test that resolved_at is stamped on first resolution and then preserved"""
+        repo = TicketRepository(db_session)
+
+        resolved = await repo.update_ticket_status(ticket.id, "resolved")
+        assert resolved.status == "resolved"
+        assert resolved.resolved_at is not None
+
+        closed = await repo.update_ticket_status(ticket.id, "closed")
+        assert closed.status == "closed"
+        assert closed.resolved_at == resolved.resolved_at
+
+    @pytest.mark.asyncio
+    async def test_update_ticket_persists(self, db_session, ticket):
+        """Test that the update is committed to the database"""
+        repo = TicketRepository(db_session)
+
+        await repo.update_ticket(ticket.id, {"severity": "critical"})
+        db_session.expunge_all()
+
+        stored = await db_session.get(Ticket, ticket.id)
+        assert stored.severity == "critical"
+
+    @pytest.mark.asyncio
+    async def test_delete_ticket_cascades_to_classifications(self, db_session, ticket):
+        """Test that deleting a ticket removes its classifications in the database"""
+        db_session.add(Classification(ticket_id=ticket.id, confidence=0.9, reasoning="r", suggested_actions="[]"))
+        await db_session.commit()
+        repo = TicketRepository(db_session)
+
+        assert await repo.delete_ticket(ticket.id) is True
+        assert await repo.delete_ticket(ticket.id) is False
+
+        remaining = await db_session.execute(select(func.count(Classification.id)))
+        assert remaining.scalar() == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_tickets_with_filters(self, db_session):
+        """Test that bulk delete only removes matching tickets"""
+        repo = TicketRepository(db_session)
+        for department in ["backend", "backend", "frontend"]:
+            await repo.create_ticket(
+                {"name": "t", "description": "d", "department": department, "severity": "low", "status": "open"}
+            )
+
+        deleted = await repo.delete_tickets(build_ticket_filters(department="backend"))
+
+        assert deleted == 2
+        assert await repo.get_total_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_and_purge_use_indexes(self, db_engine):
+        """Test that cascaded deletes and the purge's batch selection are index lookups, not table scans"""
+        async with db_engine.connect() as conn:
+            cascade = await conn.exec_driver_sql("EXPLAIN QUERY PLAN DELETE FROM classifications WHERE ticket_id = 'x'")
+            purge = await conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT id FROM tickets WHERE status IN ('resolved', 'closed') "
+                "AND coalesce(resolved_at, updated_at) < '2025-01-01' LIMIT 500"
+            )
+            assert "INDEX ix_classifications_ticket_id" in cascade.all()[0][-1]
+            assert "INDEX ix_tickets_status_resolved" in purge.all()[0][-1]
+
+    @pytest.mark.asyncio
+    async def test_missing_indexes_created_on_existing_tables(self, db_engine):
+        """Test that startup adds indexes missing from existing tables and tolerates ones already there"""
+        async with db_engine.begin() as conn:
+            await conn.exec_driver_sql("DROP INDEX ix_classifications_ticket_id")
+            await conn.run_sync(_create_missing_indexes)
+            await conn.run_sync(_create_missing_indexes)
+            names = await conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")
+            assert {"ix_classifications_ticket_id", "ix_tickets_status_resolved"} <= set(names.scalars())
+
+    @pytest.mark.asyncio
+    async def test_purge_resolved_tickets_in_batches(self, db_session):
+        """Test that the purge deletes only old finished tickets across several batches"""
+        repo = TicketRepository(db_session)
+        old = datetime.utcnow() - timedelta(days=120)
+        for status in ["closed"] * 5 + ["resolved", "open"]:
+            await repo.create_ticket(
+                {
+                    "name": "t",
+                    "description": "d",
+                    "department": "backend",
+                    "severity": "low",
+                    "status": status,
+                    "resolved_at": old if status != "open" else None,
+                    "created_at": old,
+                    "updated_at": old,
+                }
+            )
+        await repo.create_ticket(
+            {"name": "recent", "description": "d", "department": "backend", "severity": "low", "status": "closed"}
+        )
+
+        deleted = await repo.purge_resolved_tickets(datetime.utcnow() - timedelta(days=90), batch_size=2)
+
+        assert deleted == 6
+        statuses = (await db_session.execute(select(Ticket.status).order_by(Ticket.status))).scalars().all()
+        assert statuses == ["closed", "open"]
+
+    @pytest.mark.asyncio
+    async def test_keyword_filters_and_counts(self, db_session):
+        """Test keyword AND/OR filtering and the trigger-maintained keyword counts"""
+        repo = TicketRepository(db_session)
+        base = {"description": "d", "department": "backend", "severity": "low", "status": "open"}
+        first = await repo.create_ticket({**base, "name": "a"}, keywords=["Database", "timeout", "database "])
+        second = await repo.create_ticket({**base, "name": "b"}, keywords=["database", "login"])
+
+        assert await repo.get_ticket_keywords(first.id) == ["database", "timeout"]
+
+        async def matching(keywords, match_all=True):
+            conditions = build_ticket_filters(keywords=keywords, match_all_keywords=match_all)
+            result = await db_session.execute(select(Ticket.name).where(*conditions).order_by(Ticket.name))
+            return result.scalars().all()
+
+        assert await matching(["database"]) == ["a", "b"]
+        assert await matching(["database", "timeout"]) == ["a"]
+        assert await matching(["timeout", "login"]) == []
+        assert await matching(["timeout", "login"], match_all=False) == ["a", "b"]
+
+        assert await repo.get_top_keywords() == {"database": 2, "login": 1, "timeout": 1}
+
+        await repo.delete_ticket(second.id)
+        assert await repo.get_top_keywords() == {"database": 1, "timeout": 1}
+        assert await db_session.scalar(select(func.count()).select_from(KeywordCount)) == 2
+
+
+class TestEnsureVersionColumns:
+    def test_upgrades_database_with_change_counters(self):
+        """Test that classifications gain a backfilled updated_at and the counter table and triggers are dropped"""
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE tickets (id VARCHAR PRIMARY KEY, updated_at DATETIME NOT NULL)")
+            conn.exec_driver_sql(
+                "CREATE TABLE classifications (id VARCHAR PRIMARY KEY, ticket_id VARCHAR, created_at DATETIME)"
+            )
+            conn.exec_driver_sql("CREATE TABLE table_versions (table_name VARCHAR PRIMARY KEY, version INTEGER)")
+            conn.exec_driver_sql(
+                "CREATE TRIGGER tickets_version_insert AFTER INSERT ON tickets BEGIN "
+                "UPDATE table_versions SET version = version + 1 WHERE table_name = 'tickets'; END"
+            )
+            conn.exec_driver_sql("INSERT INTO classifications VALUES ('c', 't', '2025-01-01 00:00:00.000000')")
+
+            ensure_version_columns(conn)
+            ensure_version_columns(conn)
+
+            schema = inspect(conn)
+            assert not schema.has_table("table_versions")
+            assert {index["name"] for index in schema.get_indexes("classifications")} == {
+                "ix_classifications_updated_at"
+            }
+            assert {index["name"] for index in schema.get_indexes("tickets")} == {"ix_tickets_updated_at"}
+            triggers = conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").all()
+            assert triggers == []
+            updated_at = conn.exec_driver_sql("SELECT updated_at FROM classifications").scalar()
+            assert updated_at == "2025-01-01 00:00:00.000000"
+
+
+class TestSearchIndex:
+    @pytest.fixture
+    async def printers(self, db_session):
+        """Fixture that persists two printer tickets and a scanner ticket"""
+        repo = TicketRepository(db_session)
+        for name in ["Printer jam", "Scanner offline", "Printer toner"]:
+            await repo.create_ticket(
+                {"name": name, "description": "d", "department": "backend", "severity": "low", "status": "open"}
+            )
+
+    @pytest.mark.asyncio
+    async def test_search_survives_renumbered_rowids(self, db_engine, db_session, printers):
+        """Test that the index follows search_rowid, so rowids renumbered by VACUUM do not matter"""
+        # What a renumbering VACUUM looks like to the tickets table
+        async with db_engine.begin() as conn:
+            await conn.exec_driver_sql("UPDATE tickets SET rowid = rowid + 10")
+
+        hits, _ = await search_tickets(db_session, "print")
+        assert sorted(hit["name"] for hit in hits) == ["Printer jam", "Printer toner"]
+
+    @pytest.mark.asyncio
+    async def test_ensure_search_index_rekeys_rowid_index(self, db_engine, db_session, printers):
+        """Test that an index keyed on the implicit rowid is replaced by one keyed on search_rowid"""
+        async with db_engine.begin() as conn:
+            for statement in [
+                "DROP TRIGGER tickets_fts_insert",
+                "DROP TRIGGER tickets_fts_delete",
+                "DROP TRIGGER tickets_fts_update",
+                "DROP TABLE tickets_fts",
+                "DROP INDEX ix_tickets_search_rowid",
+                "ALTER TABLE tickets DROP COLUMN search_rowid",
+                "CREATE VIRTUAL TABLE tickets_fts USING fts5(name, description, error_message, "
+                "content='tickets', content_rowid='rowid', tokenize='porter unicode61')",
+                "INSERT INTO tickets_fts(tickets_fts) VALUES ('rebuild')",
+            ]:
+                await conn.exec_driver_sql(statement)
+
+            await conn.run_sync(ensure_search_index)
+            await conn.exec_driver_sql("UPDATE tickets SET rowid = rowid + 10")
+
+        hits, _ = await search_tickets(db_session, "scanner")
+        assert [hit["name"] for hit in hits] == ["Scanner offline"]
+
+    @pytest.mark.asyncio
+    async def test_only_most_recent_candidates_ranked(self, db_session, printers, monkeypatch):
+        """Test that ranking is bounded to the SEARCH_CANDIDATES newest matches"""
+        monkeypatch.setattr(search, "SEARCH_CANDIDATES", 1)
+
+        hits, cursor = await search_tickets(db_session, "print")
+
+        assert [hit["name"] for hit in hits] == ["Printer toner"]
+        assert cursor is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
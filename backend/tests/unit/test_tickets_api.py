@@ -0,0 +1,300 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+
+class TestTicketsAPI:
+    @pytest.fixture
+    def ticket_payload(self):
+        """Fixture for a valid ticket create payload"""
+        return {
+            "name": "Checkout fails",
+            "description": "Payment step returns 502",
+            "department": "backend",
+            "severity": "high",
+        }
+
+    def test_bulk_create_json_array(self, api_client, ticket_payload):
+        """Test bulk creation from a JSON array with one invalid item"""
+        items = [ticket_payload, {**ticket_payload, "severity": "apocalyptic"}, ticket_payload]
+
+        response = api_client.post("/api/tickets/bulk", json=items)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["created"] == 2
+        assert data["failed"] == 1
+        assert [r["status"] for r in data["results"]] == ["created", "invalid", "created"]
+        assert data["results"][1]["errors"][0]["loc"] == ["severity"]
+
+        listing = api_client.get("/api/tickets").json()
+        assert listing["total"] == 2
+        assert {t["id"] for t in listing["tickets"]} == {data["results"][0]["id"], data["results"][2]["id"]}
+
+    def test_bulk_create_ndjson(self, api_client, ticket_payload):
+        """Test bulk creation from an NDJSON body"""
+        body = "\n".join(json.dumps({**ticket_payload, "name": f"t{i}"}) for i in range(3)) + "\n"
+
+        response = api_client.post("/api/tickets/bulk", content=body, headers={"Content-Type": "application/x-ndjson"})
+
+        assert response.status_code == 200
+        assert response.json()["created"] == 3
+
+    def test_bulk_create_rejects_non_array(self, api_client, ticket_payload):
+        """Test that a single object is rejected as a bulk body"""
+        response = api_client.post("/api/tickets/bulk", json=ticket_payload)
+        assert response.status_code == 400
+
+    def test_bulk_create_limit(self, api_client, ticket_payload, monkeypatch):
+        """Test that oversized batches are rejected"""
+        from ticket_assistant.api import tickets
+
+        monkeypatch.setattr(tickets, "BULK_MAX_ITEMS", 2)
+
+        response = api_client.post("/api/tickets/bulk", json=[ticket_payload] * 3)
+        assert response.status_code == 413
+
+    def test_bulk_create_ndjson_limit(self, api_client, ticket_payload, monkeypatch):
+        """Test that NDJSON over the item limit is rejected while it streams in"""
+        from ticket_assistant.api import tickets
+
+        monkeypatch.setattr(tickets, "BULK_MAX_ITEMS", 2)
+        lines = (json.dumps(ticket_payload).encode() + b"\n" for _ in range(3))
+
+        response = api_client.post("/api/tickets/bulk", content=lines, headers={"Content-Type": "application/x-ndjson"})
+        assert response.status_code == 413
+        assert "2 tickets" in response.json()["detail"]
+
+    def test_bulk_create_byte_limit(self, api_client, ticket_payload, monkeypatch):
+        """Test that bodies over the byte limit are rejected, with or without a Content-Length"""
+        from ticket_assistant.api import tickets
+
+        monkeypatch.setattr(tickets, "BULK_MAX_BYTES", 100)
+        body = json.dumps([ticket_payload] * 2).encode()
+
+        response = api_client.post("/api/tickets/bulk", content=body, headers={"Content-Type": "application/json"})
+        assert response.status_code == 413
+        chunked = api_client.post(
+            "/api/tickets/bulk", content=iter([body[:60], body[60:]]), headers={"Content-Type": "application/json"}
+        )
+        assert chunked.status_code == 413
+        assert api_client.get("/api/tickets").json()["total"] == 0
+
+    def test_export_ndjson_with_filter(self, api_client, ticket_payload):
+        """Test NDJSON export streams every matching ticket"""
+        items = [ticket_payload] * 3 + [{**ticket_payload, "department": "frontend"}]
+        api_client.post("/api/tickets/bulk", json=items)
+
+        response = api_client.get("/api/tickets/export", params={"department": "backend"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == 3
+        assert {row["department"] for row in rows} == {"backend"}
+        assert rows[0]["resolved_at"] is None
+        assert "created_at" in rows[0]
+
+    def test_export_csv(self, api_client, ticket_payload):
+        """Test CSV export has a header row and one row per ticket"""
+        api_client.post("/api/tickets/bulk", json=[ticket_payload] * 2)
+
+        response = api_client.get("/api/tickets/export", params={"format": "csv"})
+
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 2
+        assert rows[0]["name"] == "Checkout fails"
+        assert rows[0]["assignee"] == ""
+
+    def test_export_csv_empty(self, api_client):
+        """Test CSV export of an empty result is just the header"""
+        response = api_client.get("/api/tickets/export", params={"format": "csv"})
+
+        assert response.text.splitlines()[0].startswith("id,name,")
+        assert len(response.text.splitlines()) == 1
+
+    def test_export_gzip(self, api_client, ticket_payload):
+        """Test export is gzip-compressed when the client accepts it"""
+        api_client.post("/api/tickets/bulk", json=[ticket_payload] * 5)
+
+        with api_client.stream("GET", "/api/tickets/export", headers={"Accept-Encoding": "gzip"}) as response:
+            assert response.headers["content-encoding"] == "gzip"
+            body = gzip.decompress(b"".join(response.iter_raw()))
+
+        assert len(body.decode().splitlines()) == 5
+
+    def test_search_ranks_and_highlights(self, api_client, ticket_payload):
+        """Test that name matches outrank description matches and terms are highlighted"""
+        login = {**ticket_payload, "name": "Login page", "description": "Timeout on login"}
+        api_client.post("/api/tickets", json=login)
+        api_client.post("/api/tickets", json={**ticket_payload, "name": "Timeout in checkout"})
+        api_client.post("/api/tickets", json={**ticket_payload, "name": "Unrelated"})
+
+        response = api_client.get("/api/tickets/search", params={"q": "timeout"})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [hit["name"] for hit in data["results"]] == ["Timeout in checkout", "Login page"]
+        assert data["results"][0]["snippets"]["name"] == "<mark>Timeout</mark> in checkout"
+        assert "<mark>Timeout</mark>" in data["results"][1]["snippets"]["description"]
+        assert data["next_cursor"] is None
+
+    def test_search_keyset_pagination(self, api_client, ticket_payload):
+        """Test that following next_cursor walks every hit exactly once"""
+        api_client.post("/api/tickets/bulk", json=[{**ticket_payload, "name": f"Payment issue {i}"} for i in range(5)])
+
+        seen, cursor = [], None
+        while True:
+            params = {"q": "paym", "limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = api_client.get("/api/tickets/search", params=params).json()
+            seen.extend(hit["id"] for hit in data["results"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert len(seen) == len(set(seen)) == 5
+
+    def test_search_follows_updates_and_deletes(self, api_client, ticket_payload):
+        """Test that the index is kept in sync with ticket writes"""
+        ticket = api_client.post("/api/tickets", json={**ticket_payload, "name": "Printer jam"}).json()
+
+        api_client.put(f"/api/tickets/{ticket['id']}", json={"name": "Scanner jam"})
+        assert api_client.get("/api/tickets/search", params={"q": "printer"}).json()["results"] == []
+        assert len(api_client.get("/api/tickets/search", params={"q": "scanner"}).json()["results"]) == 1
+
+        api_client.delete(f"/api/tickets/{ticket['id']}")
+        assert api_client.get("/api/tickets/search", params={"q": "scanner"}).json()["results"] == []
+
+    def test_search_invalid_cursor(self, api_client):
+        """Test that a malformed cursor is rejected"""
+        response = api_client.get("/api/tickets/search", params={"q": "x", "cursor": "not-a-cursor"})
+        assert response.status_code == 400
+
+    def test_keywords_round_trip_and_filter(self, api_client, ticket_payload):
+        """Test that keywords are stored on create and usable as an AND/OR filter"""
+        created = api_client.post("/api/tickets", json={**ticket_payload, "keywords": ["Payment", "gateway"]}).json()
+        api_client.post("/api/tickets/bulk", json=[{**ticket_payload, "name": "Other", "keywords": ["payment"]}])
+
+        assert created["keywords"] == ["payment", "gateway"]
+        assert api_client.get(f"/api/tickets/{created['id']}").json()["keywords"] == ["gateway", "payment"]
+
+        both = api_client.get("/api/tickets", params={"keyword": "payment,gateway"}).json()
+        assert [t["id"] for t in both["tickets"]] == [created["id"]]
+        either = api_client.get("/api/tickets", params={"keyword": "payment,gateway", "keyword_mode": "any"}).json()
+        assert either["total"] == 2
+        assert sorted(t["keywords"] for t in either["tickets"]) == [["gateway", "payment"], ["payment"]]
+
+        assert api_client.get("/api/dashboard/keywords").json() == {"payment": 2, "gateway": 1}
+
+    def test_list_serialized_from_rows_matches_models(self, api_client, ticket_payload):
+        """Test that list pages serialized from rows match the response models of single reads"""
+        from ticket_assistant.api.classifications import ClassificationListResponse
+        from ticket_assistant.api.tickets import TicketListResponse
+
+        created = api_client.post("/api/tickets", json={**ticket_payload, "keywords": ["payment"]}).json()
+        classification = api_client.post(
+            "/api/classifications",
+            json={"ticket_id": created["id"], "confidence": 0.8, "reasoning": "r", "suggested_actions": ["a"]},
+        ).json()
+
+        listing = api_client.get("/api/tickets").json()
+        TicketListResponse.model_validate(listing)
+        assert listing["tickets"] == [api_client.get(f"/api/tickets/{created['id']}").json()]
+
+        classifications = api_client.get("/api/classifications").json()
+        ClassificationListResponse.model_validate(classifications)
+        assert classifications["classifications"] == [classification]
+        assert api_client.get(f"/api/classifications/by-ticket/{created['id']}").json() == [classification]
+
+    def test_list_sparse_fieldset(self, api_client, ticket_payload):
+        """Test that fields= returns only the requested fields plus the id"""
+        created = api_client.post("/api/tickets", json={**ticket_payload, "keywords": ["payment"]}).json()
+
+        listing = api_client.get("/api/tickets", params={"fields": "name,severity"}).json()
+        assert listing["tickets"] == [{"id": created["id"], "name": "Checkout fails", "severity": "high"}]
+        assert listing["total"] == 1
+
+        with_keywords = api_client.get("/api/tickets", params={"fields": "status,keywords"}).json()
+        assert with_keywords["tickets"] == [{"id": created["id"], "status": "open", "keywords": ["payment"]}]
+
+        response = api_client.get("/api/tickets", params={"fields": "name,secret"})
+        assert response.status_code == 400
+        assert "secret" in response.json()["detail"]
+
+    def test_conditional_get_lists(self, api_client, ticket_payload):
+        """Test that list and dashboard reads answer 304 until a write changes the table"""
+        created = api_client.post("/api/tickets", json=ticket_payload).json()
+
+        for url in ("/api/tickets?per_page=5", "/api/classifications", "/api/dashboard/stats"):
+            first = api_client.get(url)
+            etag = first.headers["etag"]
+            assert etag.startswith('W/"')
+            assert first.headers["cache-control"] == "private, no-cache"
+
+            repeat = api_client.get(url, headers={"If-None-Match": etag})
+            assert repeat.status_code == 304
+            assert repeat.content == b""
+            assert repeat.headers["etag"] == etag
+
+        # A different query is a different representation
+        etag = api_client.get("/api/tickets?per_page=5").headers["etag"]
+        assert api_client.get("/api/tickets?per_page=6", headers={"If-None-Match": etag}).status_code == 200
+
+        api_client.put(f"/api/tickets/{created['id']}", json={"status": "in_progress"})
+        changed = api_client.get("/api/tickets?per_page=5", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["tickets"][0]["status"] == "in_progress"
+
+        etag = api_client.get("/api/classifications").headers["etag"]
+        api_client.post(
+            "/api/classifications",
+            json={"ticket_id": created["id"], "confidence": 0.8, "reasoning": "r", "suggested_actions": ["a"]},
+        )
+        assert api_client.get("/api/classifications", headers={"If-None-Match": etag}).json()["total"] == 1
+
+    def test_conditional_get_single_ticket(self, api_client, ticket_payload):
+        """Test that a single ticket's ETag follows updated_at and a deleted ticket is a 404"""
+        created = api_client.post("/api/tickets", json=ticket_payload).json()
+        url = f"/api/tickets/{created['id']}"
+        etag = api_client.get(url).headers["etag"]
+
+        assert api_client.get(url, headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+        assert api_client.get(url, headers={"If-None-Match": "*"}).status_code == 304
+
+        api_client.patch(f"{url}/status", params={"status": "resolved"})
+        changed = api_client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+
+        api_client.delete(url)
+        assert api_client.get(url, headers={"If-None-Match": "*"}).status_code == 404
+
+    def test_conditional_get_single_classification(self, api_client, ticket_payload):
+        """Test that a classification's ETag follows its own updated_at and deletes change the list ETag"""
+        ticket = api_client.post("/api/tickets", json=ticket_payload).json()
+        body = {"ticket_id": ticket["id"], "confidence": 0.8, "reasoning": "r", "suggested_actions": ["a"]}
+        first = api_client.post("/api/classifications", json=body).json()
+        second = api_client.post("/api/classifications", json=body).json()
+        url = f"/api/classifications/{first['id']}"
+        etag = api_client.get(url).headers["etag"]
+
+        # Writes to other classifications leave this one's validator alone
+        api_client.put(f"/api/classifications/{second['id']}", json={"reasoning": "other"})
+        assert api_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+        api_client.put(url, json={"reasoning": "updated"})
+        changed = api_client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["reasoning"] == "updated"
+
+        list_etag = api_client.get("/api/classifications").headers["etag"]
+        api_client.delete(f"/api/classifications/{second['id']}")
+        assert api_client.get("/api/classifications", headers={"If-None-Match": list_etag}).json()["total"] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,76 @@
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+from opentelemetry.trace import SpanKind
+
+from ticket_assistant.core import tracing
+
+
+class TestTracing:
+    @pytest.fixture
+    def spans(self):
+        """Fixture installing the in-memory exporter and clearing it around each test"""
+        tracing.setup_tracing(enabled=True, exporter="memory")
+        tracing.memory_exporter.clear()
+        yield tracing.memory_exporter
+        tracing.memory_exporter.clear()
+
+    @pytest.fixture
+    def ticket_payload(self):
+        """Fixture for a valid ticket create payload"""
+        return {
+            "name": "Checkout fails",
+            "description": "Payment step returns 502",
+            "department": "backend",
+            "severity": "high",
+        }
+
+    def test_request_spans_nest(self, api_client, spans, ticket_payload):
+        """Test that repository, commit and refresh spans nest under the route's server span"""
+        api_client.post("/api/tickets", json=ticket_payload)
+
+        finished = spans.get_finished_spans()
+        by_id = {span.context.span_id: span for span in finished}
+        by_name = {span.name: span for span in finished}
+        (server,) = [span for span in finished if span.kind == SpanKind.SERVER]
+        create = by_name["TicketRepository.create_ticket"]
+
+        def ancestors(span):
+            while span.parent is not None:
+                span = by_id[span.parent.span_id]
+                yield span
+
+        assert server.name == "POST /api/tickets"
+        assert server.attributes["http.route"] == "/api/tickets"
+        assert server.attributes["http.response.status_code"] == 200
+        assert server in ancestors(create)
+        assert by_name["commit"].parent.span_id == create.context.span_id
+        assert by_name["refresh"].parent.span_id == create.context.span_id
+
+    def test_incoming_traceparent_continues_trace(self, api_client, spans):
+        """Test that a W3C traceparent header makes the request part of the caller's trace"""
+        trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+        api_client.get("/api/tickets/missing", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+
+        (server,) = [span for span in spans.get_finished_spans() if span.kind == SpanKind.SERVER]
+        assert server.name == "GET /api/tickets/{ticket_id}"
+        assert format(server.context.trace_id, "032x") == trace_id
+
+    @pytest.mark.asyncio
+    async def test_classifier_span_and_file_summary(self, spans, tmp_path):
+        """Test that classify_error gets a span and a JSON-lines trace file can be summarized"""
+        from ticket_assistant.services.groq_classifier import GroqClassifier
+
+        with patch("ticket_assistant.services.groq_classifier.Groq") as mock_groq:
+            mock_groq.return_value.chat.completions.create.return_value = MagicMock()
+            classifier = GroqClassifier(api_key="test-key")
+            await classifier.classify_error(error_description="Login fails")
+            await classifier.classify_error(error_description="Login fails again")
+
+        path = tmp_path / "traces.jsonl"
+        tracing.JsonLinesSpanExporter(str(path)).export(spans.get_finished_spans())
+        summary = {row["name"]: row for row in tracing.summarize_spans(str(path))}
+
+        assert summary["GroqClassifier.classify_error"]["count"] == 2
+        assert summary["GroqClassifier.classify_error"]["p50_ms"] >= 0
@@ -2,6 +2,7 @@
 """Example script demonstrating the Ticket Assistant API usage."""
 
 import asyncio
+import json
 from typing import Any
 
 import httpx
@@ -36,6 +37,24 @@ class TicketAssistantClient:
             response.raise_for_status()
             return response.json()
 
+    async def classify_batch(
+        self, classification_batch: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Classify many errors in one request; results stream back as NDJSON."""
+        results = []
+        async with httpx.AsyncClient() as client:
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/api/classification/batch",
+                json=classification_batch,
+                timeout=None,
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if line:
+                        results.append(json.loads(line))
+        return sorted(results, key=lambda item: item["index"])
+
     async def classify_and_send(self, report_data: dict[str, Any]) -> dict[str, Any]:
         """Classify and send a report in one operation."""
         async with httpx.AsyncClient() as client: